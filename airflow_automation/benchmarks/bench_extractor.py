@@ -0,0 +1,337 @@
+"""
+Offline benchmark of NaukriJobExtractor and Pipeline against the fixture
+stand-in server (benchmarks/stand_in_server.py); naukri.com is never hit.
+
+Scenarios:
+    parse   _extract_job_details over rendered detail pages, per parser backend (no I/O)
+    replay  Pipeline + NaukriJobExtractor re-parsing a page cache recorded from the
+            stand-in server: pagination via parse_listing, no browser needed
+    live    Pipeline + NaukriJobExtractor against the stand-in server: listing pages
+            in Chrome, detail pages with each --fetch-mode (http, selenium, auto)
+
+Every case runs in a fresh process, so peak RSS is per case. Reported per
+case: jobs/sec, p50/p95 latency per detail page (and per listing page),
+peak RSS of the process and of its children (Chrome), and time per stage
+from utils.metrics. Record counts and key fields are checked too, so a
+parser or pagination regression fails the run.
+
+Run from airflow_automation/:
+    python -m benchmarks.bench_extractor --scenario parse replay --report bench.json
+    python -m benchmarks.bench_extractor --scenario live --fetch-mode http selenium
+    python -m benchmarks.bench_extractor --baseline bench.json   # exit 1 on regression
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+ROLES = ["data-scientist"]
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q * 100) - 1]
+
+
+def _peak_rss_mb(who: int) -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _invalid_records(records: List[dict]) -> int:
+    """Records whose key fields were not parsed from the fixture."""
+    invalid = 0
+    for record in records:
+        if ("NA" in (record.get("Title"), record.get("Company"), record.get("Location"),
+                     record.get("Last_Apply_Date"))
+                or len(record.get("Star_Skills") or []) != 2 or len(record.get("Normal_Skills") or []) != 4
+                or not record.get("Role Category")):
+            invalid += 1
+    return invalid
+
+
+def _instrument(extractor, detail_latencies: List[float], listing_latencies: List[float]) -> None:
+    """Time every detail page and every listing page step of an extractor instance."""
+    scrape_job = extractor._scrape_job
+    iter_listing_pages = extractor._iter_listing_pages
+
+    def timed_scrape_job(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return scrape_job(*args, **kwargs)
+        finally:
+            detail_latencies.append(time.perf_counter() - started)
+
+    def timed_iter_listing_pages(*args, **kwargs):
+        pages = iter_listing_pages(*args, **kwargs)
+        while True:
+            started = time.perf_counter()
+            try:
+                step = next(pages)
+            except StopIteration as stop:
+                # Whether the walk reached its end
+                return stop.value
+            listing_latencies.append(time.perf_counter() - started)
+            yield step
+
+    extractor._scrape_job = timed_scrape_job
+    extractor._iter_listing_pages = timed_iter_listing_pages
+
+
+def _result(case: Dict, records: List[dict], expected: int, elapsed: float,
+            detail_latencies: List[float], listing_latencies: List[float]) -> Dict:
+    from etl_pipeline.utils.metrics import REGISTRY
+
+    def ms(value):
+        return round(value * 1000, 2) if value is not None else None
+
+    return {
+        **case,
+        "jobs": len(records),
+        "expected_jobs": expected,
+        "invalid_records": _invalid_records(records),
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": round(len(records) / elapsed, 2) if elapsed > 0 else None,
+        "page_p50_ms": ms(_percentile(detail_latencies, 0.50)),
+        "page_p95_ms": ms(_percentile(detail_latencies, 0.95)),
+        "listing_p50_ms": ms(_percentile(listing_latencies, 0.50)),
+        "listing_p95_ms": ms(_percentile(listing_latencies, 0.95)),
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "children_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+        "stage_seconds": {name: round(total, 3) for name, (count, total) in REGISTRY.totals().items()},
+    }
+
+
+class _CollectingHandler:
+    """Storage handler keeping the records so they can be validated."""
+
+    def __init__(self):
+        self.records = []
+
+    def save(self, clean_dataset: List[Dict], filename: str) -> None:
+        self.records.extend(clean_dataset)
+
+    def save_batch(self, batch, filename: str) -> None:
+        self.records.extend(batch.to_records())
+
+    def get_name(self) -> str:
+        return "CollectingHandler"
+
+
+def _fast_rate_limiter():
+    from etl_pipeline.utils.rate_limiter import RateLimiter
+    # The stand-in server needs no politeness delay
+    return RateLimiter(requests_per_second=1_000_000, burst=1_000_000)
+
+
+def _run_pipeline(extractor, workdir: str, handler: _CollectingHandler) -> float:
+    from etl_pipeline.data_collection.pipeline import Pipeline
+    from etl_pipeline.data_collection.storage.CSVStoragehandler import CSVStorageHandler
+
+    pipeline = Pipeline([extractor], [CSVStorageHandler(logger=logging.getLogger("storage")), handler], ROLES,
+                        {"CSVStorageHandler": os.path.join(workdir, "jobs.csv"), "CollectingHandler": ""},
+                        logger=logging.getLogger("pipeline"))
+    started = time.perf_counter()
+    pipeline.run()
+    return time.perf_counter() - started
+
+
+def bench_parse(case: Dict, args) -> Dict:
+    """_extract_job_details over every detail page of the stand-in site."""
+    from etl_pipeline.data_collection.extractors.NaukriExtractor import NaukriJobExtractor
+    from benchmarks.stand_in_server import StandInServer
+
+    server = StandInServer(args.pages, args.jobs_per_page, detail_padding_kb=args.detail_padding_kb)
+    pages = [(url, server.render_detail(role, page_no, index))
+             for role in ROLES
+             for page_no in range(1, args.pages + 1)
+             for index, url in enumerate(server.job_urls(role, page_no), 1)]
+    server.stop()
+
+    extractor = NaukriJobExtractor(max_pages=1, fetch_mode="http", parser=case["parser"])
+    records, latencies = [], []
+    try:
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            for url, html in pages:
+                page_started = time.perf_counter()
+                record = extractor._extract_job_details(html, url)
+                latencies.append(time.perf_counter() - page_started)
+                if record:
+                    records.append(record)
+        elapsed = time.perf_counter() - started
+    finally:
+        extractor.close()
+    return _result(case, records, len(pages) * args.repeat, elapsed, latencies, [])
+
+
+def bench_replay(case: Dict, args) -> Dict:
+    """Record the stand-in site into a page cache, then run the pipeline in replay mode."""
+    import requests
+    from etl_pipeline.data_collection.extractors.NaukriExtractor import NaukriJobExtractor
+    from etl_pipeline.data_collection.state.page_cache import PageCache
+    from benchmarks.stand_in_server import StandInServer
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            StandInServer(args.pages, args.jobs_per_page, detail_padding_kb=args.detail_padding_kb) as server:
+        cache_path = os.path.join(workdir, "pages.sqlite")
+        recorder = PageCache(cache_path)
+        with requests.Session() as http:
+            for role in ROLES:
+                for page_no, listing_url in enumerate(server.listing_urls(role), 1):
+                    recorder.put(listing_url, http.get(listing_url).text, kind="listing")
+                    for job_url in server.job_urls(role, page_no):
+                        recorder.put(job_url, http.get(job_url).text, kind="detail")
+        recorder.close()
+
+        page_cache = PageCache(cache_path, replay=True)
+        extractor = NaukriJobExtractor(max_pages=args.pages, parser=case["parser"], page_cache=page_cache,
+                                       rate_limiter=_fast_rate_limiter(), base_url=server.base_url)
+        detail_latencies, listing_latencies, handler = [], [], _CollectingHandler()
+        _instrument(extractor, detail_latencies, listing_latencies)
+        try:
+            elapsed = _run_pipeline(extractor, workdir, handler)
+        finally:
+            page_cache.close()
+    return _result(case, handler.records, args.pages * args.jobs_per_page * len(ROLES), elapsed,
+                   detail_latencies, listing_latencies)
+
+
+def bench_live(case: Dict, args) -> Dict:
+    """Full extractor against the stand-in server (needs Chrome for the listing pages)."""
+    from etl_pipeline.data_collection.extractors.NaukriExtractor import NaukriJobExtractor
+    from benchmarks.stand_in_server import StandInServer
+
+    with tempfile.TemporaryDirectory() as workdir, \
+            StandInServer(args.pages, args.jobs_per_page, latency_ms=args.latency_ms,
+                          detail_padding_kb=args.detail_padding_kb) as server:
+        extractor = NaukriJobExtractor(max_pages=args.pages, workers=args.workers, fetch_mode=case["fetch_mode"],
+                                       parser=case["parser"], rate_limiter=_fast_rate_limiter(),
+                                       base_url=server.base_url)
+        detail_latencies, listing_latencies, handler = [], [], _CollectingHandler()
+        _instrument(extractor, detail_latencies, listing_latencies)
+        elapsed = _run_pipeline(extractor, workdir, handler)
+    return _result(case, handler.records, args.pages * args.jobs_per_page * len(ROLES), elapsed,
+                   detail_latencies, listing_latencies)
+
+
+SCENARIOS = {"parse": bench_parse, "replay": bench_replay, "live": bench_live}
+
+
+def _run_case(case: Dict, args) -> Dict:
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR,
+                        format="%(asctime)s | %(name)s | %(levelname)s | %(message)s")
+    try:
+        return SCENARIOS[case["scenario"]](case, args)
+    except Exception as e:
+        return {**case, "error": f"{type(e).__name__}: {e}"}
+
+
+def _cases(args) -> List[Dict]:
+    cases = []
+    for scenario in args.scenario:
+        for parser in args.parser:
+            if scenario == "live":
+                cases.extend({"scenario": scenario, "parser": parser, "fetch_mode": mode} for mode in args.fetch_mode)
+            else:
+                cases.append({"scenario": scenario, "parser": parser, "fetch_mode": None})
+    return cases
+
+
+def _case_key(result: Dict) -> tuple:
+    return result["scenario"], result["parser"], result.get("fetch_mode")
+
+
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Regressions against a baseline report (and correctness failures)."""
+    problems = []
+    previous = {_case_key(result): result for result in baseline}
+    for result in results:
+        name = "/".join(str(part) for part in _case_key(result) if part)
+        if "error" in result:
+            problems.append(f"{name}: {result['error']}")
+            continue
+        if result["jobs"] != result["expected_jobs"] or result["invalid_records"]:
+            problems.append(f"{name}: {result['jobs']}/{result['expected_jobs']} jobs, "
+                            f"{result['invalid_records']} with missing fields")
+        before = previous.get(_case_key(result))
+        if not before or "error" in before:
+            continue
+        if before.get("jobs_per_sec") and (result["jobs_per_sec"] or 0) < before["jobs_per_sec"] * (1 - tolerance):
+            problems.append(f"{name}: jobs/sec {result['jobs_per_sec']} vs {before['jobs_per_sec']}")
+        if before.get("page_p95_ms") and (result["page_p95_ms"] or 0) > before["page_p95_ms"] * (1 + tolerance):
+            problems.append(f"{name}: p95 {result['page_p95_ms']}ms vs {before['page_p95_ms']}ms")
+    return problems
+
+
+def _print_results(results: List[Dict]) -> None:
+    header = f"{'case':<32}{'jobs':>7}{'jobs/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'rss MB':>9}{'chrome MB':>11}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        name = "/".join(str(part) for part in _case_key(result) if part)
+        if "error" in result:
+            print(f"{name:<32}ERROR {result['error']}")
+            continue
+        columns = [(result[key] if result[key] is not None else "-", width) for key, width in
+                   (("jobs", 7), ("jobs_per_sec", 10), ("page_p50_ms", 9), ("page_p95_ms", 9),
+                    ("peak_rss_mb", 9), ("children_peak_rss_mb", 11))]
+        print(f"{name:<32}" + "".join(f"{value:>{width}}" for value, width in columns))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline extractor/pipeline benchmark")
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), default=["parse", "replay"])
+    parser.add_argument("--parser", nargs="+", default=["bs4", "lxml", "selectolax"],
+                        help="Parser backends to benchmark")
+    parser.add_argument("--fetch-mode", nargs="+", choices=["http", "selenium", "auto"], default=["http"],
+                        help="Detail page fetchers for the live scenario")
+    parser.add_argument("--pages", type=int, default=5, help="Listing pages per role")
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--detail-padding-kb", type=int, default=200, help="Inline script size of detail pages")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Simulated server latency (live scenario)")
+    parser.add_argument("--workers", type=int, default=1, help="Detail page workers (live scenario)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the fixtures (parse scenario)")
+    parser.add_argument("--report", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Earlier JSON report; exit 1 on regressions beyond --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = []
+    spawn = multiprocessing.get_context("spawn")
+    for case in _cases(args):
+        # A fresh process per case keeps peak RSS per case
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            results.append(executor.submit(_run_case, case, args).result())
+
+    _print_results(results)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+    baseline = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    problems = compare(results, baseline, args.tolerance)
+    for problem in problems:
+        print(f"REGRESSION {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
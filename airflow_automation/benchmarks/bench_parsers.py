@@ -0,0 +1,87 @@
+"""
+Benchmark the detail page parser backends on saved fixture pages.
+
+Usage (from airflow_automation/):
+    python -m benchmarks.bench_parsers --repeat 200
+"""
+
+from pathlib import Path
+from typing import Dict, List
+import argparse
+import statistics
+import time
+
+from etl_pipeline.data_collection.extractors.parsers import PARSER_BACKENDS, get_parser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_fixtures(pattern: str = "detail_page_*.html") -> Dict[str, str]:
+    """Load fixture pages keyed by file name."""
+    return {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob(pattern))}
+
+
+def bench_backend(backend: str, pages: Dict[str, str], repeat: int) -> Dict[str, float]:
+    """Parse every fixture `repeat` times and return timing statistics in milliseconds."""
+    parser = get_parser(backend)
+    timings: List[float] = []
+    for _ in range(repeat):
+        for html in pages.values():
+            start = time.perf_counter()
+            parser.parse(html)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "pages": len(timings),
+        "mean_ms": statistics.mean(timings),
+        "p50_ms": timings[len(timings) // 2],
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+        "pages_per_sec": len(timings) / (sum(timings) / 1000),
+    }
+
+
+def check_parity(pages: Dict[str, str], backends: List[str]) -> List[str]:
+    """Return a list of mismatches between each backend and the bs4 reference."""
+    reference = get_parser("bs4")
+    mismatches = []
+    for name, html in pages.items():
+        expected = reference.parse(html)
+        for backend in backends:
+            if get_parser(backend).parse(html) != expected:
+                mismatches.append(f"{backend} differs from bs4 on {name}")
+    return mismatches
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Parser backend benchmark")
+    arg_parser.add_argument("--repeat", type=int, default=100, help="Parses per fixture page")
+    arg_parser.add_argument("--backends", nargs="+", default=list(PARSER_BACKENDS), help="Backends to compare")
+    args = arg_parser.parse_args()
+
+    pages = load_fixtures()
+    if not pages:
+        raise SystemExit(f"No fixture pages found in {FIXTURES_DIR}")
+
+    available = []
+    for backend in args.backends:
+        try:
+            get_parser(backend)
+            available.append(backend)
+        except ImportError as e:
+            print(f"Skipping {backend}: {e}")
+
+    for mismatch in check_parity(pages, available):
+        print(f"WARNING: {mismatch}")
+
+    print(f"{len(pages)} fixture page(s) x {args.repeat} repeats")
+    print(f"{'backend':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'pages/s':>10}{'speedup':>10}")
+    results = {backend: bench_backend(backend, pages, args.repeat) for backend in available}
+    baseline = results.get("bs4", next(iter(results.values())))["mean_ms"]
+    for backend, stats in results.items():
+        print(f"{backend:<12}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+              f"{stats['pages_per_sec']:>10.0f}{baseline / stats['mean_ms']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Local stand-in for naukri.com serving the HTML fixtures in benchmarks/fixtures.
+
+Search pages (/<role>-jobs, /<role>-jobs-in-<location>, /<role>-jobs-<n>)
+list `jobs_per_page` job cards and a next-page link until `pages` pages;
+detail pages (/job-listings-<role>-<page>-<n>) are rendered from the
+detail fixture with deterministic per-job values and padded with an inline
+script to the size of a real page. Responses can be delayed to simulate
+network latency.
+
+Usage:
+    with StandInServer(pages=5, jobs_per_page=20) as server:
+        extractor = NaukriJobExtractor(..., base_url=server.base_url)
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import os
+import re
+import threading
+import time
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+LISTING_PATH = re.compile(r"^/(?P<role>[a-z0-9-]+?)-jobs(?:-in-(?P<location>[a-z]+))?(?:-(?P<page>\d+))?/?$")
+DETAIL_PATH = re.compile(r"^/job-listings-(?P<role>[a-z0-9-]+)-(?P<page>\d+)-(?P<index>\d+)/?$")
+
+COMPANIES = ["Acme Analytics", "Globex Data", "Initech Labs", "Umbrella AI", "Hooli Cloud", "Stark Systems"]
+LOCATIONS = ["Bengaluru", "Pune", "Hyderabad", "Mumbai", "Delhi / NCR", "Chennai"]
+SKILLS = ["Python", "SQL", "Machine Learning", "Deep Learning", "Spark", "AWS", "Statistics",
+          "Pandas", "TensorFlow", "Airflow", "Tableau", "NLP"]
+MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September",
+          "October", "November", "December"]
+
+
+def _load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class StandInServer:
+    """Threaded HTTP server on 127.0.0.1 running in a background thread."""
+
+    def __init__(self, pages: int = 5, jobs_per_page: int = 20, latency_ms: float = 0,
+                 detail_padding_kb: int = 200, port: int = 0):
+        """
+        Args:
+            pages: Search result pages per role/location
+            jobs_per_page: Job links on every search page
+            latency_ms: Delay added to every response
+            detail_padding_kb: Inline script added to detail pages (real pages are a few hundred KB)
+            port: Port to bind (0 = any free port)
+        """
+        self.pages = pages
+        self.jobs_per_page = jobs_per_page
+        self.latency = latency_ms / 1000
+        self.listing_template = _load_fixture("listing.html")
+        self.detail_template = _load_fixture("detail.html")
+        self.padding = "var __pad = '" + "x" * (detail_padding_kb * 1024) + "';"
+        self.requests_served = 0
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def listing_urls(self, role: str):
+        """URLs of all search pages of a role, in pagination order."""
+        yield f"{self.base_url}/{role}-jobs"
+        for page_no in range(2, self.pages + 1):
+            yield f"{self.base_url}/{role}-jobs-{page_no}"
+
+    def job_urls(self, role: str, page_no: int):
+        for index in range(1, self.jobs_per_page + 1):
+            yield f"{self.base_url}/job-listings-{role}-{page_no}-{index}"
+
+    @staticmethod
+    def _job_values(page_no: int, index: int) -> dict:
+        """Deterministic values of a job, shared by its card and its detail page."""
+        seed = page_no * 1000 + index
+        return {
+            "seed": seed,
+            "company": COMPANIES[seed % len(COMPANIES)],
+            "location": LOCATIONS[seed % len(LOCATIONS)],
+            "skills": [SKILLS[(seed + offset) % len(SKILLS)] for offset in range(6)],
+            "experience": f"{seed % 5 + 1}-{seed % 5 + 6} Yrs",
+            "salary": f"{seed % 10 + 5}-{seed % 10 + 15} Lacs P.A.",
+            "posted": f"{seed % 30 + 1} days ago",
+        }
+
+    def _render_card(self, role: str, page_no: int, index: int) -> str:
+        job = self._job_values(page_no, index)
+        tags = "".join(f'<li class="tag-li">{skill}</li>' for skill in job["skills"])
+        return (
+            f'      <div class="srp-jobtuple-wrapper"><div class="cust-job-tuple">'
+            f'<a class="title" href="/job-listings-{role}-{page_no}-{index}">'
+            f'{role.replace("-", " ").title()} {index}</a>'
+            f'<div class="row2"><a class="comp-name">{job["company"]}</a></div>'
+            f'<div class="row3"><span class="exp-wrap"><span class="expwdth">{job["experience"]}</span></span>'
+            f'<span class="sal-wrap"><span title="{job["salary"]}">{job["salary"]}</span></span>'
+            f'<span class="loc-wrap"><span class="locWdth">{job["location"]}</span></span></div>'
+            f'<div class="row4"><span class="job-desc">Work on {role.replace("-", " ")} problems.</span></div>'
+            f'<div class="row5"><ul class="tags-gt">{tags}</ul></div>'
+            f'<div class="row6"><span class="job-post-day">{job["posted"]}</span></div>'
+            f'</div></div>'
+        )
+
+    def render_listing(self, role: str, page_no: int) -> str:
+        cards = "\n".join(self._render_card(role, page_no, index) for index in range(1, self.jobs_per_page + 1))
+        next_link = ""
+        if page_no < self.pages:
+            next_link = f'      <a class="styles_btn-secondary__2AsIP" href="/{role}-jobs-{page_no + 1}">Next</a>'
+        return self.listing_template.format(role=role, role_title=role.replace("-", " ").title(),
+                                            page_no=page_no, job_cards=cards, next_link=next_link)
+
+    def render_detail(self, role: str, page_no: int, index: int) -> str:
+        job = self._job_values(page_no, index)
+        seed, company, location, skills = job["seed"], job["company"], job["location"], job["skills"]
+        star = '<i class="ni-icon-jd-save"></i>'
+        # The first two skills are starred ("preferred") skills
+        chips = "\n".join(
+            f'        <a class="styles_chip__7YCfG styles_clickable__dUW8S" href="/{skill.lower()}-jobs">'
+            f'{star if position < 2 else ""}<span>{skill}</span></a>'
+            for position, skill in enumerate(skills)
+        )
+        return self.detail_template.format(
+            title=role.replace("-", " ").title(),
+            company=company,
+            company_slug=company.lower().replace(" ", "-"),
+            job_id=f"{seed:012d}",
+            experience=job["experience"],
+            salary=job["salary"],
+            location=location,
+            location_slug=location.split()[0].lower(),
+            posted=job["posted"],
+            openings=seed % 4 + 1,
+            apply_by=f"{seed % 28 + 1} {MONTHS[seed % 12]} 2025",
+            skill_chips=chips,
+            padding=self.padding,
+        )
+
+    def _handle(self, request: BaseHTTPRequestHandler) -> None:
+        with self._lock:
+            self.requests_served += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        path = request.path.split("?", 1)[0]
+        body = None
+        if path == "/robots.txt":
+            body = "User-agent: *\nAllow: /\n"
+        elif (match := DETAIL_PATH.match(path)) is not None:
+            page_no, index = int(match["page"]), int(match["index"])
+            if page_no <= self.pages and index <= self.jobs_per_page:
+                body = self.render_detail(match["role"], page_no, index)
+        elif (match := LISTING_PATH.match(path)) is not None:
+            page_no = int(match["page"] or 1)
+            if page_no <= self.pages:
+                body = self.render_listing(match["role"], page_no)
+
+        payload = (body if body is not None else "Not Found").encode("utf-8")
+        request.send_response(200 if body is not None else 404)
+        request.send_header("Content-Type", "text/html; charset=utf-8" if path != "/robots.txt" else "text/plain")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixtures as a naukri.com stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--jobs-per-page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    with StandInServer(args.pages, args.jobs_per_page, args.latency_ms, port=args.port) as stand_in:
+        print(f"Serving fixtures at {stand_in.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
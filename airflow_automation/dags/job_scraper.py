@@ -3,58 +3,147 @@ from airflow.decorators import task
 from airflow.utils.log.logging_mixin import LoggingMixin
 from datetime import datetime, timedelta
 import os
+import re
 import yaml
 
-import time
-import logging
-import sys
-
 from etl_pipeline.data_collection.pipeline import Pipeline
 from etl_pipeline.data_collection.extractors.NaukriExtractor import NaukriJobExtractor
-from etl_pipeline.data_collection.storage.CSVStoragehandler import CSVStorageHandler
+from etl_pipeline.data_collection.storage.staging import merge_staging_dirs
+from etl_pipeline.data_collection.state.checkpoint import CheckpointStore
+from etl_pipeline.data_collection.main import (initialize_page_cache, initialize_seen_index, initialize_rate_limiter,
+                                               initialize_retry_policy, initialize_robots,
+                                               initialize_enrichment_queue, initialize_dedup_index,
+                                               initialize_handlers, get_jobs_from_config)
 
 
 logger = LoggingMixin().log
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # project root
+CONFIG_PATH = os.path.join(BASE_DIR, "etl_pipeline", "configuration", "config.yml")
+
+
+def load_config() -> dict:
+    with open(CONFIG_PATH, 'r') as file:
+        return yaml.safe_load(file)
+
+
+CFG = load_config()
+DAG_CFG = CFG.get("dag", {})
+STAGING_DIR = DAG_CFG.get("staging_dir", "etl_pipeline/data/staging")
+
+
+def _slug(value: str) -> str:
+    """Filesystem-safe name for a group, role or run id."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_")
+
+
+def _staging_path(run_id: str, unit: str) -> str:
+    return os.path.join(STAGING_DIR, _slug(run_id), f"{_slug(unit)}.csv")
+
+
 @task
-def run_full_pipeline():
-
-    
-    logger.info("Starting the job scraping pipeline")
-
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # project root
-    config_path = os.path.join(base_dir, "etl_pipeline","configuration", "config.yml")
-
-
-    with open(config_path, 'r') as file:
-        cfg = yaml.safe_load(file)
-    
-    logger.info(f"Configuration loaded from {config_path}")
-    job_queue = cfg["job_queue"]
-    filedirectory = cfg["storage"]["filedirectory"]
-    per_page_limit = cfg["pipeline"]["per_page_limit"]
-    max_pages = cfg["pipeline"]["max_pages"]
-    min_delay = cfg["pipeline"]["min_delay"]
-    max_delay = cfg["pipeline"]["max_delay"]
-    role_delay = cfg["pipeline"]["role_delay"]
-
-    logger.info(f"extractors and storage handlers initialization")
-    extractors = [NaukriJobExtractor(max_pages, per_page_limit, min_delay, max_delay, role_delay, logger=logger)]
-    storage_handlers = [CSVStorageHandler(logger=logger)]
-
-    logger.info(f"Starting the pipeline for job queue")
-    for group in job_queue:
-        for job in job_queue[group]:
-            try:
-                logger.info(f"Running pipeline for job: {job}")
-                pipeline = Pipeline(extractors, storage_handlers, job, filedirectory)
-                pipeline.run()
-               
-            except Exception as e:
-                logger.error(f"Pipeline failed for job: {job}", exc_info=True)
-       
-    logger.info("Job scraping pipeline completed")
-    
+def list_work_units():
+    """One unit per job group (or per role with dag.map_by: role)."""
+    cfg = load_config()
+    if cfg.get("dag", {}).get("map_by", "group") == "role":
+        return get_jobs_from_config(cfg)
+    return list(cfg["job_queue"])
+
+
+@task(
+    pool=DAG_CFG.get("pool", "default_pool"),
+    max_active_tis_per_dagrun=DAG_CFG.get("max_active_tasks", 3),
+)
+def scrape_unit(unit: str, **context):
+    """
+    Scrape one group (or role) with the configured storage handlers. CSV
+    rows go to the unit's own staged file (merged by merge_staged_outputs);
+    Parquet and SQLite write to their datasets directly.
+    """
+    cfg = load_config()
+    jobs = [unit] if cfg.get("dag", {}).get("map_by", "group") == "role" else get_jobs_from_config(cfg, unit)
+    pipeline_cfg = cfg["pipeline"]
+    staged_file = _staging_path(context["run_id"], unit)
+
+    logger.info(f"Scraping '{unit}' ({len(jobs)} roles) into {staged_file}")
+    page_cache = initialize_page_cache(cfg, logger)
+    seen_index = initialize_seen_index(cfg, logger)
+    # Each mapped task has its own bucket; together they keep to the configured rate
+    rate_limiter = initialize_rate_limiter(cfg, processes=cfg.get("dag", {}).get("max_active_tasks", 3))
+    robots = initialize_robots(cfg, logger, rate_limiter)
+    enrichment_queue = initialize_enrichment_queue(cfg, logger)
+    # Shared by all mapped tasks, so a job listed under several units is staged once
+    dedup = initialize_dedup_index(cfg, logger)
+    checkpoint = None
+    if cfg.get("checkpoint", {}).get("enabled", False):
+        # One store per unit, so mapped tasks never reset each other's progress
+        checkpoint_dir = os.path.dirname(cfg["checkpoint"].get("path", "etl_pipeline/data/state/checkpoint.sqlite"))
+        checkpoint = CheckpointStore(os.path.join(checkpoint_dir, f"checkpoint_{_slug(unit)}.sqlite"), logger=logger)
+    metrics_path = None
+    if cfg.get("metrics", {}).get("prometheus_file"):
+        # One file per unit; a textfile collector picks up all of them
+        metrics_dir = os.path.dirname(cfg["metrics"]["prometheus_file"])
+        metrics_path = os.path.join(metrics_dir, f"scraper_{_slug(unit)}.prom")
+    # A retried task continues where the killed attempt stopped
+    resume = context["ti"].try_number > 1
+
+    extractors = [NaukriJobExtractor(pipeline_cfg["max_pages"], pipeline_cfg["per_page_limit"],
+                                     driver_recycle_pages=pipeline_cfg.get("driver_recycle_pages"),
+                                     workers=pipeline_cfg.get("workers", 1),
+                                     rate_limiter=rate_limiter,
+                                     retry_policy=initialize_retry_policy(cfg, NaukriJobExtractor.RETRY_EXCEPTIONS),
+                                     fetch_mode=pipeline_cfg.get("fetch_mode", "auto"),
+                                     parser=pipeline_cfg.get("parser", "bs4"),
+                                     parse_workers=pipeline_cfg.get("parse_workers", 0),
+                                     parse_queue_size=pipeline_cfg.get("parse_queue_size"),
+                                     page_cache=page_cache, seen_index=seen_index,
+                                     stop_known_fraction=cfg.get("incremental", {}).get("stop_known_fraction"),
+                                     robots=robots,
+                                     extraction_mode=pipeline_cfg.get("extraction_mode", "detail"),
+                                     enrichment_queue=enrichment_queue,
+                                     logger=logger)]
+    storage_handlers = initialize_handlers(cfg, logger)
+    filedirectory = {**cfg["storage"]["filedirectory"], "CSVStorageHandler": staged_file}
+
+    try:
+        pipeline = Pipeline(extractors, storage_handlers, jobs, filedirectory,
+                            batch_size=pipeline_cfg.get("batch_size", 200),
+                            checkpoint=checkpoint, resume=resume, metrics_path=metrics_path, dedup=dedup,
+                            logger=logger)
+        stats = pipeline.run()
+    finally:
+        if page_cache:
+            page_cache.close()
+        if seen_index is not None:
+            seen_index.close()
+        if checkpoint:
+            checkpoint.close()
+        if robots:
+            robots.close()
+        if enrichment_queue is not None:
+            enrichment_queue.close()
+        if dedup is not None:
+            dedup.close()
+
+    if stats["successful_jobs"] + stats["skipped_jobs"] == 0:
+        raise RuntimeError(f"No role of '{unit}' was scraped successfully")
+    logger.info(f"'{unit}' done: {stats['total_records']} records, {stats['failed_jobs']} failed roles")
+    return {"unit": unit, "records": stats["total_records"], "failed_jobs": stats["failed_jobs"]}
+
+
+@task(trigger_rule="all_done")
+def merge_staged_outputs(**context):
+    """
+    Append the staged CSVs to the main dataset, then remove the staging files.
+
+    The dedup, seen and checkpoint state already counts staged rows as stored,
+    so staging dirs left behind by an earlier run whose merge failed are
+    merged as well (runs never overlap, see max_active_runs).
+    """
+    cfg = load_config()
+    target = cfg["storage"]["filedirectory"]["CSVStorageHandler"]
+    current_dir = os.path.join(STAGING_DIR, _slug(context["run_id"]))
+    return merge_staging_dirs(STAGING_DIR, target, current_dir=current_dir, logger=logger)
 
 
 with DAG(
@@ -62,13 +151,17 @@ with DAG(
     start_date = datetime(2025, 9, 15),
     schedule = "@daily",
     catchup = False,
+    max_active_tasks = DAG_CFG.get("max_active_tasks", 3),
+    # merge_staged_outputs takes over every staging dir it finds
+    max_active_runs = 1,
+    tags = ["scraping"],
     default_args = {
         "owner": "airflow",
-        # "retries": 1,
+        "retries": 2,
         "retry_delay": timedelta(minutes=5),
     }
 ) as dag:
-    
 
-    run_pipeline_task = run_full_pipeline()
 
+    scraped = scrape_unit.expand(unit=list_work_units())
+    scraped >> merge_staged_outputs()
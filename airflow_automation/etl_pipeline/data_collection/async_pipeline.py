@@ -0,0 +1,266 @@
+"""
+Asyncio job scraping pipeline.
+Runs many roles and extractors concurrently on one event loop with
+bounded concurrency, optional per-job timeouts and cooperative cancellation.
+"""
+
+from typing import List, Dict, Optional
+import asyncio
+from contextlib import aclosing
+import logging
+import threading
+from datetime import datetime
+
+from .pipeline import Pipeline
+from .base import AsyncJobExtractor, StorageHandler
+from .records import JobBatch
+from .state.checkpoint import CheckpointStore, JobProgress
+from .state.dedup_index import DedupIndex
+from ..utils.metrics import metric_labels
+
+
+class AsyncPipeline(Pipeline):
+    """
+    Async counterpart of Pipeline. Jobs are processed concurrently (at most
+    `max_concurrency` at a time); within a job all extractors run at once.
+    Storage handlers are synchronous and run in worker threads, one save
+    per handler at a time.
+    """
+    def __init__(self, extractors: List[AsyncJobExtractor], handlers: List[StorageHandler], jobs: List[str],
+                 filedirectory: Dict, max_concurrency: int = 4, job_timeout: Optional[float] = None,
+                 batch_size: int = 200, checkpoint: Optional[CheckpointStore] = None, resume: bool = False,
+                 metrics_path: Optional[str] = None, dedup: Optional[DedupIndex] = None, logger=None):
+        """
+        Initialize the async pipeline.
+
+        Args:
+            extractors: List of AsyncJobExtractor instances
+            handlers: List of StorageHandler instances
+            jobs: List of job titles to scrape
+            filedirectory: Mapping of handler names to file paths
+            max_concurrency: Max jobs processed concurrently
+            job_timeout: Cancel a job after this many seconds (None for no limit)
+            batch_size: Records per flush to the storage handlers
+            checkpoint: Store recording completed roles and listing pages
+            resume: Continue from the checkpoint instead of starting a fresh run
+            metrics_path: Write stage metrics to this Prometheus text file after the run
+            dedup: Index of stored jobs; duplicate and near-duplicate records are dropped before the handlers
+            logger: Optional logger instance
+        """
+        super().__init__(extractors, handlers, jobs, filedirectory, batch_size=batch_size,
+                         checkpoint=checkpoint, resume=resume, metrics_path=metrics_path, dedup=dedup,
+                         logger=logger or logging.getLogger("pipeline"))
+        self.max_concurrency = max(1, max_concurrency)
+        self.job_timeout = job_timeout
+        self._handler_locks = {handler.get_name(): threading.Lock() for handler in handlers}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._main_task: Optional[asyncio.Task] = None
+        self._cancel_requested = False
+
+    def run(self) -> Dict[str, any]:
+        """Execute the pipeline on a fresh event loop (blocking)."""
+        return asyncio.run(self.run_async())
+
+    def run_single_job(self, job: str) -> Dict:
+        """Convenience method to run pipeline for a single job (blocking)."""
+        self.logger.info(f"Running pipeline for single job: '{job}'")
+        return asyncio.run(self._process_single_job(job))
+
+    def cancel(self):
+        """
+        Request cancellation of a running pipeline. Safe to call from any
+        thread (e.g. a signal handler or Airflow's on_kill).
+        """
+        self._cancel_requested = True
+        if self._loop is not None and self._main_task is not None:
+            self._loop.call_soon_threadsafe(self._main_task.cancel)
+
+    async def run_async(self) -> Dict[str, any]:
+        """
+        Execute the scraping pipeline for all jobs concurrently.
+
+        Returns:
+            Dictionary with execution statistics
+        """
+        self._validate_configuration()
+        self._loop = asyncio.get_running_loop()
+        self._main_task = asyncio.current_task()
+
+        start_time = datetime.now()
+        stats = {
+            "total_jobs": len(self.jobs),
+            "successful_jobs": 0,
+            "failed_jobs": 0,
+            "skipped_jobs": 0,
+            "total_records": 0,
+            "duplicates_dropped": 0,
+            "cancelled": False,
+            "job_details": {},
+        }
+
+        self.logger.info("="*60)
+        self.logger.info(f"Async Pipeline Started | Jobs: {len(self.jobs)} | Extractors: {len(self.extractors)} "
+                         f"| Handlers: {len(self.handlers)} | Concurrency: {self.max_concurrency}")
+        self.logger.info("="*60)
+
+        jobs = await asyncio.to_thread(self._start_checkpoint, stats)
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(job: str) -> Dict:
+            async with slots:
+                self.logger.info(f"Processing job: '{job}'")
+                job_stats = await self._process_single_job(job)
+                if job_stats["success"] and self.checkpoint:
+                    await asyncio.to_thread(self.checkpoint.mark_role_done, job)
+                return job_stats
+
+        tasks = {job: asyncio.create_task(bounded(job)) for job in jobs}
+        try:
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        except asyncio.CancelledError:
+            stats["cancelled"] = True
+            self.logger.warning("Pipeline cancelled, stopping outstanding jobs")
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            if not self._cancel_requested:
+                raise
+        finally:
+            await self._close_extractors_async()
+            await asyncio.to_thread(self._close_handlers)
+            self._main_task = None
+
+        for job, task in tasks.items():
+            if task.cancelled() or task.exception() is not None:
+                reason = "cancelled" if task.cancelled() else str(task.exception())
+                stats["job_details"][job] = {"success": False, "records_extracted": 0, "errors": [reason]}
+                stats["failed_jobs"] += 1
+                continue
+
+            job_stats = task.result()
+            stats["job_details"][job] = job_stats
+            if job_stats["success"]:
+                stats["successful_jobs"] += 1
+                stats["total_records"] += job_stats["records_extracted"]
+                stats["duplicates_dropped"] += job_stats["duplicates_dropped"]
+            else:
+                stats["failed_jobs"] += 1
+
+        await asyncio.to_thread(self._finish_checkpoint, stats)
+        elapsed = (datetime.now() - start_time).total_seconds()
+        await asyncio.to_thread(self._export_metrics, stats)
+        self._log_summary(stats, elapsed)
+        return stats
+
+    async def _run_extractor(self, extractor: AsyncJobExtractor, job: str, job_stats: Dict, handlers_used: set) -> int:
+        """Stream one extractor for a job, honouring the per-job timeout."""
+        if self.job_timeout:
+            return await asyncio.wait_for(
+                self._stream_extractor(extractor, job, job_stats, handlers_used), timeout=self.job_timeout)
+        return await self._stream_extractor(extractor, job, job_stats, handlers_used)
+
+    async def _stream_extractor(self, extractor: AsyncJobExtractor, job: str, job_stats: Dict,
+                                handlers_used: set) -> int:
+        """
+        Consume an extractor's records and flush them in batches.
+
+        Returns:
+            Number of records extracted
+        """
+        batch = JobBatch()
+        dedup = self.dedup.session() if self.dedup is not None else None
+        record_count = 0
+
+        def flush(final: bool = False):
+            # Runs in a worker thread while the stream is suspended
+            self._flush_stream(batch, job, job_stats, handlers_used, progress, dedup, final=final)
+
+        # Checkpointed pages (and other reports) are committed only once their records are stored
+        progress = JobProgress(job, extractor.get_name(), self.checkpoint)
+        # The extractor's tasks and worker threads inherit these metric labels
+        with metric_labels(extractor=extractor.get_name(), role=job):
+            try:
+                async with aclosing(extractor.iter_extract(job, progress=progress)) as records:
+                    async for record in records:
+                        if dedup is not None and not self._admit(dedup, record, job_stats):
+                            continue
+                        batch.append(record)
+                        record_count += 1
+                        if len(batch) >= self.batch_size:
+                            await asyncio.to_thread(flush)
+            finally:
+                # Keep whatever was scraped before a failure, timeout or cancellation
+                await asyncio.to_thread(flush, True)
+                job_stats["records_extracted"] += record_count
+        return record_count
+
+    async def _process_single_job(self, job: str) -> Dict:
+        """
+        Process a single job across all extractors (concurrently) and handlers.
+        Each extractor's records are flushed in batches as they arrive.
+
+        Args:
+            job: Job title to scrape
+
+        Returns:
+            Dictionary with job-level statistics
+        """
+        job_stats = {
+            "success": False,
+            "records_extracted": 0,
+            "extractors_used": 0,
+            "handlers_used": 0,
+            "batches_flushed": 0,
+            "duplicates_dropped": 0,
+            "errors": []
+        }
+        handlers_used = set()
+
+        results = await asyncio.gather(
+            *(self._run_extractor(extractor, job, job_stats, handlers_used) for extractor in self.extractors),
+            return_exceptions=True,
+        )
+
+        for extractor, result in zip(self.extractors, results):
+            extractor_name = extractor.__class__.__name__
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                error_msg = f"Extractor {extractor_name} failed: {result!r}"
+                self.logger.error(f" {error_msg}")
+                job_stats["errors"].append(error_msg)
+                continue
+            if result:
+                job_stats["extractors_used"] += 1
+                self.logger.info(f"Extractor={extractor_name} | Job='{job}' | Extracted {result} records")
+
+        if job_stats["records_extracted"] == 0 and job_stats["duplicates_dropped"] == 0:
+            self.logger.warning(f" No data extracted for job '{job}' from any extractor")
+            return job_stats
+
+        job_stats["handlers_used"] = len(handlers_used)
+        if (job_stats["handlers_used"] > 0 or job_stats["records_extracted"] == 0) and not job_stats["errors"]:
+            job_stats["success"] = True
+
+        return job_stats
+
+    def _save(self, handler: StorageHandler, batch: JobBatch, filename: str):
+        """Save through a handler, serialising concurrent saves to the same handler."""
+        with self._handler_locks[handler.get_name()]:
+            handler.save_batch(batch, filename)
+
+    def _flush_handlers(self):
+        """Write out handler buffers, serialised with the saves of each handler."""
+        for handler in self.handlers:
+            flush = getattr(handler, "flush", None)
+            if callable(flush):
+                with self._handler_locks[handler.get_name()]:
+                    flush()
+
+    async def _close_extractors_async(self):
+        """Release network and browser resources of all extractors."""
+        for extractor in self.extractors:
+            try:
+                await extractor.aclose()
+            except Exception as e:
+                self.logger.warning(f"Failed to close extractor {extractor.__class__.__name__}: {e}")
@@ -1,5 +1,6 @@
 from abc import ABC , abstractmethod
-from typing import List , Dict ,Union
+from typing import List , Dict ,Union, Iterator, AsyncIterator
+from .records import JobBatch
 
 class JobExtractor(ABC):
     """
@@ -11,12 +12,46 @@ class JobExtractor(ABC):
     def extract(self , job_name: Union[str, List[str]] , max_pages: int , max_limit: int)-> List[Dict[str, str]]: 
         pass
 
+    def iter_extract(self, job_name: str, progress=None) -> Iterator[Dict[str, str]]:
+        """
+        Yield records as they are scraped (see Pipeline batch flushing).
+        Extractors that can stream should override this and report finished
+        listing pages to `progress` (state.checkpoint.JobProgress); the
+        default yields the result of extract().
+        """
+        yield from self.extract(job_name)
+
     @abstractmethod
     def get_name(self)->str:
         """Return extractor name (e.g., 'NaukriExtractor','LinkedinExtractor')"""
         pass
 
 
+class AsyncJobExtractor(ABC):
+    """
+    Abstract base class for asyncio-based job extractors.
+    Many roles can be extracted concurrently on one event loop
+    (see AsyncPipeline).
+    """
+    @abstractmethod
+    async def extract(self, job_name: str) -> List[Dict[str, str]]:
+        pass
+
+    async def iter_extract(self, job_name: str, progress=None) -> AsyncIterator[Dict[str, str]]:
+        """Yield records as they are scraped; defaults to the result of extract()."""
+        for record in await self.extract(job_name):
+            yield record
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """Return extractor name (e.g., 'AsyncNaukriExtractor')"""
+        pass
+
+    async def aclose(self) -> None:
+        """Release network and browser resources."""
+        pass
+
+
 class StorageHandler(ABC):
     """
     Abstract base class for all storage handlers.
@@ -26,6 +61,21 @@ class StorageHandler(ABC):
     def save(self , clean_dataset: List[Dict] , filename: str)->None:
         pass
 
+    def save_batch(self, batch: JobBatch, filename: str) -> None:
+        """
+        Save a column-oriented batch (used by the pipeline). Handlers that
+        can write columns directly override this; the default converts the
+        batch back to a list of dicts for save().
+        """
+        self.save(batch.to_records(), filename)
+
+    def has_buffered_records(self) -> bool:
+        """
+        Whether saved records are still held in memory, not yet written.
+        The pipeline commits checkpoints only when no handler buffers records.
+        """
+        return False
+
     @abstractmethod
     def get_name(self)->str:
         """Return handler name (e.g., 'csv', 'sql')"""
@@ -0,0 +1,460 @@
+"""
+Asyncio-based Naukri extractor.
+Detail pages are downloaded with aiohttp on the event loop; listing pages
+(rendered client-side) are walked by a small pool of browser-backed
+NaukriJobExtractor instances running in worker threads.
+"""
+
+from ..base import AsyncJobExtractor
+from .NaukriExtractor import ExtractionIncomplete, NaukriJobExtractor
+from ..records import JobRecord
+from .parsers import parse_detail_page
+from ..state.page_cache import PageCache
+from ..state.seen_index import SeenIndex
+from ..state.enrichment_queue import EnrichmentQueue
+from ..state.checkpoint import JobProgress
+from ...utils.rate_limiter import RateLimiter
+from ...utils.robots import RobotsCache
+from ...utils.metrics import inc, metric_labels, observe, timer
+from ...utils.backoff import RetryPolicy, CircuitBreaker, CircuitOpenError, HTTPStatusError, parse_retry_after
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+import asyncio
+import logging
+import multiprocessing
+import time
+
+import aiohttp
+
+
+class AsyncNaukriJobExtractor(AsyncJobExtractor):
+    """
+    Extracts Naukri job listings concurrently on a single event loop.
+    Concurrency is bounded by the number of listing browsers (roles and
+    locations being paginated at once) and by max_connections (detail
+    pages in flight); all requests share one per-host rate limit.
+    """
+
+    FETCH_MODES = NaukriJobExtractor.FETCH_MODES
+    EXTRACTION_MODES = NaukriJobExtractor.EXTRACTION_MODES
+    RETRY_EXCEPTIONS = NaukriJobExtractor.RETRY_EXCEPTIONS + (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+
+    def __init__(self, max_pages: int, per_page_limit: Optional[int] = None,
+                 locations: Optional[List[str]] = None, requests_per_second: float = 0.5, burst: float = 1,
+                 max_connections: int = 8, listing_browsers: int = 2,
+                 driver_recycle_pages: Optional[int] = None, fetch_mode: str = "auto",
+                 parser: str = "bs4", parse_workers: int = 0, parse_queue_size: Optional[int] = None,
+                 request_timeout: float = 10,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 page_cache: Optional[PageCache] = None,
+                 seen_index: Optional[SeenIndex] = None, stop_known_fraction: Optional[float] = None,
+                 robots: Optional[RobotsCache] = None, base_url: Optional[str] = None,
+                 extraction_mode: str = "detail", enrichment_queue: Optional[EnrichmentQueue] = None,
+                 logger=None):
+        """
+        Initialize the async Naukri extractor.
+
+        Args:
+            max_pages: Maximum number of pages to scrape
+            per_page_limit: Max jobs per page (None for all)
+            locations: List of locations to filter (e.g., ['bengaluru', 'mumbai'])
+            requests_per_second: Per-host request rate
+            burst: Requests a host may receive back to back before pacing kicks in
+            max_connections: Max detail pages fetched concurrently
+            listing_browsers: Browsers paginating listing pages concurrently
+            driver_recycle_pages: Restart each browser after this many page loads
+            fetch_mode: 'auto' (HTTP first, Selenium fallback), 'http' or 'selenium'
+            parser: HTML parser backend for detail pages: 'bs4', 'lxml' or 'selectolax'
+            parse_workers: Processes parsing detail pages (0 = parse in a worker thread)
+            parse_queue_size: Fetched pages allowed to wait for a parse process (default 4 per process)
+            request_timeout: HTTP timeout in seconds
+            rate_limiter: Shared RateLimiter (e.g. across extractors); created if omitted
+            retry_policy: Shared RetryPolicy with circuit breaker; created if omitted
+            page_cache: On-disk HTML cache consulted before fetching (replay mode never fetches)
+            seen_index: Persistent index of jobs scraped on earlier runs; known jobs are skipped
+            stop_known_fraction: Stop paginating once this fraction of a listing page is already known
+            robots: robots.txt cache; disallowed listing and detail URLs are not fetched
+            base_url: Site root for search URLs (e.g. a local stand-in server for benchmarks)
+            extraction_mode: 'detail', 'listing' (card fields only, no detail pages) or
+                'enrich' (detail pages of jobs queued by listing-only runs)
+            enrichment_queue: Queue of jobs awaiting their detail page; filled in listing
+                mode, drained in enrich mode
+            logger: Logger instance
+        """
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Unknown fetch_mode '{fetch_mode}'. Supported: {self.FETCH_MODES}")
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction_mode '{extraction_mode}'. Supported: {self.EXTRACTION_MODES}")
+        if extraction_mode == "enrich" and enrichment_queue is None:
+            raise ValueError("extraction_mode 'enrich' requires an enrichment_queue")
+
+        self.logger = logger or logging.getLogger("data_collection")
+        self.fetch_mode = fetch_mode
+        self.max_connections = max(1, max_connections)
+        self.request_timeout = request_timeout
+        self.rate_limiter = rate_limiter or RateLimiter(requests_per_second, burst)
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_exceptions=self.RETRY_EXCEPTIONS, breaker=CircuitBreaker())
+        self.page_cache = page_cache
+        self.replay = bool(page_cache and page_cache.replay)
+        self.robots = robots
+        self.extraction_mode = extraction_mode
+        self.enrichment_queue = enrichment_queue
+        self.parser_backend = parser
+        self.parse_workers = max(0, parse_workers)
+        self.parse_queue_size = parse_queue_size or self.parse_workers * 4
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Browser-backed extractors used for pagination and the Selenium fallback.
+        # They pace listing pages with the same rate limiter as the detail fetches.
+        self._listers = [
+            NaukriJobExtractor(
+                max_pages=max_pages,
+                per_page_limit=per_page_limit,
+                locations=locations,
+                rate_limiter=self.rate_limiter,
+                retry_policy=self.retry_policy,
+                driver_recycle_pages=driver_recycle_pages,
+                fetch_mode="selenium",
+                parser=parser,
+                page_cache=page_cache,
+                seen_index=seen_index,
+                stop_known_fraction=stop_known_fraction,
+                robots=robots,
+                base_url=base_url,
+                extraction_mode=extraction_mode,
+                enrichment_queue=enrichment_queue,
+                logger=self.logger,
+            )
+            for _ in range(max(1, listing_browsers))
+        ]
+        self.locations = self._listers[0].locations
+
+        # Event-loop bound primitives are created on first use
+        self._idle_listers: Optional[asyncio.Queue] = None
+        self._fallback_locks: Dict[int, asyncio.Lock] = {}
+        self._detail_slots: Optional[asyncio.Semaphore] = None
+        self._parse_slots: Optional[asyncio.Semaphore] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    def _ensure_loop_resources(self):
+        """Create queues, locks and the HTTP session inside the running loop."""
+        if self._idle_listers is None:
+            self._idle_listers = asyncio.Queue()
+            for lister in self._listers:
+                self._idle_listers.put_nowait(lister)
+                self._fallback_locks[id(lister)] = asyncio.Lock()
+            self._detail_slots = asyncio.Semaphore(self.max_connections)
+            if self.parse_workers:
+                self._parse_slots = asyncio.Semaphore(self.parse_queue_size)
+
+        if self.parse_workers and self._parse_pool is None:
+            # spawn: forking a process that runs browser and HTTP threads is unsafe
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn"))
+
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                headers={
+                    "User-Agent": self._listers[0].session.USER_AGENT,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.9",
+                },
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            )
+
+    async def extract(self, job_name: str, locations: Optional[List[str]] = None) -> List[JobRecord]:
+        """
+        Extract job listings for all locations of a role concurrently.
+
+        Args:
+            job_name: Job title/keyword to search
+            locations: Override instance locations for this extraction
+
+        Returns:
+            List of extracted JobRecords
+        """
+        return [record async for record in self.iter_extract(job_name, locations)]
+
+    async def iter_extract(self, job_name: str, locations: Optional[List[str]] = None,
+                           progress: Optional[JobProgress] = None) -> AsyncIterator[JobRecord]:
+        """
+        Yield job records as listing pages complete; all locations of the
+        role are walked concurrently.
+
+        Args:
+            job_name: Job title/keyword to search
+            locations: Override instance locations for this extraction
+            progress: Checkpoint progress of this role; finished locations are
+                skipped and unfinished ones resume mid-pagination
+
+        Yields:
+            Extracted JobRecords
+
+        Raises:
+            ExtractionIncomplete: A location failed or its pagination stopped early
+                (it is not checkpointed as done, so --resume retries it)
+        """
+        self._ensure_loop_resources()
+        if self.extraction_mode == "enrich":
+            async for record in self._iter_enrich(job_name, progress):
+                yield record
+            return
+
+        active_locations = locations or self.locations or [None]
+        if progress:
+            active_locations = [
+                location for location in active_locations
+                if not await asyncio.to_thread(progress.is_location_done, location)
+            ]
+        # Bounded, so walkers pause while the consumer is flushing
+        pages: asyncio.Queue = asyncio.Queue(maxsize=len(self._listers))
+        incomplete = []
+
+        async def walk_all():
+            results = await asyncio.gather(
+                *(self._extract_for_location(job_name, location, pages, progress) for location in active_locations),
+                return_exceptions=True,
+            )
+            for location, result in zip(active_locations, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error during extraction for {location or 'all locations'}: {result}")
+                    incomplete.append(location or "all locations")
+                elif not result[1]:
+                    incomplete.append(location or "all locations")
+                elif progress:
+                    await pages.put((location, None, None, None, None))
+            await pages.put(None)
+
+        walker = asyncio.create_task(walk_all())
+        total = 0
+        try:
+            while (item := await pages.get()) is not None:
+                location, page_no, listing_url, next_url, page_data = item
+                if page_data is None:
+                    # Every page of this location has been consumed
+                    progress.location_done(location)
+                    continue
+
+                total += len(page_data)
+                for record in page_data:
+                    yield record
+                # Takes effect once the consumer has stored the page
+                if progress:
+                    progress.page_done(location, page_no, listing_url, next_url)
+                await self._when_stored(
+                    progress, lambda records=page_data: self._listers[0]._page_stored(records, job_name))
+        finally:
+            if not walker.done():
+                walker.cancel()
+            await asyncio.gather(walker, return_exceptions=True)
+
+        self.logger.info(f"Finished scraping {total} total jobs for '{job_name}'")
+        if incomplete:
+            raise ExtractionIncomplete(f"'{job_name}' incomplete for: {', '.join(incomplete)}")
+
+    @staticmethod
+    async def _when_stored(progress: Optional[JobProgress], callback) -> None:
+        """Run callback once the records yielded so far are stored (right away without a pipeline)."""
+        if progress is not None:
+            progress.on_stored(callback)
+        else:
+            await asyncio.to_thread(callback)
+
+    async def _iter_enrich(self, job_name: str, progress: Optional[JobProgress] = None) -> AsyncIterator[JobRecord]:
+        """
+        Scrape the detail pages queued for a role by listing-only runs, one
+        batch at a time. A batch is removed from the queue only after its
+        records are stored; failed pages stay queued.
+        """
+        lister = await self._idle_listers.get()
+        total = 0
+        after_id = 0
+        try:
+            while True:
+                batch = await asyncio.to_thread(
+                    self.enrichment_queue.pending, job_name, after_id, NaukriJobExtractor.ENRICH_BATCH)
+                if not batch:
+                    break
+                after_id = batch[-1][0]
+                job_urls = [url for _, url in batch]
+
+                records = await asyncio.gather(*(self._scrape_job(lister, url, job_name) for url in job_urls))
+                batch_data = [record for record in records if record]
+                rejected = set(await asyncio.to_thread(lister._mark_rejected_seen))
+                await asyncio.to_thread(self.enrichment_queue.done, rejected)
+                for record in batch_data:
+                    yield record
+
+                enriched = {record.job_url for record in batch_data}
+                await asyncio.to_thread(self.enrichment_queue.failed,
+                                        [url for url in job_urls if url not in enriched and url not in rejected])
+                await self._when_stored(progress, lambda records=batch_data: lister._enrichment_stored(records))
+                total += len(batch_data)
+        finally:
+            self._idle_listers.put_nowait(lister)
+
+        self.logger.info(f"Enriched {total} queued jobs for '{job_name}'",
+                         extra={"role": job_name, "records": total})
+
+    async def _extract_for_location(self, job_name: str, location: Optional[str], pages: asyncio.Queue,
+                                    progress: Optional[JobProgress] = None) -> Tuple[int, bool]:
+        """
+        Paginate one role/location on a borrowed browser, fetch its detail
+        pages and put each page's records on the queue.
+
+        Returns:
+            Tuple of (records scraped, whether every listing page was walked)
+        """
+        start_page, start_url = 1, None
+        resume_point = await asyncio.to_thread(progress.resume_point, location) if progress else None
+        if resume_point:
+            start_page, start_url = resume_point
+            self.logger.info(f"Checkpoint: resuming '{job_name}' in {location or 'all locations'} at page {start_page}")
+
+        lister = await self._idle_listers.get()
+        scraped = 0
+        completed = False
+        seen_job_urls: Set[str] = set()
+        listing_pages = lister._iter_listing_pages(job_name, location, start_url, start_page)
+
+        try:
+            while True:
+                step, walked = await asyncio.to_thread(lister._next_listing_page, listing_pages)
+                if step is None:
+                    completed = walked
+                    break
+
+                page_no, listing_url, job_hrefs, next_url, listing_html = step
+                new_hrefs, stop_early = await asyncio.to_thread(
+                    lister._select_new_urls, job_hrefs, seen_job_urls, page_no)
+
+                with metric_labels(location=location):
+                    if self.extraction_mode == "listing":
+                        page_data = await asyncio.to_thread(
+                            lister._card_records, listing_html, listing_url, new_hrefs, job_name)
+                    else:
+                        records = await asyncio.gather(*(self._scrape_job(lister, url, job_name) for url in new_hrefs))
+                        page_data = [record for record in records if record]
+                await asyncio.to_thread(lister._mark_rejected_seen)
+                await pages.put((location, page_no, listing_url, next_url, page_data))
+                scraped += len(page_data)
+                if stop_early:
+                    completed = True
+                    break
+        finally:
+            try:
+                listing_pages.close()
+            except ValueError:
+                # Cancelled while the browser thread is still loading a page
+                self.logger.debug(f"Listing walk for {location or 'all locations'} still running at cancellation")
+            self._idle_listers.put_nowait(lister)
+
+        self.logger.info(f"Scraped {scraped} jobs for {location or 'all locations'}",
+                         extra={"role": job_name, "location": location, "records": scraped})
+        return scraped, completed
+
+    async def _scrape_job(self, lister: NaukriJobExtractor, job_url: str, job_name: str) -> Optional[JobRecord]:
+        """Fetch a detail page within the connection limit and parse it off the loop."""
+        try:
+            cached_page = None
+            if self.page_cache:
+                cached_page = await asyncio.to_thread(self.page_cache.get, job_url, "detail")
+            if cached_page is not None:
+                return await self._parse_job(lister, cached_page, job_url, job_name)
+            if self.replay:
+                self.logger.debug(f"Replay: {job_url} is not cached, skipping")
+                return None
+            if self.robots is not None and not await self.robots.is_allowed_async(job_url):
+                return None
+
+            async with self._detail_slots:
+                await self.rate_limiter.acquire_async(job_url)
+                started = time.perf_counter()
+                page_source = await self._fetch_detail_page(lister, job_url)
+
+            if page_source is None:
+                self.logger.warning(f"No fetcher returned a usable page for {job_url}")
+                return None
+            self.logger.debug(f"Fetched {job_url}", extra={
+                "role": job_name, "url": job_url, "latency_ms": round((time.perf_counter() - started) * 1000)})
+            if self.page_cache:
+                await asyncio.to_thread(self.page_cache.put, job_url, page_source, "detail")
+            return await self._parse_job(lister, page_source, job_url, job_name)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error scraping {job_url}: {e}")
+            return None
+
+    async def _parse_job(self, lister: NaukriJobExtractor, page_source: str, job_url: str,
+                         job_name: str) -> Optional[JobRecord]:
+        """Parse a detail page in a parse process, or in a worker thread without parse_workers."""
+        if self._parse_pool is None:
+            return await asyncio.to_thread(lister._parse_job, page_source, job_url, job_name)
+
+        # Fetches keep going while up to parse_queue_size pages wait for a parse process
+        async with self._parse_slots:
+            loop = asyncio.get_running_loop()
+            try:
+                fields, parse_seconds = await loop.run_in_executor(
+                    self._parse_pool, parse_detail_page, self.parser_backend, page_source)
+            except Exception as e:
+                self.logger.error(f"Error extracting job details from {job_url}: {e}")
+                return None
+        observe("parse_seconds", parse_seconds)
+        return lister._accept_job(lister._job_record(fields, job_url), job_name)
+
+    async def _fetch_http(self, job_url: str) -> Optional[str]:
+        """Download a page with aiohttp; 429/5xx raise HTTPStatusError, other non-200 responses yield None."""
+        async with self._http.get(job_url) as response:
+            if response.status == 429 or response.status >= 500:
+                raise HTTPStatusError(job_url, response.status, parse_retry_after(response.headers.get("Retry-After")))
+            if response.status != 200:
+                self.logger.debug(f"HTTP {response.status} for {job_url}")
+                return None
+            return await response.text()
+
+    async def _fetch_detail_page(self, lister: NaukriJobExtractor, job_url: str) -> Optional[str]:
+        """HTTP first; fall back to rendering on the lister's browser when required selectors are missing."""
+        page_source = None
+        if self.fetch_mode != "selenium":
+            try:
+                with timer("detail_fetch_seconds", fetcher="aiohttp"):
+                    page_source = await self.retry_policy.call_async(lambda: self._fetch_http(job_url), job_url)
+            except CircuitOpenError as e:
+                self.logger.warning(f"Skipping {job_url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError, HTTPStatusError) as e:
+                self.logger.debug(f"Fetcher=aiohttp failed for {job_url}: {e}")
+            if page_source:
+                inc("bytes_fetched_total", len(page_source), fetcher="aiohttp")
+
+            if self.fetch_mode == "http":
+                return page_source
+            if page_source and lister._has_required_selectors(page_source):
+                return page_source
+            self.logger.debug(f"Fetcher=aiohttp page incomplete for {job_url}, falling back")
+
+        # The browser also holds the listing page, so fallbacks of one lister run one at a time
+        async with self._fallback_locks[id(lister)]:
+            return await asyncio.to_thread(lister._fetch_detail_page, job_url)
+
+    async def aclose(self) -> None:
+        """Close the HTTP session and all browsers. Loop-bound state is rebuilt on the next extract()."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        self._idle_listers = None
+        self._fallback_locks = {}
+        if self._parse_pool is not None:
+            await asyncio.to_thread(self._parse_pool.shutdown, cancel_futures=True)
+            self._parse_pool = None
+        for lister in self._listers:
+            await asyncio.to_thread(lister.close)
+
+    def get_name(self) -> str:
+        """Return extractor name."""
+        return "AsyncNaukriExtractor"
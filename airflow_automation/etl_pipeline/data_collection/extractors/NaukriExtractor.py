@@ -6,8 +6,7 @@
 # import pandas as pd
 # from selenium.webdriver.chrome.service import Service
 # from webdriver_manager.chrome import ChromeDriverManager
-# from bs4 import BeautifulSoup
-# import random, time
+# # import random, time
 # import datetime
 # # from etl_pipeline.utils.robots import is_allowed
 # from etl_pipeline.utils.backoff import exponential_backoff
@@ -179,24 +178,39 @@
 
 # from etl_pipeline.data_collection.base import JobExtractor
 from ..base import JobExtractor
-from selenium import webdriver
+from ..records import JobRecord
+from .driver_session import DriverSession, DriverPool
+from .fetchers import PageFetcher, HTTPFetcher, SeleniumFetcher
+from .parsers import DetailPageParser, get_parser, parse_detail_page
+from ..state.page_cache import PageCache
+from ..state.seen_index import SeenIndex
+from ..state.enrichment_queue import EnrichmentQueue
+from ..state.checkpoint import JobProgress
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 import pandas as pd
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import random, time
 import datetime
-from typing import List, Optional, Set
-# from etl_pipeline.utils.backoff import exponential_backoff
-from ...utils.backoff import exponential_backoff
+import re
+import time
+import contextvars
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Generator, Iterator, List, Optional, Set, Tuple
+from ...utils.backoff import RetryPolicy, CircuitBreaker, CircuitOpenError
+from ...utils.rate_limiter import RateLimiter, rate_from_delays
+from ...utils.robots import RobotsCache
+from ...utils.metrics import inc, metric_labels, observe, timer
 
 import logging
-from ...utils.logger import setup_logging
 
-setup_logging()
+
+class ExtractionIncomplete(Exception):
+    """Some locations of a role could not be walked to the end (raised after the others are done)."""
+
 
 class NaukriJobExtractor(JobExtractor):
     """
@@ -211,30 +225,134 @@ class NaukriJobExtractor(JobExtractor):
         'chandigarh', 'kochi', 'noida', 'gurgaon', 'gurugram'
     }
 
+    # A detail page is usable only if these classes are present in its HTML;
+    # otherwise the next fetcher (ultimately Selenium) is tried
+    REQUIRED_SELECTORS = ("styles_jd-header-title__rZwM1",)
+    FETCH_MODES = ("auto", "http", "selenium")
+    # detail: open every detail page; listing: card fields of the search results only;
+    # enrich: scrape the detail pages queued by earlier listing-only runs
+    EXTRACTION_MODES = ("detail", "listing", "enrich")
+    # Queued URLs scraped (and stored) per batch in enrich mode
+    ENRICH_BATCH = 20
+    BASE_URL = "https://www.naukri.com"
+    # Besides connection errors, timeouts and HTTP 429/5xx
+    RETRY_EXCEPTIONS = (WebDriverException,)
+
     def __init__(self, max_pages: int, per_page_limit: Optional[int] = None,
-                 min_delay: float = 2, max_delay: float = 5, role_delay: float = 10,
-                 locations: Optional[List[str]] = None, logger=None):
+                 min_delay: float = 2, max_delay: float = 5, role_delay: Optional[float] = None,
+                 locations: Optional[List[str]] = None, driver_recycle_pages: Optional[int] = None,
+                 session: Optional[DriverSession] = None, workers: int = 1,
+                 requests_per_second: Optional[float] = None, burst: float = 1,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 fetch_mode: str = "auto",
+                 fetchers: Optional[List[PageFetcher]] = None, parser: str = "bs4",
+                 parse_workers: int = 0, parse_queue_size: Optional[int] = None,
+                 page_cache: Optional[PageCache] = None, seen_index: Optional[SeenIndex] = None,
+                 stop_known_fraction: Optional[float] = None, robots: Optional[RobotsCache] = None,
+                 base_url: Optional[str] = None, extraction_mode: str = "detail",
+                 enrichment_queue: Optional[EnrichmentQueue] = None, logger=None):
         """
         Initialize the Naukri Job Extractor.
         
         Args:
             max_pages: Maximum number of pages to scrape
             per_page_limit: Max jobs per page (None for all)
-            min_delay: Minimum delay between requests (seconds)
-            max_delay: Maximum delay between requests (seconds)
-            role_delay: Delay between different job roles (seconds)
+            min_delay: Minimum delay between requests (seconds), used only to derive
+                the request rate when requests_per_second is not given
+            max_delay: Maximum delay between requests (seconds), as above
+            role_delay: Ignored; roles and locations are paced by the rate limiter
             locations: List of locations to filter (e.g., ['bangalore', 'mumbai'])
+            driver_recycle_pages: Restart the browser after this many page loads (None to never recycle)
+            session: Shared DriverSession (a private one is created if omitted)
+            workers: Number of browsers fetching detail pages concurrently (1 = sequential)
+            requests_per_second: Per-host request rate shared by all workers
+            burst: Requests a host may receive back to back before pacing kicks in
+            rate_limiter: Shared RateLimiter (e.g. across extractors); overrides the two above
+            retry_policy: Shared RetryPolicy for listing and detail requests (a default with a
+                per-host circuit breaker is created if omitted)
+            fetch_mode: 'auto' (HTTP first, Selenium fallback), 'http' or 'selenium'
+            fetchers: Custom fetcher chain, tried in order (overrides fetch_mode)
+            parser: HTML parser backend for detail pages: 'bs4', 'lxml' or 'selectolax'
+            parse_workers: Processes parsing detail pages while the workers keep fetching
+                (0 = parse in the fetching thread)
+            parse_queue_size: Fetched pages allowed to wait for a parse process before
+                fetching pauses (default 4 per parse process)
+            page_cache: On-disk HTML cache consulted before fetching (replay mode never fetches)
+            seen_index: Persistent index of jobs scraped on earlier runs; known jobs are skipped
+            stop_known_fraction: Stop paginating once this fraction of a listing page is already known
+            robots: robots.txt cache; disallowed listing and detail URLs are not fetched
+            base_url: Site root for search URLs (e.g. a local stand-in server for benchmarks)
+            extraction_mode: 'detail', 'listing' (card fields only, no detail pages) or
+                'enrich' (detail pages of jobs queued by listing-only runs)
+            enrichment_queue: Queue of jobs awaiting their detail page; filled in listing
+                mode, drained in enrich mode
             logger: Logger instance
         """
+        if extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction_mode '{extraction_mode}'. Supported: {self.EXTRACTION_MODES}")
+        if extraction_mode == "enrich" and enrichment_queue is None:
+            raise ValueError("extraction_mode 'enrich' requires an enrichment_queue")
+
         self.max_pages = max_pages
         self.per_page_limit = per_page_limit
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.role_delay = role_delay
-        self.logger = logger
-        self.driver = None
-        self.service = None
-        self.logger = logger or logging.getLogger("data_collection") 
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.logger = logger or logging.getLogger("data_collection")
+
+        # One browser session lives as long as the extractor and is reused
+        # across locations, roles and extract() calls
+        self.session = session or DriverSession(recycle_after=driver_recycle_pages, logger=self.logger)
+
+        # Every listing and detail request takes a token from a per-host bucket,
+        # shared by all workers (and by other extractors given the same limiter)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            requests_per_second or rate_from_delays(min_delay, max_delay) or 0.5, burst)
+
+        # Transient errors are retried with backoff; a failing host trips the circuit breaker
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_exceptions=self.RETRY_EXCEPTIONS, breaker=CircuitBreaker())
+
+        # Worker-pool mode: detail pages are fetched by N concurrent workers
+        self.workers = max(1, workers)
+        self._driver_pool: Optional[DriverPool] = None
+        if self.workers > 1:
+            self._driver_pool = DriverPool(self.workers, recycle_after=driver_recycle_pages, logger=self.logger)
+
+        # Detail pages go through a chain of fetchers, cheapest first
+        if fetch_mode not in self.FETCH_MODES:
+            raise ValueError(f"Unknown fetch_mode '{fetch_mode}'. Supported: {self.FETCH_MODES}")
+        self.fetchers = fetchers or self._build_fetchers(fetch_mode)
+        self._required_patterns = [
+            re.compile(rf'class="[^"]*\b{re.escape(cls)}\b') for cls in self.REQUIRED_SELECTORS
+        ]
+        self.parser: DetailPageParser = get_parser(parser)
+        self.parser_backend = parser
+
+        # Parsing is CPU-bound and holds the GIL, so with parse_workers it runs
+        # in separate processes fed by the fetch workers through a bounded queue
+        self.parse_workers = max(0, parse_workers)
+        self.parse_queue_size = parse_queue_size or self.parse_workers * 4
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Listing and detail pages are looked up in the cache first; in replay
+        # mode cached HTML is re-parsed and the network is never touched
+        self.page_cache = page_cache
+        self.replay = bool(page_cache and page_cache.replay)
+
+        # Incremental crawling across runs
+        self.seen_index = seen_index
+        self.stop_known_fraction = stop_known_fraction
+        # Jobs dropped by the location filter, marked seen once their page is done
+        self._rejected_urls: List[str] = []
+        self._rejected_lock = threading.Lock()
+
+        self.robots = robots
+
+        # Listing-only runs queue their jobs for a later enrichment run
+        self.extraction_mode = extraction_mode
+        self.enrichment_queue = enrichment_queue
         
         # Location filtering
         self.locations = [loc.lower() for loc in (locations or [])]
@@ -248,34 +366,44 @@ class NaukriJobExtractor(JobExtractor):
                 self.logger.warning(f"Invalid locations: {invalid}. Supported: {self.SUPPORTED_LOCATIONS}")
                 self.locations = [loc for loc in self.locations if loc in self.SUPPORTED_LOCATIONS]
 
-    def _setup_driver(self):
-        """Initialize and configure Selenium WebDriver."""
-        try:
-            options = webdriver.ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0 Safari/537.36")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option("useAutomationExtension", False)
-
-            self.service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=self.service, options=options)
-            self.logger.info("WebDriver initialized successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize WebDriver: {e}")
-            raise
-
-    def _close_driver(self):
-        """Safely close the WebDriver."""
-        try:
-            if self.driver:
-                self.driver.quit()
-                self.logger.info("WebDriver closed successfully")
-        except Exception as e:
-            self.logger.error(f"Error closing WebDriver: {e}")
+    @property
+    def driver(self):
+        """Currently running WebDriver of the session (None before the first page load)."""
+        return self.session.driver
+
+    def _build_fetchers(self, fetch_mode: str) -> List[PageFetcher]:
+        """Build the detail-page fetcher chain for the given mode."""
+        selenium_fetcher = SeleniumFetcher(
+            self.session,
+            pool=self._driver_pool,
+            wait_selector=f"h1.{self.REQUIRED_SELECTORS[0]}",
+            logger=self.logger,
+        )
+        if fetch_mode == "selenium":
+            return [selenium_fetcher]
+
+        http_fetcher = HTTPFetcher(pool_size=max(10, self.workers), logger=self.logger)
+        if fetch_mode == "http":
+            return [http_fetcher]
+        return [http_fetcher, selenium_fetcher]
+
+    def close(self):
+        """Shut down browsers and HTTP connections. They are reopened lazily on the next extract()."""
+        self.session.close()
+        if self._driver_pool:
+            self._driver_pool.close()
+        for fetcher in self.fetchers:
+            fetcher.close()
+        if self._parse_pool:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
     def _build_job_url(self, job_name: str, location: Optional[str] = None) -> str:
         """
@@ -288,166 +416,32 @@ class NaukriJobExtractor(JobExtractor):
         Returns:
             Complete URL string
         """
-        base_url = f"https://www.naukri.com/{job_name}-jobs"
+        base_url = f"{self.base_url}/{job_name}-jobs"
         if location and location in self.SUPPORTED_LOCATIONS:
             base_url += f"-in-{location}"
         return base_url
 
-    def _extract_timestamps(self, page: BeautifulSoup) -> tuple:
-        """
-        Extract job posting date and last date to apply.
-        Searches through multiple possible locations on the page.
-        
-        Returns:
-            Tuple of (posted_date, last_apply_date)
-        """
-        posted_date = "NA"
-        last_apply_date = "NA"
-        
-        try:
-            # Strategy 1: Primary selector - found in stats section
-            jd_stats = page.find("div", class_="styles_jhc__jd-stats__KrId0")
-            if jd_stats:
-                stat_spans = jd_stats.find_all("span", class_="styles_jhc__stat__PgY67")
-                for span in stat_spans:
-                    label = span.find("label")
-                    value_span = span.find("span")
-                    
-                    if label and value_span:
-                        label_text = label.get_text(strip=True).lower()
-                        value_text = value_span.get_text(strip=True)
-                        
-                        if "posted" in label_text:
-                            posted_date = value_text
-            
-            # Strategy 2: Alternative selector - similar jobs card
-            if posted_date == "NA":
-                posted_div = page.find("div", class_="styles_SJC__posted-date__eiY9o")
-                if posted_div:
-                    span = posted_div.find("span")
-                    if span:
-                        posted_date = span.get_text(strip=True)
-            
-            # Strategy 3: Look for "Apply by" or deadline info in page
-            # Note: Naukri doesn't always show "Apply by" date, but we'll search for it
-            page_text = page.get_text()
-            
-            # Try to find deadline using regex
-            import re
-            
-            # Look for date patterns like "25 Aug 2025" or "Apply by X"
-            if last_apply_date == "NA":
-                # Pattern: "DD Month YYYY"
-                date_match = re.search(r'(\d{1,2}\s+\w+\s+\d{4})', page_text)
-                if date_match:
-                    last_apply_date = date_match.group(1)
-        
-        except Exception as e:
-            self.logger.debug(f"Error extracting timestamps: {e}")
-        
-        return posted_date, last_apply_date
-
-    def _extract_job_details(self, page: BeautifulSoup, job_url: str) -> Optional[dict]:
+    def _extract_job_details(self, page_source: str, job_url: str) -> Optional[JobRecord]:
         """
         Extract structured data from a job listing page.
         
         Args:
-            page: BeautifulSoup parsed page
+            page_source: Raw HTML of the job detail page
             job_url: URL of the job listing
             
         Returns:
-            Dictionary with extracted job details or None on error
+            JobRecord with the extracted job details or None on error
         """
         try:
-            # Core fields with fallback
-            title = page.find("h1", class_="styles_jd-header-title__rZwM1")
-            title = title.get_text(strip=True) if title else "NA"
-
-            comp_elem = page.find("a", href=lambda x: x and "jobs-careers" in x)
-            company = comp_elem.get_text(strip=True) if comp_elem else "NA"
-
-            exp_elem = page.find("div", class_="styles_jhc__exp__k_giM")
-            exp = exp_elem.find("span").get_text(strip=True) if exp_elem and exp_elem.find("span") else "NA"
-
-            salary_elem = page.find("div", class_="styles_jhc__salary__jdfEC")
-            salary = salary_elem.find("span").get_text(strip=True) if salary_elem and salary_elem.find("span") else "NA"
-
-            loc_elem = page.find("span", class_="styles_jhc__location__W_pVs")
-            location = loc_elem.get_text(strip=True) if loc_elem else "NA"
-
-            # Extract timestamps (may return "NA" if not found on page)
-            posted_date, last_apply_date = self._extract_timestamps(page)
-            
-            self.logger.debug(f"Dates extracted - Posted: {posted_date}, Apply By: {last_apply_date}")
-
-            # Extract additional details
-            details = self._extract_other_details(page)
-            
-            # Education
-            edu_elem = page.find("div", class_="styles_education__KXFkO")
-            education = edu_elem.get_text(strip=True) if edu_elem else "Not Available"
-
-            # Skills with star/normal classification
-            star_skills, normal_skills = self._extract_skills(page)
-
-            # Job description
-            jd_elem = page.find("div", class_="styles_JDC__dang-inner-html__h0K4t")
-            job_description = jd_elem.get_text(" ", strip=True) if jd_elem else "NA"
-
-            return {
-                "Title": title,
-                "Company": company,
-                "Experience": exp,
-                "Salary": salary,
-                "Location": location,
-                "Education": education,
-                "Star_Skills": star_skills,
-                "Normal_Skills": normal_skills,
-                "Posted_Date": posted_date,
-                "Last_Apply_Date": last_apply_date,
-                **details,
-                "Description": job_description,
-                "Job_URL": job_url,
-                "Scraped_At": datetime.datetime.now().isoformat()
-            }
+            return self._job_record(self.parser.parse(page_source), job_url)
         except Exception as e:
             self.logger.error(f"Error extracting job details from {job_url}: {e}")
             return None
 
-    def _extract_other_details(self, page: BeautifulSoup) -> dict:
-        """Extract miscellaneous job details."""
-        details = {}
-        try:
-            details_section = page.find("div", class_="styles_other-details__oEN4O")
-            if details_section:
-                for div in details_section.find_all("div", class_="styles_details__Y424J"):
-                    label = div.find("label")
-                    span = div.find("span")
-                    if label and span:
-                        key = label.get_text(strip=True).replace(":", "")
-                        value = span.get_text(" ", strip=True)
-                        details[key] = value
-        except Exception as e:
-            self.logger.debug(f"Error extracting other details: {e}")
-        return details
-
-    def _extract_skills(self, page: BeautifulSoup) -> tuple:
-        """Extract and categorize skills from job listing."""
-        star_skills, normal_skills = [], []
-        try:
-            skills_section = page.find("div", class_="styles_key-skill__GIPn_")
-            if skills_section:
-                for a in skills_section.find_all("a", class_="styles_chip__7YCfG"):
-                    skill_span = a.find("span")
-                    skill_name = skill_span.get_text(strip=True) if skill_span else "NA"
-                    if skill_name != "NA":
-                        if a.find("i", class_="ni-icon-jd-save"):
-                            star_skills.append(skill_name)
-                        else:
-                            normal_skills.append(skill_name)
-        except Exception as e:
-            self.logger.debug(f"Error extracting skills: {e}")
-        return star_skills, normal_skills
+    def _job_record(self, fields: dict, job_url: str) -> JobRecord:
+        """Build a job record from the fields parsed out of its detail page."""
+        self.logger.debug(f"Dates extracted - Posted: {fields['Posted_Date']}, Apply By: {fields['Last_Apply_Date']}")
+        return JobRecord.from_fields(fields, job_url=job_url, scraped_at=datetime.datetime.now().isoformat())
 
     def _apply_location_filter(self, location: str) -> bool:
         """
@@ -465,7 +459,7 @@ class NaukriJobExtractor(JobExtractor):
         location_lower = location.lower()
         return any(loc in location_lower for loc in self.locations)
 
-    def extract(self, job_name: str, locations: Optional[List[str]] = None) -> List[dict]:
+    def extract(self, job_name: str, locations: Optional[List[str]] = None) -> List[JobRecord]:
         """
         Extract job listings from Naukri.com.
         
@@ -474,112 +468,544 @@ class NaukriJobExtractor(JobExtractor):
             locations: Override instance locations for this extraction
             
         Returns:
-            List of extracted job dictionaries
+            List of extracted JobRecords
+        """
+        return list(self.iter_extract(job_name, locations))
+
+    def iter_extract(self, job_name: str, locations: Optional[List[str]] = None,
+                     progress: Optional[JobProgress] = None) -> Iterator[JobRecord]:
         """
+        Yield job records page by page as they are scraped.
+
+        Args:
+            job_name: Job title/keyword to search
+            locations: Override instance locations for this extraction
+            progress: Checkpoint progress of this role; finished locations are
+                skipped and unfinished ones resume mid-pagination
+
+        Yields:
+            Extracted JobRecords
+
+        Raises:
+            ExtractionIncomplete: A location failed or its pagination stopped early
+                (it is not checkpointed as done, so --resume retries it)
+        """
+        if self.extraction_mode == "enrich":
+            yield from self._iter_enrich(job_name, progress)
+            return
+
         # Override locations if provided
         active_locations = locations or self.locations or [None]
-        extracted_data = []
+        total = 0
+        incomplete = []
 
         for location in active_locations:
+            if progress and progress.is_location_done(location):
+                self.logger.info(f"Checkpoint: '{job_name}' in {location or 'All Locations'} already done, skipping")
+                continue
             self.logger.info(f"Starting extraction for '{job_name}' in {location or 'All Locations'}")
-            location_data = self._extract_for_location(job_name, location)
-            extracted_data.extend(location_data)
+            scraped, completed = yield from self._extract_for_location(job_name, location, progress)
+            total += scraped
+            if not completed:
+                incomplete.append(location or "all locations")
 
-        self.logger.info(f"Finished scraping {len(extracted_data)} total jobs for '{job_name}'")
-        return extracted_data
+        self.logger.info(f"Finished scraping {total} total jobs for '{job_name}'")
+        if incomplete:
+            raise ExtractionIncomplete(f"'{job_name}' incomplete for: {', '.join(incomplete)}")
 
-    def _extract_for_location(self, job_name: str, location: Optional[str]) -> List[dict]:
-        """Extract jobs for a specific location."""
-        self._setup_driver()
-        extracted_data = []
+    def _extract_for_location(self, job_name: str, location: Optional[str],
+                              progress: Optional[JobProgress] = None) -> Generator[JobRecord, None, Tuple[int, bool]]:
+        """
+        Yield jobs for a specific location, one listing page at a time.
+
+        Returns:
+            Tuple of (jobs scraped, whether every listing page was walked)
+        """
+        scraped = 0
         seen_job_urls: Set[str] = set()
+        completed = False
 
-        try:
-            job_url = self._build_job_url(job_name, location)
-            wait = WebDriverWait(self.driver, 10)
+        start_page, start_url = 1, None
+        resume_point = progress.resume_point(location) if progress else None
+        if resume_point:
+            start_page, start_url = resume_point
+            self.logger.info(f"Checkpoint: resuming '{job_name}' in {location or 'all locations'} at page {start_page}")
 
-            exponential_backoff(lambda: self.driver.get(job_url))
-            page_no = 1
+        try:
+            listing_pages = self._iter_listing_pages(job_name, location, start_url, start_page)
+            while True:
+                page, walked = self._next_listing_page(listing_pages)
+                if page is None:
+                    completed = walked
+                    break
+                page_no, listing_url, job_hrefs, next_url, listing_html = page
+                new_hrefs, stop_early = self._select_new_urls(job_hrefs, seen_job_urls, page_no)
 
-            while page_no <= self.max_pages:
-                self.logger.debug(f"Processing page {page_no}")
-                
-                try:
-                    wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.title")))
-                except Exception as e:
-                    self.logger.error(f"Failed to load job listings on page {page_no}: {e}")
+                # Extract each job
+                page_data = []
+                with metric_labels(location=location):
+                    if self.extraction_mode == "listing":
+                        page_data = self._card_records(listing_html, listing_url, new_hrefs, job_name)
+                    else:
+                        self._scrape_detail_pages(new_hrefs, page_data, job_name)
+                self._mark_rejected_seen()
+
+                yield from page_data
+                # Takes effect once the consumer has stored the page
+                if progress:
+                    progress.page_done(location, page_no, listing_url, next_url)
+                self._when_stored(progress, lambda records=page_data: self._page_stored(records, job_name))
+                scraped += len(page_data)
+                if stop_early:
+                    completed = True
                     break
 
-                # Collect job URLs
-                job_elems = self.driver.find_elements(By.CSS_SELECTOR, "a.title")
-                job_hrefs = [a.get_attribute("href") for a in job_elems if a.get_attribute("href")]
+        except Exception as e:
+            self.logger.error(f"Error during extraction: {e}")
 
-                if self.per_page_limit:
-                    job_hrefs = job_hrefs[:self.per_page_limit]
+        if not completed:
+            self.logger.warning(f"Listing pages of '{job_name}' in {location or 'all locations'} were not all walked")
+        elif progress:
+            progress.location_done(location)
 
-                self.logger.info(f"Found {len(job_hrefs)} jobs on page {page_no}")
+        self.logger.info(f"Scraped {scraped} jobs for {location or 'all locations'}",
+                         extra={"role": job_name, "location": location, "records": scraped})
+        return scraped, completed
 
-                # Extract each job
-                for job_url in job_hrefs:
-                    if job_url in seen_job_urls:
-                        self.logger.debug(f"Skipping duplicate: {job_url}")
-                        continue
-                    
-                    seen_job_urls.add(job_url)
-                    self._scrape_job(job_url, extracted_data, wait, job_name)
-
-                # Navigate to next page
-                if not self._go_to_next_page(page_no):
-                    break
+    @staticmethod
+    def _next_listing_page(listing_pages) -> Tuple[Optional[tuple], bool]:
+        """
+        Advance a listing walk (see _iter_listing_pages).
 
-                page_no += 1
-                time.sleep(random.uniform(self.min_delay, self.max_delay))
+        Returns:
+            Tuple of (next page, False), or (None, whether the walk reached its end) once it is over
+        """
+        try:
+            return next(listing_pages), False
+        except StopIteration as stop:
+            return None, bool(stop.value)
+
+    @staticmethod
+    def _when_stored(progress: Optional[JobProgress], callback) -> None:
+        """Run callback once the records yielded so far are stored (right away without a pipeline)."""
+        if progress is not None:
+            progress.on_stored(callback)
+        else:
+            callback()
+
+    def _page_stored(self, records: List[JobRecord], job_name: str) -> None:
+        """Bookkeeping for the stored records of a listing page."""
+        self._mark_seen(records)
+        self._queue_enrichment(records, job_name)
+
+    def _scrape_detail_pages(self, job_urls: List[str], extracted_data: list, job_name: str) -> None:
+        """Scrape detail pages with the configured concurrency, appending records in listing order."""
+        if self.parse_workers:
+            self._scrape_jobs_pipelined(job_urls, extracted_data, job_name)
+        elif self.workers > 1:
+            self._scrape_jobs_concurrently(job_urls, extracted_data, job_name)
+        else:
+            for job_url in job_urls:
+                job_data = self._scrape_job(job_url, job_name)
+                if job_data:
+                    extracted_data.append(job_data)
+
+    def _card_records(self, listing_html: Optional[str], listing_url: str, job_urls: List[str],
+                      job_name: str) -> List[JobRecord]:
+        """
+        Build partial records from the job cards of a listing page (listing mode).
 
-        except Exception as e:
-            self.logger.error(f"Error during extraction: {e}")
-        finally:
-            self._close_driver()
+        Args:
+            listing_html: HTML of the listing page
+            job_urls: Jobs of the page to keep (after duplicate and seen-index filtering)
+
+        Returns:
+            Card-level job records in listing order
+        """
+        if not listing_html or not job_urls:
+            return []
+        with timer("listing_parse_seconds"):
+            cards = self.parser.parse_listing_cards(listing_html, listing_url)
+
+        wanted = set(job_urls)
+        scraped_at = datetime.datetime.now().isoformat()
+        records = []
+        for card in cards:
+            if card["Job_URL"] not in wanted:
+                continue
+            wanted.discard(card["Job_URL"])
+            job_data = self._accept_job(JobRecord.from_fields(card, scraped_at=scraped_at, partial=True), job_name)
+            if job_data:
+                records.append(job_data)
+        return records
+
+    def _queue_enrichment(self, records: List[JobRecord], job_name: str) -> None:
+        """Queue the detail pages of listing-only records for a later enrichment run."""
+        if self.extraction_mode == "listing" and self.enrichment_queue is not None and records:
+            self.enrichment_queue.add_many(job_name, (record.job_url for record in records))
+
+    def _iter_enrich(self, job_name: str, progress: Optional[JobProgress] = None) -> Iterator[JobRecord]:
+        """
+        Scrape the detail pages queued for a role by listing-only runs.
+        A batch is removed from the queue only after its records are stored;
+        failed pages stay queued for later runs.
+
+        Yields:
+            Full JobRecords
+        """
+        total = 0
+        after_id = 0
+        while True:
+            batch = self.enrichment_queue.pending(job_name, after_id, self.ENRICH_BATCH)
+            if not batch:
+                break
+            after_id = batch[-1][0]
+            job_urls = [url for _, url in batch]
+
+            batch_data = []
+            self._scrape_detail_pages(job_urls, batch_data, job_name)
+            rejected = set(self._mark_rejected_seen())
+            self.enrichment_queue.done(rejected)
+            yield from batch_data
+
+            enriched = {record.job_url for record in batch_data}
+            self.enrichment_queue.failed(url for url in job_urls if url not in enriched and url not in rejected)
+            self._when_stored(progress, lambda records=batch_data: self._enrichment_stored(records))
+            total += len(batch_data)
+
+        self.logger.info(f"Enriched {total} queued jobs for '{job_name}'",
+                         extra={"role": job_name, "records": total})
+
+    def _enrichment_stored(self, records: List[JobRecord]) -> None:
+        """Remove stored enriched jobs from the queue."""
+        self.enrichment_queue.done(record.job_url for record in records)
+        self._mark_seen(records)
+
+    def _select_new_urls(self, job_hrefs: List[str], seen_job_urls: Set[str], page_no: int) -> Tuple[List[str], bool]:
+        """
+        Drop URLs already seen in this run or scraped on earlier runs.
+
+        Returns:
+            Tuple of (URLs to scrape, whether pagination should stop after this page)
+        """
+        new_hrefs = []
+        for job_url in job_hrefs:
+            if job_url in seen_job_urls:
+                self.logger.debug(f"Skipping duplicate: {job_url}")
+                continue
+            seen_job_urls.add(job_url)
+            new_hrefs.append(job_url)
+
+        if self.seen_index is None or self.replay or not job_hrefs:
+            return new_hrefs, False
+
+        known_flags = self.seen_index.known(new_hrefs)
+        unknown_hrefs = [url for url, known in zip(new_hrefs, known_flags) if not known]
+        known_fraction = 1 - len(unknown_hrefs) / len(job_hrefs)
+        self.logger.debug(f"Page {page_no}: {known_fraction:.0%} of jobs already scraped on earlier runs")
+
+        stop_early = self.stop_known_fraction is not None and known_fraction >= self.stop_known_fraction
+        if stop_early:
+            self.logger.info(f"Page {page_no} is {known_fraction:.0%} known, stopping pagination")
+        return unknown_hrefs, stop_early
+
+    def _mark_seen(self, records: List[JobRecord]) -> None:
+        """
+        Record scraped jobs in the persistent seen index. Listing-only
+        (partial) records are left out, so a later detail run still
+        fetches their detail pages.
+        """
+        if self.seen_index is not None and not self.replay and records:
+            self.seen_index.add_many(record.job_url for record in records if not record.partial)
+
+    def _mark_rejected_seen(self) -> List[str]:
+        """
+        Record the jobs dropped by the location filter since the last call in
+        the seen index; their detail pages need not be fetched again.
 
-        self.logger.info(f"Scraped {len(extracted_data)} jobs for {location or 'all locations'}")
-        time.sleep(self.role_delay)
-        return extracted_data
+        Returns:
+            URLs of the dropped jobs
+        """
+        with self._rejected_lock:
+            rejected, self._rejected_urls = self._rejected_urls, []
+        if self.seen_index is not None and not self.replay and rejected:
+            self.seen_index.add_many(rejected)
+        return rejected
+
+    def _iter_listing_pages(self, job_name: str, location: Optional[str],
+                            start_url: Optional[str] = None, start_page: int = 1):
+        """
+        Walk the paginated search results for a role and location.
+
+        Args:
+            start_url: Listing URL to start from (resuming from a checkpoint)
+            start_page: Page number of start_url
+
+        Yields:
+            Tuple of (page_no, listing_url, job_hrefs, next_url, listing_html) for every listing
+            page that loaded; listing_html is None when neither the page cache nor listing
+            mode needs it
+
+        Returns:
+            True if the walk reached the last page (or max_pages), False if it stopped
+            early (robots.txt disallow, a listing page that failed to load)
+        """
+        listing_url = start_url or self._build_job_url(job_name, location)
+        page_no = start_page
+
+        while page_no <= self.max_pages:
+            self.logger.debug(f"Processing page {page_no}")
+
+            cached_page = self.page_cache.get(listing_url, kind="listing") if self.page_cache else None
+            if cached_page is not None:
+                # Served from the page cache, the browser is not touched
+                job_hrefs, next_url = self.parser.parse_listing(cached_page, listing_url)
+                listing_html = cached_page
+                latency_ms = None
+            elif self.replay:
+                # Nothing further to replay
+                self.logger.info(f"Replay: listing page {page_no} is not cached, stopping")
+                return True
+            else:
+                if self.robots is not None and not self.robots.is_allowed(listing_url):
+                    return False
+                self.rate_limiter.acquire(listing_url)
+                started = time.perf_counter()
+                with metric_labels(location=location):
+                    if not self._load_listing_page(listing_url, page_no):
+                        return False
+
+                    # Collect job URLs
+                    job_elems = self.driver.find_elements(By.CSS_SELECTOR, "a.title")
+                    job_hrefs = [a.get_attribute("href") for a in job_elems if a.get_attribute("href")]
+                    next_url = self._next_page_url(page_no)
+                    elapsed = time.perf_counter() - started
+                    observe("listing_page_load_seconds", elapsed)
+                latency_ms = round(elapsed * 1000)
+                listing_html = None
+                if self.page_cache or self.extraction_mode == "listing":
+                    listing_html = self.driver.page_source
+                if self.page_cache:
+                    self.page_cache.put(listing_url, listing_html, kind="listing")
+
+            if self.per_page_limit:
+                job_hrefs = job_hrefs[:self.per_page_limit]
+
+            self.logger.info(f"Found {len(job_hrefs)} jobs on page {page_no}",
+                             extra={"role": job_name, "location": location, "page": page_no,
+                                    "url": listing_url, "latency_ms": latency_ms})
+            yield page_no, listing_url, job_hrefs, next_url, listing_html
+
+            if not next_url:
+                return True
+
+            listing_url = next_url
+            page_no += 1
+        return True
+
+    def _load_listing_page(self, listing_url: str, page_no: int) -> bool:
+        """
+        Open a listing page and wait for the job links to render.
+        The session is health-checked (and recycled if due) before every
+        listing page, which is the only point where dropping the browser is safe.
+        """
+        driver = self.session.ensure()
+        self.retry_policy.call(lambda: driver.get(listing_url), listing_url)
+        self.session.record_page()
 
-    def _scrape_job(self, job_url: str, extracted_data: list, wait, job_name: str) -> None:
-        """Scrape details from a single job listing."""
         try:
-            self.driver.execute_script("window.open(arguments[0], '_blank');", job_url)
-            self.driver.switch_to.window(self.driver.window_handles[-1])
-            time.sleep(random.uniform(self.min_delay, self.max_delay))
+            WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.title")))
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load job listings on page {page_no}: {e}")
+            return False
 
-            page = BeautifulSoup(self.driver.page_source, "html.parser")
-            job_data = self._extract_job_details(page, job_url)
-            
-            if job_data and self._apply_location_filter(job_data.get("Location", "")):
-                job_data["Job_Type"] = job_name
-                extracted_data.append(job_data)
-                self.logger.debug(f"Extracted: {job_data.get('Title', 'Unknown')}")
+    def _scrape_job(self, job_url: str, job_name: str) -> Optional[JobRecord]:
+        """Fetch and parse a single job listing (thread-safe in worker-pool mode)."""
+        try:
+            page_source = self._fetch_job_page(job_url, job_name)
+            if page_source is None:
+                return None
+            return self._parse_job(page_source, job_url, job_name)
         except Exception as e:
             self.logger.error(f"Error scraping {job_url}: {e}")
+            return None
+
+    def _fetch_job_page(self, job_url: str, job_name: str) -> Optional[str]:
+        """
+        Return the HTML of a detail page from the page cache or the network
+        (None if it is disallowed, not cached in replay mode or unavailable).
+        """
+        cached_page = self.page_cache.get(job_url, kind="detail") if self.page_cache else None
+        if cached_page is not None:
+            return cached_page
+        if self.replay:
+            self.logger.debug(f"Replay: {job_url} is not cached, skipping")
+            return None
+        if self.robots is not None and not self.robots.is_allowed(job_url):
+            return None
+
+        self.rate_limiter.acquire(job_url)
+
+        started = time.perf_counter()
+        page_source = self._fetch_detail_page(job_url)
+        if page_source is None:
+            self.logger.warning(f"No fetcher returned a usable page for {job_url}")
+            return None
+        self.logger.debug(f"Fetched {job_url}", extra={
+            "role": job_name, "url": job_url, "latency_ms": round((time.perf_counter() - started) * 1000)})
+        if self.page_cache:
+            self.page_cache.put(job_url, page_source, kind="detail")
+        return page_source
+
+    def _scrape_jobs_concurrently(self, job_urls: List[str], extracted_data: list, job_name: str) -> None:
+        """
+        Fetch and parse detail pages with the worker pool.
+        Results are appended in listing order.
+        """
+        if not job_urls:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="naukri-detail") as executor:
+            # Workers run in copies of the caller's context so metrics keep their labels
+            context = contextvars.copy_context()
+            results = executor.map(lambda url: context.copy().run(self._scrape_job, url, job_name), job_urls)
+            for job_data in results:
+                if job_data:
+                    extracted_data.append(job_data)
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Start the parse processes on first use; they live until close()."""
+        if self._parse_pool is None:
+            # spawn: forking a process that runs browser and HTTP threads is unsafe
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._parse_pool
+
+    def _scrape_jobs_pipelined(self, job_urls: List[str], extracted_data: list, job_name: str) -> None:
+        """
+        Fetch detail pages with the worker threads and parse them in the parse
+        processes. Fetchers hand each page over through a bounded queue, so
+        they only run ahead of the parsers by parse_queue_size pages.
+        Results are appended in listing order.
+        """
+        if not job_urls:
+            return
+
+        pool = self._get_parse_pool()
+        handoff: "queue.Queue[Optional[Tuple[int, str, Future]]]" = queue.Queue(maxsize=self.parse_queue_size)
+        cancelled = threading.Event()
+
+        def fetch_one(index: int, job_url: str) -> None:
+            if cancelled.is_set():
+                return
+            try:
+                page_source = self._fetch_job_page(job_url, job_name)
+                if page_source is not None:
+                    handoff.put((index, job_url, pool.submit(parse_detail_page, self.parser_backend, page_source)))
+            except Exception as e:
+                self.logger.error(f"Error scraping {job_url}: {e}")
+
+        def produce(context: contextvars.Context) -> None:
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="naukri-detail") as executor:
+                    for index, job_url in enumerate(job_urls):
+                        executor.submit(context.copy().run, fetch_one, index, job_url)
+            finally:
+                handoff.put(None)
+
+        # Fetch workers run in copies of the caller's context so metrics keep their labels
+        producer = threading.Thread(target=produce, args=(contextvars.copy_context(),),
+                                    name="naukri-fetch", daemon=True)
+        producer.start()
+
+        results = {}
+        try:
+            while (item := handoff.get()) is not None:
+                index, job_url, future = item
+                try:
+                    fields, parse_seconds = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error extracting job details from {job_url}: {e}")
+                    continue
+                observe("parse_seconds", parse_seconds)
+                job_data = self._accept_job(self._job_record(fields, job_url), job_name)
+                if job_data:
+                    results[index] = job_data
         finally:
+            # On error stop fetching and drain the queue so the producer can exit
+            cancelled.set()
+            while producer.is_alive():
+                try:
+                    handoff.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            producer.join()
+
+        extracted_data.extend(results[index] for index in sorted(results))
+
+    def _has_required_selectors(self, page_source: str) -> bool:
+        """Cheap check (no parsing) that the HTML contains the fields we need."""
+        return all(pattern.search(page_source) for pattern in self._required_patterns)
+
+    def _fetch_detail_page(self, job_url: str) -> Optional[str]:
+        """
+        Try each fetcher in order and return the first page that contains
+        the required selectors. The last fetcher's result is accepted as-is.
+        """
+        page_source = None
+        for idx, fetcher in enumerate(self.fetchers):
+            is_last = idx == len(self.fetchers) - 1
             try:
-                self.driver.close()
-                self.driver.switch_to.window(self.driver.window_handles[0])
+                with timer("detail_fetch_seconds", fetcher=fetcher.get_name()):
+                    page_source = self.retry_policy.call(lambda: fetcher.fetch(job_url), job_url)
+            except CircuitOpenError as e:
+                # Every fetcher talks to the same host, so don't try the others
+                self.logger.warning(f"Skipping {job_url}: {e}")
+                return None
             except Exception as e:
-                self.logger.debug(f"Error closing tab: {e}")
+                self.logger.debug(f"Fetcher={fetcher.get_name()} failed for {job_url}: {e}")
+                page_source = None
+                continue
+
+            if page_source:
+                inc("bytes_fetched_total", len(page_source), fetcher=fetcher.get_name())
+            if page_source and (is_last or self._has_required_selectors(page_source)):
+                self.logger.debug(f"Fetcher={fetcher.get_name()} served {job_url}")
+                return page_source
+            self.logger.debug(f"Fetcher={fetcher.get_name()} page incomplete for {job_url}, falling back")
+        return page_source
+
+    def _parse_job(self, page_source: str, job_url: str, job_name: str) -> Optional[JobRecord]:
+        """Parse a detail page and apply the location filter."""
+        with timer("parse_seconds"):
+            job_data = self._extract_job_details(page_source, job_url)
+        return self._accept_job(job_data, job_name)
+
+    def _accept_job(self, job_data: Optional[JobRecord], job_name: str) -> Optional[JobRecord]:
+        """Apply the location filter and tag the record with its role."""
+        if not job_data:
+            return None
+        if not self._apply_location_filter(job_data.location or ""):
+            with self._rejected_lock:
+                self._rejected_urls.append(job_data.job_url)
+            return None
+        job_data.job_type = job_name
+        self.logger.debug(f"Extracted: {job_data.title}")
+        return job_data
 
-    def _go_to_next_page(self, current_page: int) -> bool:
-        """Navigate to the next page of results."""
+    def _next_page_url(self, current_page: int) -> Optional[str]:
+        """Return the URL of the next page of results, or None on the last page."""
         try:
             next_btn = self.driver.find_element(By.CSS_SELECTOR, "a.styles_btn-secondary__2AsIP[href*='-jobs-']")
             next_href = next_btn.get_attribute("href")
             if not next_href:
                 self.logger.warning(f"No next link on page {current_page}")
-                return False
-            self.driver.get(next_href)
-            return True
+                return None
+            return next_href
         except Exception as e:
             self.logger.debug(f"No next button found: {e}")
-            return False
+            return None
 
     def get_name(self) -> str:
         """Return extractor name."""
@@ -600,6 +1026,7 @@ if __name__ == "__main__":
         locations=['bengaluru', 'mumbai'],
     )
     
-    jobs = extractor.extract("python-developer")
-    df = pd.DataFrame(jobs)
+    with extractor:
+        jobs = extractor.extract("python-developer")
+    df = pd.DataFrame([job.to_dict() for job in jobs])
     print(df.head())
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Long-lived Selenium WebDriver sessions shared across extraction calls.
+Starts Chrome lazily, restarts it after a crash and recycles it after a
+configurable number of page loads to keep memory in check.
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from contextlib import contextmanager
+from typing import List, Optional
+import logging
+import queue
+
+from ...utils.metrics import timer
+
+
+class DriverSession:
+    """
+    Owns a single Chrome WebDriver and hands it out on demand.
+
+    Usage:
+        with DriverSession(recycle_after=200) as session:
+            driver = session.ensure()
+            driver.get(url)
+            session.record_page()
+    """
+
+    USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/117.0 Safari/537.36")
+
+    # chromedriver binary path, resolved once per process
+    _driver_path: Optional[str] = None
+
+    def __init__(self, recycle_after: Optional[int] = None, headless: bool = True, logger=None):
+        """
+        Initialize the driver session.
+
+        Args:
+            recycle_after: Restart the browser after this many page loads (None disables recycling)
+            headless: Run Chrome without a GUI
+            logger: Logger instance
+        """
+        self.recycle_after = recycle_after
+        self.headless = headless
+        self.logger = logger or logging.getLogger("data_collection")
+        self.driver = None
+        self.service = None
+        self.pages_loaded = 0
+        self.restarts = 0
+
+    def _build_options(self) -> webdriver.ChromeOptions:
+        """Build Chrome options used for every browser instance."""
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument(f"user-agent={self.USER_AGENT}")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        return options
+
+    def start(self):
+        """Start a new browser instance."""
+        try:
+            if DriverSession._driver_path is None:
+                DriverSession._driver_path = ChromeDriverManager().install()
+            self.service = Service(DriverSession._driver_path)
+            with timer("driver_startup_seconds"):
+                self.driver = webdriver.Chrome(service=self.service, options=self._build_options())
+            self.pages_loaded = 0
+            self.logger.info("WebDriver initialized successfully")
+        except Exception as e:
+            self.logger.error(f"Failed to initialize WebDriver: {e}")
+            self.driver = None
+            raise
+        return self.driver
+
+    def close(self):
+        """Safely close the browser if it is running."""
+        try:
+            if self.driver:
+                self.driver.quit()
+                self.logger.info("WebDriver closed successfully")
+        except Exception as e:
+            self.logger.error(f"Error closing WebDriver: {e}")
+        finally:
+            self.driver = None
+            self.service = None
+
+    def restart(self):
+        """Close the current browser and start a fresh one."""
+        self.close()
+        self.restarts += 1
+        return self.start()
+
+    def is_alive(self) -> bool:
+        """Health check: a crashed or closed browser raises on any command."""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception as e:
+            self.logger.warning(f"WebDriver health check failed: {e}")
+            return False
+
+    def needs_recycle(self) -> bool:
+        """Check whether the page budget of the current browser is used up."""
+        return bool(self.recycle_after) and self.pages_loaded >= self.recycle_after
+
+    def ensure(self):
+        """
+        Return a healthy driver, starting, restarting or recycling it as needed.
+        Call this only at points where losing the browser state is safe.
+        """
+        if self.driver is None:
+            return self.start()
+        if not self.is_alive():
+            self.logger.warning("WebDriver is unresponsive, restarting")
+            return self.restart()
+        if self.needs_recycle():
+            self.logger.info(f"Recycling WebDriver after {self.pages_loaded} pages")
+            return self.restart()
+        return self.driver
+
+    def record_page(self, count: int = 1):
+        """Count page loads towards the recycle budget."""
+        self.pages_loaded += count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class DriverPool:
+    """
+    Fixed-size pool of headless DriverSessions for fetching detail pages
+    concurrently. Browsers are started lazily on first borrow.
+
+    Usage:
+        with pool.borrow() as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, size: int, recycle_after: Optional[int] = None, logger=None):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Number of browser workers
+            recycle_after: Page budget per browser before it is recycled
+            logger: Logger instance
+        """
+        if size < 1:
+            raise ValueError("DriverPool size must be at least 1")
+        self.size = size
+        self.logger = logger or logging.getLogger("data_collection")
+        self.sessions: List[DriverSession] = [
+            DriverSession(recycle_after=recycle_after, logger=self.logger) for _ in range(size)
+        ]
+        self._idle = queue.Queue()
+        for session in self.sessions:
+            self._idle.put(session)
+
+    @contextmanager
+    def borrow(self):
+        """Check out a healthy driver for exclusive use by the calling worker."""
+        session = self._idle.get()
+        try:
+            yield session.ensure()
+        finally:
+            session.record_page()
+            self._idle.put(session)
+
+    def close(self):
+        """Shut down every browser in the pool."""
+        for session in self.sessions:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,143 @@
+"""
+Pluggable page fetchers for job detail pages.
+HTTPFetcher downloads server-rendered HTML over a pooled keep-alive
+session; SeleniumFetcher renders the page in a browser and is used as
+the fallback when the static HTML lacks the fields we parse.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from .driver_session import DriverSession, DriverPool
+from ...utils.backoff import HTTPStatusError, parse_retry_after
+
+
+class PageFetcher(ABC):
+    """
+    Abstract base class for all page fetchers.
+    Each fetcher must implement fetch(), returning the page HTML or None.
+    """
+    @abstractmethod
+    def fetch(self, url: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """Return fetcher name (e.g., 'http', 'selenium')"""
+        pass
+
+    def close(self) -> None:
+        """Release network or browser resources held by the fetcher."""
+        pass
+
+
+class HTTPFetcher(PageFetcher):
+    """Fetches pages with a shared requests.Session (connection pooling + keep-alive)."""
+
+    def __init__(self, timeout: float = 10, pool_size: int = 10,
+                 user_agent: str = DriverSession.USER_AGENT, logger=None):
+        """
+        Initialize the HTTP fetcher.
+
+        Args:
+            timeout: Request timeout in seconds
+            pool_size: Max pooled connections per host (should cover the number of workers)
+            user_agent: User-Agent header sent with every request
+            logger: Logger instance
+        """
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger("data_collection")
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
+        })
+
+    def fetch(self, url: str) -> Optional[str]:
+        response = self.session.get(url, timeout=self.timeout)
+        if response.status_code == 429 or response.status_code >= 500:
+            # Transient: let the retry policy back off (honouring Retry-After)
+            raise HTTPStatusError(url, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+        if response.status_code != 200:
+            self.logger.debug(f"HTTP {response.status_code} for {url}")
+            return None
+        return response.text
+
+    def get_name(self) -> str:
+        return "http"
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class SeleniumFetcher(PageFetcher):
+    """
+    Renders pages in Chrome. With a DriverPool each call borrows a pooled
+    browser; otherwise the page is opened in a new tab of the shared session
+    so the listing page in the first tab stays intact.
+    """
+
+    def __init__(self, session: DriverSession, pool: Optional[DriverPool] = None,
+                 wait_selector: Optional[str] = None, timeout: float = 10, logger=None):
+        """
+        Initialize the Selenium fetcher.
+
+        Args:
+            session: Shared browser session (used when no pool is given)
+            pool: Optional browser pool for concurrent fetching
+            wait_selector: CSS selector to wait for before reading the page
+            timeout: Max seconds to wait for wait_selector
+            logger: Logger instance
+        """
+        self.session = session
+        self.pool = pool
+        self.wait_selector = wait_selector
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger("data_collection")
+
+    def _wait_for_render(self, driver) -> None:
+        """Wait until the required element is rendered (best effort)."""
+        if not self.wait_selector:
+            return
+        try:
+            WebDriverWait(driver, self.timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self.wait_selector)))
+        except Exception as e:
+            self.logger.debug(f"Timed out waiting for '{self.wait_selector}': {e}")
+
+    def fetch(self, url: str) -> Optional[str]:
+        if self.pool:
+            with self.pool.borrow() as driver:
+                driver.get(url)
+                self._wait_for_render(driver)
+                return driver.page_source
+
+        driver = self.session.driver or self.session.ensure()
+        driver.execute_script("window.open(arguments[0], '_blank');", url)
+        self.session.record_page()
+        try:
+            driver.switch_to.window(driver.window_handles[-1])
+            self._wait_for_render(driver)
+            return driver.page_source
+        finally:
+            try:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+            except Exception as e:
+                self.logger.debug(f"Error closing tab: {e}")
+
+    def get_name(self) -> str:
+        return "selenium"
@@ -0,0 +1,390 @@
+"""
+Selectable HTML parser backends for Naukri job detail (and listing) pages.
+
+All backends share the same field extraction logic (DetailPageParser.parse)
+and the same CSS selectors; they only differ in how a document is parsed
+and queried:
+    bs4        - BeautifulSoup + html.parser (pure Python, always available)
+    lxml       - lxml.html with selectors compiled to XPath once
+    selectolax - lexbor engine via selectolax (fastest)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+import logging
+import re
+import time
+
+from bs4 import BeautifulSoup
+import soupsieve
+
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator
+except ImportError:  # optional backend
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional backend
+    LexborHTMLParser = None
+
+
+logger = logging.getLogger("data_collection")
+
+# CSS selectors for every field of a detail page
+SELECTORS = {
+    "title": "h1.styles_jd-header-title__rZwM1",
+    "company": "a[href*='jobs-careers']",
+    "experience": "div.styles_jhc__exp__k_giM span",
+    "salary": "div.styles_jhc__salary__jdfEC span",
+    "location": "span.styles_jhc__location__W_pVs",
+    "stats": "div.styles_jhc__jd-stats__KrId0 span.styles_jhc__stat__PgY67",
+    "similar_posted": "div.styles_SJC__posted-date__eiY9o span",
+    "details": "div.styles_other-details__oEN4O div.styles_details__Y424J",
+    "education": "div.styles_education__KXFkO",
+    "skill_chips": "div.styles_key-skill__GIPn_ a.styles_chip__7YCfG",
+    "star_icon": "i.ni-icon-jd-save",
+    "description": "div.styles_JDC__dang-inner-html__h0K4t",
+    "label": "label",
+    "span": "span",
+    # listing (search results) pages
+    "job_links": "a.title",
+    "next_page": "a.styles_btn-secondary__2AsIP[href*='-jobs-']",
+    # job cards of a listing page
+    "job_cards": "div.srp-jobtuple-wrapper",
+    "card_company": "a.comp-name",
+    "card_experience": "span.expwdth",
+    "card_salary": "span.sal-wrap span",
+    "card_location": "span.locWdth",
+    "card_skills": "ul.tags-gt li",
+    "card_posted": "span.job-post-day",
+    "card_description": "span.job-desc",
+}
+
+# "DD Month YYYY", used as a best-effort last date to apply
+DATE_PATTERN = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+
+
+class DetailPageParser(ABC):
+    """
+    Base class for parser backends. Subclasses implement document loading
+    and the query primitives; parse() turns a page into a field dict.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def load(self, html: str):
+        """Parse HTML into the backend's document object."""
+        pass
+
+    @abstractmethod
+    def select_first(self, node, key: str):
+        """Return the first descendant of node matching SELECTORS[key], or None."""
+        pass
+
+    @abstractmethod
+    def select_all(self, node, key: str) -> list:
+        """Return all descendants of node matching SELECTORS[key]."""
+        pass
+
+    @abstractmethod
+    def text(self, node, separator: str = "") -> str:
+        """Stripped text fragments of node joined by separator (like bs4 get_text(sep, strip=True))."""
+        pass
+
+    @abstractmethod
+    def attr(self, node, name: str) -> Optional[str]:
+        """Value of an attribute of node, or None."""
+        pass
+
+    def first_text(self, node, key: str, default: str = "NA", separator: str = "") -> str:
+        """Text of the first match of SELECTORS[key], or default."""
+        elem = self.select_first(node, key)
+        return self.text(elem, separator) if elem is not None else default
+
+    def extract_timestamps(self, doc, description: str = "") -> Tuple[str, str]:
+        """
+        Extract job posting date and last date to apply.
+
+        Args:
+            description: Text of the job description, searched for the apply-by date
+
+        Returns:
+            Tuple of (posted_date, last_apply_date)
+        """
+        posted_date = "NA"
+        last_apply_date = "NA"
+
+        try:
+            # Strategy 1: Primary selector - found in stats section
+            stat_texts = []
+            for stat in self.select_all(doc, "stats"):
+                label = self.select_first(stat, "label")
+                value_span = self.select_first(stat, "span")
+                if label is not None and value_span is not None:
+                    value = self.text(value_span)
+                    stat_texts.append(value)
+                    if "posted" in self.text(label).lower():
+                        posted_date = value
+
+            # Strategy 2: Alternative selector - similar jobs card
+            if posted_date == "NA":
+                posted_date = self.first_text(doc, "similar_posted")
+
+            # Strategy 3: first "DD Month YYYY" in the header stats or the description
+            for text in (*stat_texts, description):
+                date_match = DATE_PATTERN.search(text)
+                if date_match:
+                    last_apply_date = date_match.group(1)
+                    break
+        except Exception as e:
+            logger.debug(f"Error extracting timestamps: {e}")
+
+        return posted_date, last_apply_date
+
+    def extract_other_details(self, doc) -> Dict[str, str]:
+        """Extract miscellaneous job details (Role, Industry Type, ...)."""
+        details = {}
+        try:
+            for div in self.select_all(doc, "details"):
+                label = self.select_first(div, "label")
+                span = self.select_first(div, "span")
+                if label is not None and span is not None:
+                    key = self.text(label).replace(":", "")
+                    details[key] = self.text(span, " ")
+        except Exception as e:
+            logger.debug(f"Error extracting other details: {e}")
+        return details
+
+    def extract_skills(self, doc) -> Tuple[List[str], List[str]]:
+        """Extract and categorize skills into (star_skills, normal_skills)."""
+        star_skills, normal_skills = [], []
+        try:
+            for chip in self.select_all(doc, "skill_chips"):
+                skill_name = self.first_text(chip, "span")
+                if skill_name != "NA":
+                    if self.select_first(chip, "star_icon") is not None:
+                        star_skills.append(skill_name)
+                    else:
+                        normal_skills.append(skill_name)
+        except Exception as e:
+            logger.debug(f"Error extracting skills: {e}")
+        return star_skills, normal_skills
+
+    def parse_listing(self, html: str, page_url: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Extract job links and the next page link from a search results page.
+        Relative links are resolved against page_url.
+
+        Returns:
+            Tuple of (job_hrefs, next_page_url or None)
+        """
+        doc = self.load(html)
+        job_hrefs = []
+        for link in self.select_all(doc, "job_links"):
+            href = self.attr(link, "href")
+            if href:
+                job_hrefs.append(urljoin(page_url, href))
+
+        next_elem = self.select_first(doc, "next_page")
+        next_href = self.attr(next_elem, "href") if next_elem is not None else None
+        return job_hrefs, urljoin(page_url, next_href) if next_href else None
+
+    def parse_listing_cards(self, html: str, page_url: str) -> List[dict]:
+        """
+        Extract the card-level fields of every job on a search results page.
+        Cards carry no starred skills, education, apply-by date or other
+        details; those fields hold the detail parser's missing-value defaults
+        ("Not Available" for education, "NA" otherwise) until the detail page
+        is scraped.
+
+        Returns:
+            List of partial job records in listing order (cards without a link are skipped)
+        """
+        doc = self.load(html)
+        cards = []
+        for card in self.select_all(doc, "job_cards"):
+            link = self.select_first(card, "job_links")
+            href = self.attr(link, "href") if link is not None else None
+            if not href:
+                continue
+            skills = [self.text(tag) for tag in self.select_all(card, "card_skills")]
+            cards.append({
+                "Title": self.text(link),
+                "Company": self.first_text(card, "card_company"),
+                "Experience": self.first_text(card, "card_experience"),
+                "Salary": self.first_text(card, "card_salary"),
+                "Location": self.first_text(card, "card_location"),
+                "Education": "Not Available",  # as on detail pages without an education section
+                "Star_Skills": [],
+                "Normal_Skills": [skill for skill in skills if skill],
+                "Posted_Date": self.first_text(card, "card_posted"),
+                "Last_Apply_Date": "NA",
+                "Description": self.first_text(card, "card_description", separator=" "),
+                "Job_URL": urljoin(page_url, href),
+            })
+        return cards
+
+    def parse(self, html: str) -> dict:
+        """
+        Extract all fields of a detail page.
+
+        Returns:
+            Dictionary of page fields; other details are merged in under their labels
+        """
+        doc = self.load(html)
+
+        title = self.first_text(doc, "title")
+        company = self.first_text(doc, "company")
+        exp = self.first_text(doc, "experience")
+        salary = self.first_text(doc, "salary")
+        location = self.first_text(doc, "location")
+        details = self.extract_other_details(doc)
+        education = self.first_text(doc, "education", default="Not Available")
+        star_skills, normal_skills = self.extract_skills(doc)
+        job_description = self.first_text(doc, "description", separator=" ")
+        posted_date, last_apply_date = self.extract_timestamps(doc, job_description)
+
+        return {
+            "Title": title,
+            "Company": company,
+            "Experience": exp,
+            "Salary": salary,
+            "Location": location,
+            "Education": education,
+            "Star_Skills": star_skills,
+            "Normal_Skills": normal_skills,
+            "Posted_Date": posted_date,
+            "Last_Apply_Date": last_apply_date,
+            **details,
+            "Description": job_description,
+        }
+
+
+class BS4Parser(DetailPageParser):
+    """BeautifulSoup with html.parser and soupsieve-precompiled selectors."""
+
+    name = "bs4"
+
+    def __init__(self):
+        self.selectors = {key: soupsieve.compile(css) for key, css in SELECTORS.items()}
+
+    def load(self, html: str):
+        return BeautifulSoup(html, "html.parser")
+
+    def select_first(self, node, key: str):
+        return self.selectors[key].select_one(node)
+
+    def select_all(self, node, key: str) -> list:
+        return self.selectors[key].select(node)
+
+    def text(self, node, separator: str = "") -> str:
+        return node.get_text(separator, strip=True)
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+
+class LxmlParser(DetailPageParser):
+    """lxml.html with every CSS selector translated to a compiled XPath once."""
+
+    name = "lxml"
+
+    def __init__(self):
+        if lxml is None:
+            raise ImportError("The 'lxml' parser backend requires `pip install lxml cssselect`")
+        translator = HTMLTranslator()
+        # descendant:: (not descendant-or-self::) so a node never matches itself
+        self.selectors = {
+            key: etree.XPath(translator.css_to_xpath(css, prefix="descendant::"))
+            for key, css in SELECTORS.items()
+        }
+
+    def load(self, html: str):
+        return lxml.html.document_fromstring(html)
+
+    def select_first(self, node, key: str):
+        matches = self.selectors[key](node)
+        return matches[0] if matches else None
+
+    def select_all(self, node, key: str) -> list:
+        return self.selectors[key](node)
+
+    def text(self, node, separator: str = "") -> str:
+        return separator.join(fragment.strip() for fragment in node.itertext() if fragment.strip())
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.get(name)
+
+
+class SelectolaxParser(DetailPageParser):
+    """selectolax (lexbor) backend. Lexbor caches parsed selectors internally."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        if LexborHTMLParser is None:
+            raise ImportError("The 'selectolax' parser backend requires `pip install selectolax`")
+
+    def load(self, html: str):
+        return LexborHTMLParser(html)
+
+    def select_all(self, node, key: str) -> list:
+        # lexbor includes the context node itself in matches; drop it
+        node_id = getattr(node, "mem_id", None)
+        return [match for match in node.css(SELECTORS[key]) if match.mem_id != node_id]
+
+    def select_first(self, node, key: str):
+        matches = self.select_all(node, key)
+        return matches[0] if matches else None
+
+    def text(self, node, separator: str = "") -> str:
+        fragments = (fragment.strip() for fragment in node.text(deep=True, separator="\x00").split("\x00"))
+        return separator.join(fragment for fragment in fragments if fragment)
+
+    def attr(self, node, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+
+PARSER_BACKENDS = {
+    BS4Parser.name: BS4Parser,
+    LxmlParser.name: LxmlParser,
+    SelectolaxParser.name: SelectolaxParser,
+}
+
+
+def get_parser(backend: str = "bs4") -> DetailPageParser:
+    """
+    Create a parser backend by name.
+
+    Raises:
+        ValueError: Unknown backend name
+        ImportError: Backend library is not installed
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}'. Supported: {list(PARSER_BACKENDS)}")
+    return PARSER_BACKENDS[backend]()
+
+
+# Parser instances of a parse worker process, one per backend
+_process_parsers: Dict[str, DetailPageParser] = {}
+
+
+def parse_detail_page(backend: str, html: str) -> Tuple[dict, float]:
+    """
+    Parse a detail page in a worker process (module-level so it can be pickled
+    for a ProcessPoolExecutor). Each process builds its parser once.
+
+    Returns:
+        Tuple of (page fields, parse time in seconds)
+    """
+    parser = _process_parsers.get(backend)
+    if parser is None:
+        parser = _process_parsers[backend] = get_parser(backend)
+    started = time.perf_counter()
+    fields = parser.parse(html)
+    return fields, time.perf_counter() - started
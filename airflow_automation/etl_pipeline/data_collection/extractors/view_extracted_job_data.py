@@ -43,7 +43,7 @@ def view_extracted_data():
     logger.info(f"✅ Extracted {len(jobs)} jobs\n")
     
     # Create DataFrame
-    df = pd.DataFrame(jobs)
+    df = pd.DataFrame([job.to_dict() for job in jobs])
     
     # Display column information
     logger.info("="*80)
@@ -4,9 +4,21 @@ Loads configuration and orchestrates the scraping process
 """
 
 from .pipeline import Pipeline  # Same folder
+from .async_pipeline import AsyncPipeline
 from .extractors.NaukriExtractor import NaukriJobExtractor
+from .extractors.AsyncNaukriExtractor import AsyncNaukriJobExtractor
 from .storage.CSVStoragehandler import CSVStorageHandler
+from .storage.ParquetStoragehandler import ParquetStorageHandler
+from .storage.SQLiteStoragehandler import SQLiteStorageHandler
+from .state.page_cache import PageCache
+from .state.seen_index import SeenIndex
+from .state.checkpoint import CheckpointStore
+from .state.enrichment_queue import EnrichmentQueue
+from .state.dedup_index import DedupIndex
 from ..utils.logger import setup_logging  # One level up to etl_pipeline
+from ..utils.rate_limiter import RateLimiter
+from ..utils.backoff import RetryPolicy, CircuitBreaker
+from ..utils.robots import RobotsCache
 
 
 import yaml
@@ -24,17 +36,178 @@ def load_config(config_path=None) -> dict:
     with open(config_path, "r") as f:
         return yaml.safe_load(f)
     
-def initialize_extractors(config: dict, logger) -> List:
+def initialize_page_cache(config: dict, logger, replay: bool = False) -> Optional[PageCache]:
+    """Open the on-disk page cache if enabled (always enabled in replay mode)."""
+    cache_config = config.get('cache', {})
+    replay = replay or cache_config.get('replay', False)
+    if not (cache_config.get('enabled', False) or replay):
+        return None
+
+    return PageCache(
+        path=cache_config.get('path', 'etl_pipeline/data/cache/pages.sqlite'),
+        ttl_hours=cache_config.get('ttl_hours'),
+        max_size_mb=cache_config.get('max_size_mb'),
+        replay=replay,
+        logger=logger
+    )
+
+def initialize_seen_index(config: dict, logger, replay: bool = False) -> Optional[SeenIndex]:
+    """Open the persistent seen-URL index if incremental crawling is enabled (never in replay mode)."""
+    incremental_config = config.get('incremental', {})
+    if replay or not incremental_config.get('enabled', False):
+        return None
+
+    return SeenIndex(
+        path=incremental_config.get('path', 'etl_pipeline/data/raw/seen_urls.sqlite'),
+        logger=logger
+    )
+
+def initialize_checkpoint(config: dict, logger, replay: bool = False) -> Optional[CheckpointStore]:
+    """Open the checkpoint store if enabled (never in replay mode)."""
+    checkpoint_config = config.get('checkpoint', {})
+    if replay or not checkpoint_config.get('enabled', False):
+        return None
+
+    return CheckpointStore(
+        path=checkpoint_config.get('path', 'etl_pipeline/data/state/checkpoint.sqlite'),
+        logger=logger
+    )
+
+def initialize_enrichment_queue(config: dict, logger, replay: bool = False) -> Optional[EnrichmentQueue]:
+    """Open the queue of jobs awaiting their detail page (always needed in enrich mode, never in replay mode)."""
+    enrichment_config = config.get('enrichment', {})
+    mode = config['pipeline'].get('extraction_mode', 'detail')
+    if mode == 'detail' or (mode == 'listing' and (replay or not enrichment_config.get('enabled', False))):
+        return None
+
+    return EnrichmentQueue(
+        path=enrichment_config.get('path', 'etl_pipeline/data/state/enrichment.sqlite'),
+        max_attempts=enrichment_config.get('max_attempts', 3),
+        logger=logger
+    )
+
+def initialize_dedup_index(config: dict, logger, replay: bool = False) -> Optional[DedupIndex]:
+    """Open the index of stored jobs if deduplication is enabled (never in replay mode)."""
+    dedup_config = config.get('dedup', {})
+    if replay or not dedup_config.get('enabled', False):
+        return None
+
+    return DedupIndex(
+        path=dedup_config.get('path', 'etl_pipeline/data/state/dedup.sqlite'),
+        max_distance=dedup_config.get('max_distance', 6),
+        min_tokens=dedup_config.get('min_tokens', 30),
+        logger=logger
+    )
+
+def initialize_rate_limiter(config: dict, processes: int = 1) -> RateLimiter:
+    """
+    Per-host token bucket shared by every extractor of a process.
+
+    Buckets are not shared between processes, so with several scraping
+    processes at once (mapped Airflow tasks) each gets its share of the
+    configured rate and burst.
+    """
+    pipeline_config = config['pipeline']
+    processes = max(1, processes)
+    return RateLimiter(
+        requests_per_second=pipeline_config.get('requests_per_second', 0.5) / processes,
+        burst=max(1, pipeline_config.get('burst', 1) / processes)
+    )
+
+def initialize_robots(config: dict, logger, rate_limiter: Optional[RateLimiter] = None,
+                      replay: bool = False) -> Optional[RobotsCache]:
+    """Open the robots.txt cache if enabled (never in replay mode); Crawl-delays slow down the rate limiter."""
+    robots_config = config.get('robots', {})
+    if replay or not robots_config.get('enabled', False):
+        return None
+
+    return RobotsCache(
+        path=robots_config.get('path', 'etl_pipeline/data/state/robots.sqlite'),
+        ttl_hours=robots_config.get('ttl_hours', 24),
+        user_agent=robots_config.get('user_agent', '*'),
+        rate_limiter=rate_limiter,
+        logger=logger
+    )
+
+def initialize_retry_policy(config: dict, retry_exceptions: tuple = ()) -> RetryPolicy:
+    """Retry/backoff policy with a per-host circuit breaker, shared by every extractor of a run."""
+    retry_config = config.get('retry', {})
+    breaker = None
+    if retry_config.get('circuit_breaker', True):
+        breaker = CircuitBreaker(
+            failure_threshold=retry_config.get('failure_threshold', 0.5),
+            window=retry_config.get('window', 20),
+            min_calls=retry_config.get('min_calls', 5),
+            reset_timeout=retry_config.get('reset_timeout', 60)
+        )
+    return RetryPolicy(
+        max_retries=retry_config.get('max_retries', 3),
+        base_delay=retry_config.get('base_delay', 2),
+        max_delay=retry_config.get('max_delay', 60),
+        max_retry_after=retry_config.get('max_retry_after', 300),
+        retry_exceptions=retry_exceptions,
+        breaker=breaker
+    )
+
+def initialize_extractors(config: dict, logger, page_cache: Optional[PageCache] = None,
+                          seen_index: Optional[SeenIndex] = None, rate_limiter: Optional[RateLimiter] = None,
+                          robots: Optional[RobotsCache] = None,
+                          enrichment_queue: Optional[EnrichmentQueue] = None) -> List:
     """Initialize extractors based on configuration."""
     pipeline_config = config['pipeline']
+    rate_limiter = rate_limiter or initialize_rate_limiter(config)
 
     extractors = [
         NaukriJobExtractor(
             max_pages=pipeline_config['max_pages'],
             per_page_limit=pipeline_config['per_page_limit'],
-            min_delay=pipeline_config['min_delay'],
-            max_delay=pipeline_config['max_delay'],
-            role_delay=pipeline_config['role_delay'],
+            driver_recycle_pages=pipeline_config.get('driver_recycle_pages'),
+            workers=pipeline_config.get('workers', 1),
+            rate_limiter=rate_limiter,
+            retry_policy=initialize_retry_policy(config, NaukriJobExtractor.RETRY_EXCEPTIONS),
+            fetch_mode=pipeline_config.get('fetch_mode', 'auto'),
+            parser=pipeline_config.get('parser', 'bs4'),
+            parse_workers=pipeline_config.get('parse_workers', 0),
+            parse_queue_size=pipeline_config.get('parse_queue_size'),
+            page_cache=page_cache,
+            seen_index=seen_index,
+            stop_known_fraction=config.get('incremental', {}).get('stop_known_fraction'),
+            robots=robots,
+            extraction_mode=pipeline_config.get('extraction_mode', 'detail'),
+            enrichment_queue=enrichment_queue,
+            logger=logger
+        )
+    ]
+
+    return extractors
+
+def initialize_async_extractors(config: dict, logger, page_cache: Optional[PageCache] = None,
+                                seen_index: Optional[SeenIndex] = None, rate_limiter: Optional[RateLimiter] = None,
+                                robots: Optional[RobotsCache] = None,
+                                enrichment_queue: Optional[EnrichmentQueue] = None) -> List:
+    """Initialize asyncio extractors based on configuration."""
+    pipeline_config = config['pipeline']
+    rate_limiter = rate_limiter or initialize_rate_limiter(config)
+
+    extractors = [
+        AsyncNaukriJobExtractor(
+            max_pages=pipeline_config['max_pages'],
+            per_page_limit=pipeline_config['per_page_limit'],
+            rate_limiter=rate_limiter,
+            retry_policy=initialize_retry_policy(config, AsyncNaukriJobExtractor.RETRY_EXCEPTIONS),
+            max_connections=pipeline_config.get('max_connections', 8),
+            listing_browsers=pipeline_config.get('listing_browsers', 2),
+            driver_recycle_pages=pipeline_config.get('driver_recycle_pages'),
+            fetch_mode=pipeline_config.get('fetch_mode', 'auto'),
+            parser=pipeline_config.get('parser', 'bs4'),
+            parse_workers=pipeline_config.get('parse_workers', 0),
+            parse_queue_size=pipeline_config.get('parse_queue_size'),
+            page_cache=page_cache,
+            seen_index=seen_index,
+            stop_known_fraction=config.get('incremental', {}).get('stop_known_fraction'),
+            robots=robots,
+            extraction_mode=pipeline_config.get('extraction_mode', 'detail'),
+            enrichment_queue=enrichment_queue,
             logger=logger
         )
     ]
@@ -48,7 +221,9 @@ def initialize_handlers(config: dict, logger) -> List:
 
     # FIXED: Create instances directly without double-calling
     handler_map = {
-        'CSVStorageHandler': CSVStorageHandler(logger=logger),
+        'CSVStorageHandler': CSVStorageHandler(buffer_size=config['storage'].get('csv_buffer_size', 0), logger=logger),
+        'ParquetStorageHandler': ParquetStorageHandler(logger=logger),
+        'SQLiteStorageHandler': SQLiteStorageHandler(logger=logger),
         # 'JSONStorageHandler': JSONStorageHandler(logger=logger),
     }
 
@@ -83,39 +258,91 @@ def get_jobs_from_config(config: dict, group: str = None) -> List:
     
     return all_jobs
 
-def main(group: str = None):
+def main(group: str = None, engine: str = None, replay: bool = False, resume: bool = False,
+         mode: str = None):
     """
     Main execution function.
     
     Args:
         group: Optional job group to process (e.g., 'group1')
+        engine: 'sync' or 'async' (defaults to pipeline.engine in config)
+        replay: Re-parse cached pages only, without touching the network
+        resume: Continue an interrupted run from its checkpoint
+        mode: 'detail', 'listing' or 'enrich' (defaults to pipeline.extraction_mode in config)
     """
+    # Load configuration
+    config = load_config()
+    if mode:
+        config['pipeline']['extraction_mode'] = mode
+
     # Setup logging
     if not logging.getLogger().hasHandlers():
-        setup_logging()
+        logging_config = config.get('logging', {})
+        setup_logging(use_queue=logging_config.get('queue', True), json_logs=logging_config.get('json', False))
     logger = logging.getLogger("pipeline")
     
-    # Load configuration
-    config = load_config()
-    
     # Initialize components
-    extractors = initialize_extractors(config, logger)
+    engine = engine or config['pipeline'].get('engine', 'sync')
+    page_cache = initialize_page_cache(config, logger, replay)
+    seen_index = initialize_seen_index(config, logger, replay)
+    checkpoint = initialize_checkpoint(config, logger, replay)
+    rate_limiter = initialize_rate_limiter(config)
+    robots = initialize_robots(config, logger, rate_limiter, replay)
+    enrichment_queue = initialize_enrichment_queue(config, logger, replay)
+    dedup = initialize_dedup_index(config, logger, replay)
     handlers = initialize_handlers(config, logger)
     jobs = get_jobs_from_config(config, group)
     filedirectory = config['storage']['filedirectory']
     
 
     # Create and run pipeline
-    pipeline = Pipeline(
-        extractors=extractors,
-        handlers=handlers,
-        jobs=jobs,
-        filedirectory=filedirectory,
-        logger=logger
-    )
+    if engine == 'async':
+        pipeline = AsyncPipeline(
+            extractors=initialize_async_extractors(config, logger, page_cache, seen_index, rate_limiter, robots,
+                                                   enrichment_queue),
+            handlers=handlers,
+            jobs=jobs,
+            filedirectory=filedirectory,
+            max_concurrency=config['pipeline'].get('max_concurrency', 4),
+            job_timeout=config['pipeline'].get('job_timeout'),
+            batch_size=config['pipeline'].get('batch_size', 200),
+            checkpoint=checkpoint,
+            resume=resume,
+            metrics_path=config.get('metrics', {}).get('prometheus_file'),
+            dedup=dedup,
+            logger=logger
+        )
+    else:
+        pipeline = Pipeline(
+            extractors=initialize_extractors(config, logger, page_cache, seen_index, rate_limiter, robots,
+                                             enrichment_queue),
+            handlers=handlers,
+            jobs=jobs,
+            filedirectory=filedirectory,
+            batch_size=config['pipeline'].get('batch_size', 200),
+            checkpoint=checkpoint,
+            resume=resume,
+            metrics_path=config.get('metrics', {}).get('prometheus_file'),
+            dedup=dedup,
+            logger=logger
+        )
     
     # Execute
-    stats = pipeline.run()
+    try:
+        stats = pipeline.run()
+    finally:
+        if page_cache:
+            page_cache.close()
+        if seen_index is not None:
+            seen_index.close()
+        if checkpoint:
+            checkpoint.close()
+        if robots:
+            robots.close()
+        if enrichment_queue is not None:
+            enrichment_queue.close()
+        if dedup is not None:
+            dedup.close()
     
     # Final output
     # FIXED: Removed emoji to avoid Unicode encoding error on Windows
@@ -135,9 +362,33 @@ if __name__ == "__main__":
         help='Specific job group to process (e.g., group1, group2)',
         default=None
     )
+    parser.add_argument(
+        '--engine',
+        choices=['sync', 'async'],
+        help='Extraction engine (defaults to pipeline.engine in config.yml)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--replay',
+        action='store_true',
+        help='Re-parse cached HTML pages without touching the network'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=['detail', 'listing', 'enrich'],
+        help='detail pages, listing cards only, or detail pages queued by listing-only runs '
+             '(defaults to pipeline.extraction_mode in config.yml)',
+        default=None
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip work finished by an interrupted run and continue from its checkpoint'
+    )
     
     args = parser.parse_args()
     
     # Run with optional group filter
-    # Example: python main.py --group group1
-    main(group=args.group)
\ No newline at end of file
+    # Example: python main.py --group group1 --engine async
+    main(group=args.group, engine=args.engine, replay=args.replay, resume=args.resume, mode=args.mode)
\ No newline at end of file
@@ -3,13 +3,18 @@ Optimized Job Scraping Pipeline
 Handles multiple extractors, storage handlers, and job queues efficiently.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
+import threading
 from datetime import datetime
 
 from .storage.CSVStoragehandler import CSVStorageHandler
 from .extractors.NaukriExtractor import NaukriJobExtractor
 from .base import JobExtractor, StorageHandler
+from .records import JobBatch
+from .state.checkpoint import CheckpointStore, JobProgress
+from .state.dedup_index import DedupIndex, DedupSession
+from ..utils.metrics import REGISTRY, inc, metric_labels, timer
 
 
 class Pipeline():
@@ -17,7 +22,9 @@ class Pipeline():
     A modular job scraping pipeline that runs multiple extractors
     and stores results using one or more storage handlers.
     """
-    def __init__(self , extractors : List[JobExtractor],handlers: List[StorageHandler] , jobs: List[str], filedirectory: Dict, logger = None):
+    def __init__(self , extractors : List[JobExtractor],handlers: List[StorageHandler] , jobs: List[str], filedirectory: Dict,
+                 batch_size: int = 200, checkpoint: Optional[CheckpointStore] = None, resume: bool = False,
+                 metrics_path: Optional[str] = None, dedup: Optional[DedupIndex] = None, logger = None):
 
         """
         Initialize pipeline with extractors, handlers, and job list.
@@ -27,6 +34,11 @@ class Pipeline():
             handlers: List of StorageHandler instances (e.g., CSVHandler, JSONHandler)
             jobs: List of job titles to scrape (e.g., ['Python Developer', 'Data Scientist'])
             filedirectory: Mapping of handler names to file paths
+            batch_size: Records per flush to the storage handlers
+            checkpoint: Store recording completed roles and listing pages
+            resume: Continue from the checkpoint instead of starting a fresh run
+            metrics_path: Write stage metrics to this Prometheus text file after the run
+            dedup: Index of stored jobs; duplicate and near-duplicate records are dropped before the handlers
             logger: Optional logger instance
 
         """
@@ -34,7 +46,13 @@ class Pipeline():
         self.handlers = handlers
         self.jobs = jobs
         self.filedirectory = filedirectory
+        self.batch_size = max(1, batch_size)
+        self.checkpoint = checkpoint
+        self.resume = resume
+        self.metrics_path = metrics_path
+        self.dedup = dedup
         self.logger = logger
+        self._stats_lock = threading.Lock()
     
     def _validate_configuration(self):
         """
@@ -65,7 +83,9 @@ class Pipeline():
             "total_jobs": len(self.jobs),
             "successful_jobs": 0,
             "failed_jobs": 0,
+            "skipped_jobs": 0,
             "total_records": 0,
+            "duplicates_dropped": 0,
             "job_details": {},
         }
 
@@ -73,32 +93,123 @@ class Pipeline():
         self.logger.info(f"Pipeline Started | Jobs: {len(self.jobs)} | Extractors: {len(self.extractors)} | Handlers: {len(self.handlers)}")
         self.logger.info("="*60)
 
-        for job_idx , job in enumerate(self.jobs, 1):
-            self.logger.info(f"\n[{job_idx}/{len(self.jobs)}] Processing job: '{job}' ")
-            job_stats = self._process_single_job(job)
+        jobs = self._start_checkpoint(stats)
+        try:
+            for job_idx , job in enumerate(jobs, 1):
+                self.logger.info(f"\n[{job_idx}/{len(jobs)}] Processing job: '{job}' ")
+                job_stats = self._process_single_job(job)
 
-            # update global stats
-            stats ["job_details"][job] = job_stats
-            if job_stats["success"]:
-                stats["successful_jobs"] +=1
-                stats["total_records"] += job_stats["records_extracted"]
-            else:
-                stats["failed_jobs"] += 1
+                # update global stats
+                stats ["job_details"][job] = job_stats
+                if job_stats["success"]:
+                    stats["successful_jobs"] +=1
+                    stats["total_records"] += job_stats["records_extracted"]
+                    stats["duplicates_dropped"] += job_stats["duplicates_dropped"]
+                    if self.checkpoint:
+                        self.checkpoint.mark_role_done(job)
+                else:
+                    stats["failed_jobs"] += 1
+            self._finish_checkpoint(stats)
+        finally:
+            self._close_extractors()
+            self._close_handlers()
         
         # Final Summary
         elapsed = (datetime.now() - start_time).total_seconds()
+        self._export_metrics(stats)
+        self._log_summary(stats, elapsed)
+
+        return stats
+
+    def _export_metrics(self, stats: Dict):
+        """Attach the stage metrics to the stats and write the Prometheus file if configured."""
+        stats["metrics"] = REGISTRY.summary()
+        if self.metrics_path:
+            try:
+                REGISTRY.write_prometheus(self.metrics_path)
+            except OSError as e:
+                self.logger.warning(f"Failed to write metrics to {self.metrics_path}: {e}")
 
+    def _start_checkpoint(self, stats: Dict) -> List[str]:
+        """
+        Reset the checkpoint for a fresh run, or (resume mode) drop roles
+        that a previous run already finished.
+
+        Returns:
+            Jobs still to process
+        """
+        if not self.checkpoint:
+            return list(self.jobs)
+        if not self.resume:
+            self.checkpoint.clear()
+            return list(self.jobs)
+
+        pending = []
+        for job in self.jobs:
+            if self.checkpoint.is_role_done(job):
+                stats["job_details"][job] = {"success": True, "skipped": True, "records_extracted": 0, "errors": []}
+                stats["skipped_jobs"] += 1
+            else:
+                pending.append(job)
+        self.logger.info(f"Resuming from checkpoint: {stats['skipped_jobs']} finished job(s) skipped")
+        return pending
+
+    def _finish_checkpoint(self, stats: Dict):
+        """A run that finished without failures leaves nothing to resume."""
+        if self.checkpoint and stats["failed_jobs"] == 0 and not stats.get("cancelled"):
+            self.checkpoint.clear()
+
+    def _log_summary(self, stats: Dict, elapsed: float):
+        """Log the execution summary of a run."""
         self.logger.info("\n" + "=" *60 )
         self.logger.info("Pipeline Execution Summary: ")
         self.logger.info(f" Total Jobs : {stats['total_jobs']}")
         self.logger.info(f" Successful: {stats['successful_jobs']}")
         self.logger.info(f" Failed: {stats['failed_jobs']}")
+        if stats.get("skipped_jobs"):
+            self.logger.info(f" Skipped (checkpoint): {stats['skipped_jobs']}")
         self.logger.info(f" Total Recors: {stats['total_records']}")
+        if stats.get("duplicates_dropped"):
+            self.logger.info(f" Duplicates dropped: {stats['duplicates_dropped']}")
         self.logger.info(f" Elapsed Time: {elapsed:.2f}s")
+        if elapsed > 0:
+            self.logger.info(f" Throughput: {stats['total_records'] / elapsed:.2f} records/s")
+        for name, (count, total) in sorted(REGISTRY.totals().items()):
+            self.logger.info(f" {name}: {total:.2f}s over {count} calls")
         self.logger.info("\n" + "=" *60 )
-
-        return stats
     
+    def _close_extractors(self):
+        """
+        Release long-lived extractor resources (e.g. browser sessions)
+        once all jobs of this run are done.
+        """
+        for extractor in self.extractors:
+            close = getattr(extractor, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close extractor {extractor.__class__.__name__}: {e}")
+
+    def _flush_handlers(self):
+        """Write out records held in handler buffers, so a checkpointed page is really stored."""
+        for handler in self.handlers:
+            flush = getattr(handler, "flush", None)
+            if callable(flush):
+                flush()
+
+    def _close_handlers(self):
+        """Release storage handler resources (e.g. database connections)."""
+        for handler in self.handlers:
+            close = getattr(handler, "close", None)
+            if not callable(close):
+                continue
+            try:
+                close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close handler {handler.get_name()}: {e}")
+
     def run_single_job(self, job: str) -> Dict:
         """
         Convenience method to run pipeline for a single job.
@@ -115,6 +226,9 @@ class Pipeline():
     def _process_single_job(self , job: str) -> Dict:
         """
         Process a single job across all extractors and handlers.
+        Records are streamed from each extractor and flushed to every
+        handler in batches of `batch_size`, so memory stays bounded and
+        records scraped before a crash are already stored.
 
         Args:
             job: Job title to scrape
@@ -129,61 +243,150 @@ class Pipeline():
             "records_extracted": 0,
             "extractors_used": 0,
             "handlers_used": 0,
+            "batches_flushed": 0,
+            "duplicates_dropped": 0,
             "errors": []
         }
+        handlers_used = set()
 
-        all_data = []
-
-        # Extraction phase
         for extractor in self.extractors:
             extractor_name = extractor.__class__.__name__
-
             self.logger.info(f"Extractor={extractor_name} | starting extraction....")
 
-            try:
-                data = extractor.extract(job)
-                record_count = len(data)
+            batch = JobBatch()
+            dedup = self.dedup.session() if self.dedup is not None else None
+            record_count = 0
 
-                if record_count >0:
-                    all_data.extend(data)
-                    job_stats["extractors_used"] += 1
-                    self.logger.info(f"Extractor={extractor_name} | Extracted {len(data)} records")
-            except Exception as e:
-                error_msg = f"Extractor {extractor_name} failed: {str(e)}"
-                self.logger.error(f" {error_msg}", exc_info = True)
+            # Checkpointed pages (and other reports) are committed only once their records are stored
+            progress = JobProgress(job, extractor.get_name(), self.checkpoint)
+            with metric_labels(extractor=extractor.get_name(), role=job):
+                try:
+                    for record in extractor.iter_extract(job, progress=progress):
+                        if dedup is not None and not self._admit(dedup, record, job_stats):
+                            continue
+                        batch.append(record)
+                        record_count += 1
+                        if len(batch) >= self.batch_size:
+                            self._flush_stream(batch, job, job_stats, handlers_used, progress, dedup)
+                except Exception as e:
+                    error_msg = f"Extractor {extractor_name} failed: {str(e)}"
+                    self.logger.error(f" {error_msg}", exc_info = True)
+                    job_stats["errors"].append(error_msg)
+                finally:
+                    # Keep whatever was scraped before a failure
+                    self._flush_stream(batch, job, job_stats, handlers_used, progress, dedup, final=True)
+
+            if record_count > 0:
+                job_stats["extractors_used"] += 1
+                job_stats["records_extracted"] += record_count
+                self.logger.info(f"Extractor={extractor_name} | Extracted {record_count} records")
+
+        # check if any data is extracted
+        if job_stats["records_extracted"] == 0 and job_stats["duplicates_dropped"] == 0:
+            self.logger.warning(f" No data extracted for job '{job}' from any extractor")
+            return job_stats
+
+        # Mark as successful if at least one handler stored data (or everything was a duplicate)
+        # and nothing failed; a failed role keeps its checkpoint for --resume
+        job_stats["handlers_used"] = len(handlers_used)
+        if (job_stats["handlers_used"] > 0 or job_stats["records_extracted"] == 0) and not job_stats["errors"]:
+            job_stats["success"] = True
+           
+        return job_stats
+
+    def _admit(self, dedup: DedupSession, record, job_stats: Dict) -> bool:
+        """Dedup stage: False (and counted) if the record duplicates a stored one."""
+        if dedup.admit(record):
+            return True
+        inc("duplicates_dropped_total")
+        with self._stats_lock:
+            job_stats["duplicates_dropped"] += 1
+        return False
+
+    def _flush_stream(self, batch: JobBatch, job: str, job_stats: Dict, handlers_used: set,
+                      progress: JobProgress, dedup: Optional[DedupSession] = None, final: bool = False):
+        """
+        Save an extractor's batch with every handler, then commit what waits
+        on its records: dedup keys and the progress reports (checkpointed
+        pages, seen-index marks, ...).
+
+        Reports are committed only when the records are written: not while a
+        handler still buffers them (they are committed at a later flush),
+        and never after a batch some handler failed to save.
+
+        Args:
+            final: End of the stream: handler buffers are flushed and everything is committed
+        """
+        reported = progress.reported()
+        try:
+            stored = True
+            if batch:
+                saved, errors = self._flush_batch(batch, job)
+                self._record_flush(job_stats, handlers_used, (saved, errors))
+                batch.clear()
+                stored = not errors
+            if stored:
+                if final:
+                    self._flush_handlers()
+                elif self._handlers_buffered():
+                    return
+                if dedup is not None:
+                    dedup.commit()
+                progress.commit(reported)
+                return
+        except Exception as e:
+            error_msg = f"Committing records of '{job}' failed: {str(e)}"
+            self.logger.error(f" {error_msg}", exc_info=True)
+            with self._stats_lock:
                 job_stats["errors"].append(error_msg)
-                continue
-            
-            # check if any data is extracted
-            if not  all_data:
-                self.logger.warning(f" No data extracted for job '{job}' from any extractor")
-                return job_stats
-            
-            job_stats["records_extracted"] = len(all_data)
 
-            
-        # Storage Phase
-        self.logger.info(f" Saving {len(all_data)} records using {len(self.handlers)} handler(s)... ")
+        self.logger.warning(f"Records of '{job}' from {progress.extractor} were not all stored; "
+                            f"nothing more is checkpointed for it in this run")
+        progress.discard()
+        if dedup is not None:
+            dedup.discard()
+
+    def _handlers_buffered(self) -> bool:
+        """Whether a handler holds saved records that are not written yet (see CSVStorageHandler buffer_size)."""
+        for handler in self.handlers:
+            buffered = getattr(handler, "has_buffered_records", None)
+            if callable(buffered) and buffered():
+                return True
+        return False
+
+    def _flush_batch(self, batch: JobBatch, job: str) -> Tuple[List[str], List[str]]:
+        """
+        Save a batch of records with every handler.
+
+        Returns:
+            Tuple of (names of handlers that saved the batch, error messages)
+        """
+        saved, errors = [], []
         for handler in self.handlers:
             handler_name = handler.get_name()
             filename = self.filedirectory[handler_name]
 
             try:
-                handler.save(all_data, filename)
-                job_stats["handlers_used"] += 1
-                self.logger.info(f"Handler={handler_name} | Saved data to {filename}")
+                with timer("handler_save_seconds", handler=handler_name):
+                    self._save(handler, batch, filename)
+                inc("records_saved_total", len(batch), handler=handler_name)
+                saved.append(handler_name)
+                self.logger.info(f"Handler={handler_name} | Saved {len(batch)} records for '{job}' to {filename}")
             except Exception as e:
                 error_msg = f"Handler {handler_name} failed : {str(e)}"
                 self.logger.error(f" {error_msg}", exc_info=True)
-                job_stats["errors"].append(error_msg)
-                continue
-            
-            
-        # Mark as successful if at least one handler succeeded
-        if job_stats["handlers_used"] > 0:
-            job_stats["success"] = True
-           
-        return job_stats
+                errors.append(error_msg)
+        return saved, errors
+
+    def _save(self, handler: StorageHandler, batch: JobBatch, filename: str):
+        handler.save_batch(batch, filename)
+
+    def _record_flush(self, job_stats: Dict, handlers_used: set, result: Tuple[List[str], List[str]]):
+        saved, errors = result
+        with self._stats_lock:
+            job_stats["batches_flushed"] += 1
+            handlers_used.update(saved)
+            job_stats["errors"].extend(errors)
 
 
 
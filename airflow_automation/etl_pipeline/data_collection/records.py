@@ -0,0 +1,267 @@
+"""
+Compact representation of scraped jobs.
+
+Extractors emit JobRecord objects (slots dataclasses: the fixed columns
+are attributes, only the page's "other details" are kept in a small dict)
+and the pipeline appends them to a JobBatch, which keeps one list per
+column. Storage handlers write a batch column by column (Arrow table,
+SQLite rows, CSV rows) without building an intermediate DataFrame.
+
+JobRecord also answers dict-style lookups by column name
+(record["Job_URL"], record.get("Industry Type")), so code written against
+the old dict records keeps working.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import pyarrow as pa
+
+
+# Output columns of a job record, in file order. Columns between
+# Last_Apply_Date and Description come from the "other details" section
+# of a detail page (JobRecord.details); pages may carry further labels,
+# which are appended after Job_Type.
+JOB_COLUMNS = [
+    "Title", "Company", "Experience", "Salary", "Location", "Education",
+    "Star_Skills", "Normal_Skills", "Posted_Date", "Last_Apply_Date",
+    "Role", "Industry Type", "Department", "Employment Type", "Role Category",
+    "Description", "Job_URL", "Scraped_At", "Job_Type",
+]
+
+LIST_COLUMNS = ("Star_Skills", "Normal_Skills")
+
+# Column name -> JobRecord attribute, for every column that is not a detail
+COLUMN_FIELDS = {
+    "Title": "title",
+    "Company": "company",
+    "Experience": "experience",
+    "Salary": "salary",
+    "Location": "location",
+    "Education": "education",
+    "Star_Skills": "star_skills",
+    "Normal_Skills": "normal_skills",
+    "Posted_Date": "posted_date",
+    "Last_Apply_Date": "last_apply_date",
+    "Description": "description",
+    "Job_URL": "job_url",
+    "Scraped_At": "scraped_at",
+    "Job_Type": "job_type",
+}
+
+DETAIL_COLUMNS = [column for column in JOB_COLUMNS if column not in COLUMN_FIELDS]
+COLUMN_INDEX = {column: index for index, column in enumerate(JOB_COLUMNS)}
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """One scraped job. Missing text fields are "NA", as on the scraped pages."""
+
+    title: str = "NA"
+    company: str = "NA"
+    experience: str = "NA"
+    salary: str = "NA"
+    location: str = "NA"
+    education: str = "NA"
+    star_skills: List[str] = field(default_factory=list)
+    normal_skills: List[str] = field(default_factory=list)
+    posted_date: str = "NA"
+    last_apply_date: str = "NA"
+    description: str = "NA"
+    job_url: str = ""
+    scraped_at: str = ""
+    job_type: Optional[str] = None
+    # "Other details" of the detail page keyed by their label (Role, Industry Type, ...)
+    details: Dict[str, str] = field(default_factory=dict)
+    # Built from a listing card only (no detail page yet); not a column
+    partial: bool = False
+
+    @classmethod
+    def from_fields(cls, fields: Dict, **values) -> "JobRecord":
+        """
+        Build a record from a column-keyed dict (parser output or an old dict record).
+        Keys that are not record columns are kept as details.
+        """
+        kwargs = {}
+        details = {}
+        for column, value in fields.items():
+            name = COLUMN_FIELDS.get(column)
+            if name is not None:
+                kwargs[name] = value
+            else:
+                details[column] = value
+        kwargs.update(values)
+        return cls(details=details, **kwargs)
+
+    def get(self, column: str, default=None):
+        """Value of a column (like dict.get on the old records)."""
+        name = COLUMN_FIELDS.get(column)
+        if name is not None:
+            value = getattr(self, name)
+            return default if value is None else value
+        return self.details.get(column, default)
+
+    def __getitem__(self, column: str):
+        name = COLUMN_FIELDS.get(column)
+        if name is not None:
+            return getattr(self, name)
+        return self.details[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in COLUMN_FIELDS or column in self.details
+
+    def columns(self) -> Iterator[str]:
+        """Column names of this record: the standard columns, then extra detail labels."""
+        yield from JOB_COLUMNS
+        for label in self.details:
+            if label not in COLUMN_INDEX:
+                yield label
+
+    def to_dict(self) -> Dict:
+        """Column-keyed dict in file order."""
+        return {column: self.get(column) for column in self.columns()}
+
+
+Record = Union[JobRecord, Dict]
+
+
+class JobBatch:
+    """
+    Column-oriented batch of job records.
+
+    Each column is a plain list appended to as records arrive; handlers
+    read whole columns (or rows in column order) and to_arrow() builds a
+    typed table in one pass per column. Batches are combined column by
+    column with extend_batch(), never through per-row dicts.
+
+    Usage:
+        batch = JobBatch()
+        for record in extractor.iter_extract(role):
+            batch.append(record)
+        table = batch.to_arrow()
+    """
+
+    def __init__(self, records: Iterable[Record] = ()):
+        self._columns: Dict[str, list] = {column: [] for column in JOB_COLUMNS}
+        self._size = 0
+        for record in records:
+            self.append(record)
+
+    def append(self, record: Record) -> None:
+        """Add a JobRecord (or a column-keyed dict) as the next row."""
+        if not isinstance(record, JobRecord):
+            record = JobRecord.from_fields(record)
+        columns = self._columns
+        for column, name in COLUMN_FIELDS.items():
+            columns[column].append(getattr(record, name))
+        details = record.details
+        for column in DETAIL_COLUMNS:
+            columns[column].append(details.get(column))
+        for label, value in details.items():
+            if label not in COLUMN_INDEX:
+                if label not in columns:
+                    # Label first seen in this batch: earlier rows lack it
+                    columns[label] = [None] * self._size
+                columns[label].append(value)
+        self._size += 1
+        if len(columns) > len(JOB_COLUMNS):
+            # Extra labels this record lacks
+            for values in columns.values():
+                if len(values) < self._size:
+                    values.append(None)
+
+    def extend(self, records: Iterable[Record]) -> None:
+        for record in records:
+            self.append(record)
+
+    def extend_batch(self, other: "JobBatch") -> None:
+        """Append the rows of another batch, column by column (its lists are copied, not shared)."""
+        columns = self._columns
+        for name in other.column_names:
+            if name not in columns:
+                # Label first seen in the other batch: our rows lack it
+                columns[name] = [None] * self._size
+            columns[name].extend(other.column(name))
+        self._size += len(other)
+        for values in columns.values():
+            if len(values) < self._size:
+                values.extend([None] * (self._size - len(values)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def clear(self) -> None:
+        self._columns = {column: [] for column in JOB_COLUMNS}
+        self._size = 0
+
+    @property
+    def column_names(self) -> List[str]:
+        """Standard columns followed by extra detail labels, in first-seen order."""
+        return list(self._columns)
+
+    def column(self, name: str) -> list:
+        """Values of a column, one per row (None where a row lacks it)."""
+        values = self._columns.get(name)
+        return values if values is not None else [None] * self._size
+
+    def rows(self, columns: Optional[List[str]] = None) -> Iterator[tuple]:
+        """Row tuples in the order of `columns` (default: column_names)."""
+        return zip(*(self.column(name) for name in (columns or self.column_names)))
+
+    def to_records(self) -> List[Dict]:
+        """Column-keyed dicts, for handlers that still take a list of dicts."""
+        names = self.column_names
+        return [dict(zip(names, row)) for row in self.rows(names)]
+
+    def to_arrow(self, schema: Optional[pa.Schema] = None) -> pa.Table:
+        """
+        Arrow table of the batch. With a schema only its columns are built
+        (missing ones are null), converted to its types: list columns also
+        accept the repr of a list (rows re-read from CSV), timestamp columns
+        ISO strings ("NA" and unparsable values become null), string columns
+        any value. Without one every column is a string column and the skill
+        columns are string lists.
+        """
+        if schema is None:
+            schema = pa.schema([
+                (name, pa.list_(pa.string()) if name in LIST_COLUMNS else pa.string())
+                for name in self.column_names
+            ])
+        arrays = [pa.array(_arrow_values(self.column(f.name), f.type), type=f.type) for f in schema]
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _as_list(value) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    # Records re-read from CSV carry lists as their repr
+    text = str(value).strip("[] ")
+    return [item.strip(" '\"") for item in text.split(",") if item.strip(" '\"")]
+
+
+def _as_timestamp(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if not value or value == "NA":
+        return None
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _arrow_values(values: list, arrow_type: pa.DataType) -> list:
+    """Convert a column's Python values for an Arrow array of the given type."""
+    if pa.types.is_list(arrow_type):
+        return [_as_list(value) for value in values]
+    if pa.types.is_timestamp(arrow_type):
+        return [_as_timestamp(value) for value in values]
+    if pa.types.is_string(arrow_type):
+        return [None if value is None else str(value) for value in values]
+    return values
@@ -0,0 +1,204 @@
+"""
+Checkpoints for long pipeline runs.
+
+Completed listing pages, the listing URL to continue from and finished
+roles are recorded in SQLite as the pipeline goes, so a run that is killed
+halfway (e.g. an Airflow worker restart) can be resumed: finished roles are
+skipped and unfinished locations continue mid-pagination.
+"""
+
+from typing import Callable, List, Optional, Tuple
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+class CheckpointStore:
+    """
+    SQLite-backed progress of the current run.
+
+    Usage:
+        store = CheckpointStore("etl_pipeline/data/state/checkpoint.sqlite")
+        pipeline = Pipeline(..., checkpoint=store, resume=True)
+    """
+
+    def __init__(self, path: str, logger=None):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            path: SQLite database file
+            logger: Logger instance
+        """
+        self.path = path
+        self.logger = logger or logging.getLogger("pipeline")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    extractor TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    page_no INTEGER NOT NULL,
+                    listing_url TEXT NOT NULL,
+                    completed_at REAL NOT NULL,
+                    PRIMARY KEY (extractor, role, location, page_no)
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS locations (
+                    extractor TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    last_listing_url TEXT,
+                    next_page INTEGER NOT NULL,
+                    next_url TEXT,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (extractor, role, location)
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS roles (
+                    role TEXT PRIMARY KEY,
+                    completed_at REAL NOT NULL
+                )""")
+
+    def mark_page(self, extractor: str, role: str, location: str, page_no: int,
+                  listing_url: str, next_url: Optional[str]) -> None:
+        """Record a fully stored listing page and where pagination continues."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                (extractor, role, location, page_no, listing_url, now))
+            self._conn.execute(
+                """INSERT INTO locations (extractor, role, location, last_listing_url, next_page, next_url)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(extractor, role, location) DO UPDATE SET
+                       last_listing_url = excluded.last_listing_url,
+                       next_page = excluded.next_page, next_url = excluded.next_url""",
+                (extractor, role, location, listing_url, page_no + 1, next_url))
+
+    def mark_location_done(self, extractor: str, role: str, location: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT INTO locations (extractor, role, location, next_page, done) VALUES (?, ?, ?, 1, 1)
+                   ON CONFLICT(extractor, role, location) DO UPDATE SET done = 1""",
+                (extractor, role, location))
+
+    def mark_role_done(self, role: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO roles VALUES (?, ?)", (role, time.time()))
+
+    def resume_point(self, extractor: str, role: str, location: str) -> Optional[Tuple[int, str]]:
+        """Return (page_no, listing_url) to continue an unfinished location from, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_page, next_url, done FROM locations WHERE extractor = ? AND role = ? AND location = ?",
+                (extractor, role, location)).fetchone()
+        if row is None or row[2] or not row[1]:
+            return None
+        return row[0], row[1]
+
+    def is_location_done(self, extractor: str, role: str, location: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT done FROM locations WHERE extractor = ? AND role = ? AND location = ?",
+                (extractor, role, location)).fetchone()
+        return bool(row and row[0])
+
+    def is_role_done(self, role: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM roles WHERE role = ?", (role,)).fetchone() is not None
+
+    def clear(self) -> None:
+        """Forget all progress (start of a fresh run)."""
+        with self._lock, self._conn:
+            for table in ("pages", "locations", "roles"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobProgress:
+    """
+    Progress of one role for one extractor, handed to
+    `JobExtractor.iter_extract` by the pipeline.
+
+    Extractors report a listing page with page_done() once all of its
+    records have been yielded, a finished location with location_done(),
+    and work that must wait until records are stored (seen index,
+    enrichment queue) with on_stored(). Nothing takes effect right away:
+    the pipeline calls commit() once the records yielded so far are
+    written by every storage handler, and discard() when a batch could not
+    be stored, after which nothing more is committed for this stream (a
+    resume redoes it from the last committed page). The store is optional;
+    without it only the on_stored() work is held back.
+    """
+
+    def __init__(self, role: str, extractor: str, store: Optional[CheckpointStore] = None):
+        self.role = role
+        self.extractor = extractor
+        self.store = store
+        self.failed = False
+        self._pending: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _location_key(location: Optional[str]) -> str:
+        return location or ""
+
+    def resume_point(self, location: Optional[str]) -> Optional[Tuple[int, str]]:
+        if self.store is None:
+            return None
+        return self.store.resume_point(self.extractor, self.role, self._location_key(location))
+
+    def is_location_done(self, location: Optional[str]) -> bool:
+        if self.store is None:
+            return False
+        return self.store.is_location_done(self.extractor, self.role, self._location_key(location))
+
+    def _defer(self, action: Callable[[], None]) -> None:
+        with self._lock:
+            if not self.failed:
+                self._pending.append(action)
+
+    def page_done(self, location: Optional[str], page_no: int, listing_url: str, next_url: Optional[str]) -> None:
+        if self.store is not None:
+            self._defer(lambda: self.store.mark_page(self.extractor, self.role, self._location_key(location),
+                                                     page_no, listing_url, next_url))
+
+    def location_done(self, location: Optional[str]) -> None:
+        if self.store is not None:
+            self._defer(lambda: self.store.mark_location_done(self.extractor, self.role,
+                                                              self._location_key(location)))
+
+    def on_stored(self, callback: Callable[[], None]) -> None:
+        """Run callback once the records yielded so far are stored."""
+        self._defer(callback)
+
+    def reported(self) -> int:
+        """Number of pending reports; pass it to commit() to commit only those."""
+        with self._lock:
+            return len(self._pending)
+
+    def commit(self, count: Optional[int] = None) -> None:
+        """Apply the first `count` pending reports (default: all), in the order they were made."""
+        with self._lock:
+            if count is None:
+                count = len(self._pending)
+            actions, self._pending = self._pending[:count], self._pending[count:]
+        for action in actions:
+            action()
+
+    def discard(self) -> None:
+        """Drop pending reports and ignore later ones: records of this stream were lost."""
+        with self._lock:
+            self._pending.clear()
+            self.failed = True
@@ -0,0 +1,247 @@
+"""
+Persistent duplicate detection for scraped records.
+
+A record is a duplicate when its normalized Job_URL was stored before, and
+a near-duplicate when its description is (almost) the same as that of a
+job stored before for the same company, e.g. a repost under a new URL or
+the same opening listed under several roles and locations. Descriptions
+are compared by a 64-bit simhash; stored fingerprints are looked up by
+eight 8-bit bands, so any fingerprint within 7 bits shares at least one
+band with the record's.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from .seen_index import SeenIndex
+from ..records import JobRecord, Record
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_BITS = np.arange(64, dtype=np.uint64)
+_BANDS = 8
+_BAND_BITS = 64 // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def simhash(text: str, min_tokens: int = 30, shingle: int = 2) -> Optional[int]:
+    """
+    64-bit simhash of a text over its word shingles.
+
+    Returns:
+        The fingerprint, or None when the text has fewer than min_tokens words
+        (short texts are too alike to tell jobs apart)
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) < max(min_tokens, shingle):
+        return None
+    shingles = {" ".join(tokens[i:i + shingle]) for i in range(len(tokens) - shingle + 1)}
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") for s in shingles),
+        dtype=np.uint64, count=len(shingles))
+    votes = ((hashes[:, None] >> _BITS) & np.uint64(1)).sum(axis=0)
+    fingerprint = 0
+    for bit in np.flatnonzero(votes * 2 > len(shingles)):
+        fingerprint |= 1 << int(bit)
+    return fingerprint
+
+
+def _bands(fingerprint: int) -> Tuple[int, ...]:
+    return tuple((fingerprint >> (_BAND_BITS * i)) & _BAND_MASK for i in range(_BANDS))
+
+
+def _signed(fingerprint: int) -> int:
+    # SQLite integers are signed 64-bit
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+class DedupSession:
+    """
+    Duplicate check for one stream of records (one extractor of one role).
+
+    Admitted records are held as in-flight keys until commit(), which the
+    pipeline calls once a handler has stored them; discard() forgets them,
+    so records that never reached storage are not treated as seen.
+    """
+
+    def __init__(self, index: "DedupIndex"):
+        self.index = index
+        self.urls: Dict[bytes, bool] = {}
+        self.fingerprints: List[Tuple[str, int]] = []
+
+    def admit(self, record: Record) -> bool:
+        """False if the record duplicates a stored or in-flight one."""
+        if not isinstance(record, JobRecord):
+            record = JobRecord.from_fields(record)
+        return self.index._admit(self, record)
+
+    def commit(self) -> None:
+        self.index._commit(self)
+
+    def discard(self) -> None:
+        self.index._release(self)
+
+
+class DedupIndex:
+    """
+    SQLite-backed index of stored job URLs and description fingerprints.
+
+    Listing-only records are matched on their URL alone, and a full record
+    for a URL that so far only has a listing-only record is let through,
+    so enrichment runs can complete earlier card-level rows.
+
+    Usage:
+        index = DedupIndex("etl_pipeline/data/state/dedup.sqlite")
+        session = index.session()
+        kept = [record for record in records if session.admit(record)]
+        handler.save(kept, filename)
+        session.commit()
+    """
+
+    def __init__(self, path: str, max_distance: int = 6, min_tokens: int = 30, logger=None):
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite database file
+            max_distance: Differing simhash bits up to which two descriptions count as the same (0-7)
+            min_tokens: Descriptions with fewer words are not fingerprinted
+            logger: Logger instance
+        """
+        if not 0 <= max_distance < _BANDS:
+            raise ValueError(f"max_distance must be between 0 and {_BANDS - 1}, got {max_distance}")
+        self.path = path
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+        self.logger = logger or logging.getLogger("data_collection")
+
+        self._inflight_urls: Dict[bytes, Tuple[bool, DedupSession]] = {}
+        self._inflight_fingerprints: Dict[str, List[Tuple[int, DedupSession]]] = {}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        # Mapped Airflow tasks share the file; wait for each other's writes
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS urls (
+                    url_hash BLOB PRIMARY KEY,
+                    full INTEGER NOT NULL,
+                    added_at REAL NOT NULL
+                ) WITHOUT ROWID""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS fingerprints (
+                    id INTEGER PRIMARY KEY,
+                    company TEXT NOT NULL,
+                    fingerprint INTEGER NOT NULL,
+                    {bands},
+                    added_at REAL NOT NULL
+                )""".format(bands=", ".join(f"b{band} INTEGER NOT NULL" for band in range(_BANDS))))
+            for band in range(_BANDS):
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS fingerprints_b{band} ON fingerprints (company, b{band})")
+
+    @staticmethod
+    def _url_key(url: str) -> bytes:
+        return hashlib.blake2b(SeenIndex.normalize(url).encode("utf-8"), digest_size=16).digest()
+
+    @staticmethod
+    def _company_key(company: Optional[str]) -> str:
+        if not company or company == "NA":
+            return ""
+        return " ".join(_TOKEN.findall(company.lower()))
+
+    def session(self) -> DedupSession:
+        return DedupSession(self)
+
+    def _stored_url(self, key: bytes) -> Optional[bool]:
+        """Whether the stored record of a URL is full (None if the URL is new)."""
+        row = self._conn.execute("SELECT full FROM urls WHERE url_hash = ?", (key,)).fetchone()
+        return None if row is None else bool(row[0])
+
+    def _near_duplicate(self, company: str, fingerprint: int) -> bool:
+        def close(other: int) -> bool:
+            return (fingerprint ^ other).bit_count() <= self.max_distance
+
+        if any(close(other) for other, _ in self._inflight_fingerprints.get(company, ())):
+            return True
+        query = " UNION ALL ".join(
+            f"SELECT fingerprint FROM fingerprints WHERE company = ? AND b{band} = ?" for band in range(_BANDS))
+        params = [item for value in _bands(fingerprint) for item in (company, value)]
+        return any(close(other & 0xFFFFFFFFFFFFFFFF) for (other,) in self._conn.execute(query, params))
+
+    def _admit(self, session: DedupSession, record: JobRecord) -> bool:
+        full = not record.partial
+        key = self._url_key(record.job_url)
+        fingerprint = simhash(record.description or "", self.min_tokens) if full else None
+        company = self._company_key(record.company)
+
+        with self._lock:
+            inflight = self._inflight_urls.get(key)
+            stored = inflight[0] if inflight is not None else self._stored_url(key)
+            # A listing-only row may still be completed by the full record
+            if stored is not None and (stored or not full):
+                return False
+            if fingerprint is not None and self._near_duplicate(company, fingerprint):
+                return False
+
+            self._inflight_urls[key] = (full, session)
+            session.urls[key] = full
+            if fingerprint is not None:
+                self._inflight_fingerprints.setdefault(company, []).append((fingerprint, session))
+                session.fingerprints.append((company, fingerprint))
+        return True
+
+    def _commit(self, session: DedupSession) -> None:
+        """Store the session's keys and release them."""
+        now = time.time()
+        urls = [(key, int(full), now) for key, full in session.urls.items()]
+        fingerprints = [(company, _signed(fingerprint), *_bands(fingerprint), now)
+                        for company, fingerprint in session.fingerprints]
+        band_columns = ", ".join(f"b{band}" for band in range(_BANDS))
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO urls (url_hash, full, added_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (url_hash) DO UPDATE SET full = MAX(full, excluded.full)", urls)
+                self._conn.executemany(
+                    f"INSERT INTO fingerprints (company, fingerprint, {band_columns}, added_at) "
+                    f"VALUES ({', '.join('?' * (_BANDS + 3))})", fingerprints)
+            self._release_locked(session)
+
+    def _release(self, session: DedupSession) -> None:
+        with self._lock:
+            self._release_locked(session)
+
+    def _release_locked(self, session: DedupSession) -> None:
+        for key in session.urls:
+            inflight = self._inflight_urls.get(key)
+            if inflight is not None and inflight[1] is session:
+                del self._inflight_urls[key]
+        for company, _ in session.fingerprints:
+            entries = self._inflight_fingerprints.get(company)
+            if entries is None:
+                continue
+            entries[:] = [entry for entry in entries if entry[1] is not session]
+            if not entries:
+                del self._inflight_fingerprints[company]
+        session.urls.clear()
+        session.fingerprints.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,111 @@
+"""
+Deferred detail-page enrichment.
+
+Listing-only runs emit card-level records straight from the search results
+and queue the job URLs here; a later enrichment run drains the queue,
+scrapes the detail pages and emits full records. Trend dashboards that only
+need card fields never wait for detail pages.
+"""
+
+from typing import Iterable, List, Tuple
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .seen_index import SeenIndex
+
+
+class EnrichmentQueue:
+    """
+    SQLite-backed queue of job URLs awaiting their detail page, per role.
+
+    Usage:
+        queue = EnrichmentQueue("etl_pipeline/data/state/enrichment.sqlite")
+        queue.add_many("data-scientist", card_urls)          # listing-only run
+        for rowid, url in queue.pending("data-scientist"):   # enrichment run
+            ...
+        queue.done(urls_scraped)
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3, logger=None):
+        """
+        Initialize the queue.
+
+        Args:
+            path: SQLite database file
+            max_attempts: Enrichment runs that may fail on a URL before it is left alone
+            logger: Logger instance
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.logger = logger or logging.getLogger("data_collection")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pending (
+                    id INTEGER PRIMARY KEY,
+                    url_key TEXT NOT NULL UNIQUE,
+                    url TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    queued_at REAL NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS pending_role ON pending (role, id)")
+
+    def add_many(self, role: str, urls: Iterable[str]) -> None:
+        """Queue job URLs of a role; URLs already queued are kept as they are."""
+        now = time.time()
+        rows = [(SeenIndex.normalize(url), url, role, now) for url in urls]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO pending (url_key, url, role, queued_at) VALUES (?, ?, ?, ?)", rows)
+
+    def pending(self, role: str, after_id: int = 0, limit: int = 100) -> List[Tuple[int, str]]:
+        """
+        Next queued URLs of a role in queue order.
+
+        Args:
+            after_id: Only return entries queued after this id (the last id of the previous batch)
+            limit: Maximum number of entries
+
+        Returns:
+            List of (id, url)
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, url FROM pending WHERE role = ? AND id > ? AND attempts < ? ORDER BY id LIMIT ?",
+                (role, after_id, self.max_attempts, limit)).fetchall()
+
+    def done(self, urls: Iterable[str]) -> None:
+        """Remove URLs whose full records have been stored."""
+        keys = [(SeenIndex.normalize(url),) for url in urls]
+        if not keys:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM pending WHERE url_key = ?", keys)
+
+    def failed(self, urls: Iterable[str]) -> None:
+        """Count a failed enrichment attempt; the URL is retried by later runs up to max_attempts."""
+        keys = [(SeenIndex.normalize(url),) for url in urls]
+        if not keys:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("UPDATE pending SET attempts = attempts + 1 WHERE url_key = ?", keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM pending WHERE attempts < ?", (self.max_attempts,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,248 @@
+"""
+Persistent on-disk HTML page cache.
+
+Pages are stored in SQLite: `pages` maps a URL to the hash of its content
+and `blobs` holds each distinct body once, compressed with zstd (or zlib
+when the zstandard package is not installed). Entries expire after a TTL
+and the least recently used pages are evicted once the cache grows past
+its size cap. In replay mode TTLs are ignored so months of cached pages
+can be re-parsed without touching the network.
+"""
+
+from typing import Iterator, Optional
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used instead
+    zstandard = None
+
+
+class PageCache:
+    """
+    Content-addressed HTML cache keyed by page URL.
+
+    Usage:
+        cache = PageCache("etl_pipeline/data/cache/pages.sqlite", ttl_hours=12)
+        html = cache.get(url)
+        if html is None:
+            html = fetch(url)
+            cache.put(url, html)
+    """
+
+    def __init__(self, path: str, ttl_hours: Optional[float] = None, max_size_mb: Optional[float] = None,
+                 replay: bool = False, compression_level: int = 6, logger=None):
+        """
+        Initialize the page cache.
+
+        Args:
+            path: SQLite database file
+            ttl_hours: Entries older than this are treated as missing (None = never expire)
+            max_size_mb: Evict least recently used pages beyond this compressed size (None = unbounded)
+            replay: Serve every cached page regardless of age; callers must not hit the network
+            compression_level: zstd/zlib compression level
+            logger: Logger instance
+        """
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600 if ttl_hours else None
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self.replay = replay
+        self.compression_level = compression_level
+        self.logger = logger or logging.getLogger("data_collection")
+        self.codec = "zstd" if zstandard is not None else "zlib"
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        self._size_bytes = self._load_size()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _create_schema(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    content_hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    content_hash TEXT NOT NULL REFERENCES blobs(content_hash),
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_kind ON pages(kind, fetched_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_content ON pages(content_hash)")
+
+    def _load_size(self) -> int:
+        """Drop unreferenced bodies and return the compressed size of the rest (once, at open)."""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM blobs WHERE content_hash NOT IN (SELECT content_hash FROM pages)")
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _compress(self, html: str) -> bytes:
+        data = html.encode("utf-8")
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return zlib.compress(data, self.compression_level)
+
+    @staticmethod
+    def _decompress(codec: str, body: bytes) -> str:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Page was cached with zstd but the zstandard package is not installed")
+            return zstandard.ZstdDecompressor().decompress(body).decode("utf-8")
+        return zlib.decompress(body).decode("utf-8")
+
+    def get(self, url: str, kind: Optional[str] = None) -> Optional[str]:
+        """
+        Return the cached HTML for a URL, or None when missing or expired.
+
+        Args:
+            url: Page URL
+            kind: Only match pages stored with this kind ('listing', 'detail')
+        """
+        url_key = self._hash(url)
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT p.kind, p.fetched_at, b.codec, b.body
+                   FROM pages p JOIN blobs b ON b.content_hash = p.content_hash
+                   WHERE p.url_key = ?""", (url_key,)).fetchone()
+
+            if row is None or (kind and row[0] != kind):
+                self.misses += 1
+                return None
+
+            _, fetched_at, codec, body = row
+            now = time.time()
+            if not self.replay and self.ttl_seconds and now - fetched_at > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            with self._conn:
+                self._conn.execute("UPDATE pages SET accessed_at = ? WHERE url_key = ?", (now, url_key))
+            self.hits += 1
+
+        return self._decompress(codec, body)
+
+    def put(self, url: str, html: str, kind: str = "detail") -> None:
+        """Store (or refresh) the HTML of a URL and enforce the size cap."""
+        if not html:
+            return
+        content_hash = self._hash(html)
+        body = self._compress(html)
+        url_key = self._hash(url)
+        now = time.time()
+
+        with self._lock:
+            with self._conn:
+                previous = self._conn.execute(
+                    "SELECT content_hash FROM pages WHERE url_key = ?", (url_key,)).fetchone()
+                inserted = self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (content_hash, codec, body, size) VALUES (?, ?, ?, ?)",
+                    (content_hash, self.codec, body, len(body))).rowcount
+                self._conn.execute(
+                    """INSERT INTO pages (url_key, url, kind, content_hash, fetched_at, accessed_at)
+                       VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(url_key) DO UPDATE SET
+                           kind = excluded.kind, content_hash = excluded.content_hash,
+                           fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at""",
+                    (url_key, url, kind, content_hash, now, now))
+                freed = 0
+                if previous and previous[0] != content_hash:
+                    freed = self._delete_orphans_locked([previous[0]])
+            self._size_bytes += (len(body) if inserted else 0) - freed
+            self._evict_locked()
+
+    def _delete_orphans_locked(self, content_hashes) -> int:
+        """Delete the given bodies that no page refers to any more. Returns the bytes freed."""
+        freed = 0
+        for content_hash in set(content_hashes):
+            row = self._conn.execute(
+                """SELECT size FROM blobs WHERE content_hash = ?
+                   AND NOT EXISTS (SELECT 1 FROM pages WHERE content_hash = ?)""",
+                (content_hash, content_hash)).fetchone()
+            if row is not None:
+                self._conn.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+                freed += row[0]
+        return freed
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used pages until the cache is below 90% of its cap."""
+        if not self.max_size_bytes or self._size_bytes <= self.max_size_bytes:
+            return
+
+        target = int(self.max_size_bytes * 0.9)
+        evicted = 0
+        while self._size_bytes > target:
+            size = self._size_bytes
+            with self._conn:
+                rows = self._conn.execute(
+                    "SELECT url_key, content_hash FROM pages ORDER BY accessed_at LIMIT 100").fetchall()
+                if not rows:
+                    break
+                for url_key, content_hash in rows:
+                    self._conn.execute("DELETE FROM pages WHERE url_key = ?", (url_key,))
+                    size -= self._delete_orphans_locked([content_hash])
+                    evicted += 1
+                    if size <= target:
+                        break
+            self._size_bytes = size
+        self.logger.info(f"Page cache: evicted {evicted} least recently used pages")
+
+    def purge_expired(self) -> int:
+        """Delete pages older than the TTL. Returns the number of pages removed."""
+        if not self.ttl_seconds:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            with self._conn:
+                content_hashes = [row[0] for row in self._conn.execute(
+                    "SELECT content_hash FROM pages WHERE fetched_at < ?", (cutoff,))]
+                removed = self._conn.execute("DELETE FROM pages WHERE fetched_at < ?", (cutoff,)).rowcount
+                freed = self._delete_orphans_locked(content_hashes)
+            self._size_bytes -= freed
+        return removed
+
+    def iter_urls(self, kind: Optional[str] = None) -> Iterator[str]:
+        """Yield cached URLs (optionally of one kind), oldest first."""
+        query = "SELECT url FROM pages"
+        params = ()
+        if kind:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        with self._lock:
+            urls = [row[0] for row in self._conn.execute(query + " ORDER BY fetched_at", params)]
+        yield from urls
+
+    def stats(self) -> dict:
+        """Cache size and hit statistics."""
+        with self._lock:
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            size = self._size_bytes
+        return {"pages": pages, "size_bytes": size, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
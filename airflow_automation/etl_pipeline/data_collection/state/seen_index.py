@@ -0,0 +1,97 @@
+"""
+Persistent index of job URLs that have already been scraped.
+Lets daily runs skip known detail pages and stop paginating once a
+listing page consists mostly of jobs captured on earlier runs.
+"""
+
+from typing import Iterable, List
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+class SeenIndex:
+    """
+    SQLite-backed set of scraped job URLs, stored beside the scraped data.
+
+    Usage:
+        index = SeenIndex("etl_pipeline/data/raw/seen_urls.sqlite")
+        new_urls = [url for url in hrefs if url not in index]
+        ...
+        index.add_many(new_urls)
+    """
+
+    def __init__(self, path: str, logger=None):
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite database file
+            logger: Logger instance
+        """
+        self.path = path
+        self.logger = logger or logging.getLogger("data_collection")
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    url_hash BLOB PRIMARY KEY,
+                    first_seen REAL NOT NULL
+                ) WITHOUT ROWID""")
+
+    @staticmethod
+    def normalize(url: str) -> str:
+        """Drop query string and fragment (tracking parameters) so the same job always matches."""
+        return url.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+
+    @classmethod
+    def _key(cls, url: str) -> bytes:
+        # 16-byte digest keeps the index small; collisions are irrelevant at our scale
+        return hashlib.blake2b(cls.normalize(url).encode("utf-8"), digest_size=16).digest()
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_urls WHERE url_hash = ?", (self._key(url),)).fetchone()
+        return row is not None
+
+    def known(self, urls: Iterable[str]) -> List[bool]:
+        """Membership flags for a batch of URLs (one query)."""
+        urls = list(urls)
+        if not urls:
+            return []
+        keys = [self._key(url) for url in urls]
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            found = {row[0] for row in self._conn.execute(
+                f"SELECT url_hash FROM seen_urls WHERE url_hash IN ({placeholders})", keys)}
+        return [key in found for key in keys]
+
+    def add(self, url: str) -> None:
+        self.add_many([url])
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Mark URLs as scraped."""
+        now = time.time()
+        rows = [(self._key(url), now) for url in urls]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url_hash, first_seen) VALUES (?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,22 +1,52 @@
-from ....etl_pipeline.data_collection.base import StorageHandler
-from typing import List, Dict
-import pandas as pd
+from ..base import StorageHandler
+from ..records import JOB_COLUMNS, JobBatch
+from ...utils.file_lock import FileLock
+from typing import List, Dict, Optional
 import csv
+import io
+import math
 import os
+import tempfile
+import threading
 import logging
 
 
 class CSVStorageHandler(StorageHandler):
-    def __init__(self, output_dir: str = "data/raw", logger=None):
+    """
+    Appends records to a CSV file with a stable column layout.
+
+    Rows are always written in the column order of the file's header, so a
+    record with a different set of detail labels can never shift columns.
+    A label the header does not have yet is added by rewriting the file
+    with the extended header (older rows get empty cells). New files and
+    rewrites are built in a temp file and renamed into place; appends are
+    rendered in memory first and written with a single write, and both
+    happen under an inter-process file lock, so concurrent writers never
+    interleave or tear rows.
+
+    With buffer_size, batches are held back and written once that many
+    records are pending (and on flush()/close()).
+    """
+
+    def __init__(self, output_dir: str = "data/raw", buffer_size: int = 0,
+                 columns: Optional[List[str]] = None, lock_timeout: Optional[float] = 300, logger=None):
         """
         Initialize CSV Storage Handler
-        
+
         Args:
             output_dir: Directory where CSV files will be saved
+            buffer_size: Records to collect before writing (0 = write every batch)
+            columns: Column layout of new files (defaults to the job record columns)
+            lock_timeout: Seconds to wait for another writer's file lock
             logger: Logger instance (if None, creates a default logger)
         """
         self.output_dir = output_dir
-        
+        self.buffer_size = max(0, buffer_size)
+        self.columns = list(columns or JOB_COLUMNS)
+        self.lock_timeout = lock_timeout
+        self._pending: Dict[str, JobBatch] = {}
+        self._lock = threading.Lock()
+
         # Initialize logger - CRITICAL FIX
         if logger is None:
             self.logger = logging.getLogger(self.__class__.__name__)
@@ -32,56 +62,153 @@ class CSVStorageHandler(StorageHandler):
     def get_name(self) -> str:
         return "CSVStorageHandler"
 
+    @staticmethod
+    def _cell(value) -> str:
+        """Format a value like pandas.to_csv: lists as their repr, missing values empty."""
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return ""
+        return str(value)
+
     def save(self, clean_dataset: List[Dict], filename: str) -> None:
         """
         Save data to CSV file
-        
+
         Args:
             clean_dataset: List of dictionaries containing job data
             filename: Name of the output CSV file
         """
-        if not clean_dataset:
+        self.save_batch(JobBatch(clean_dataset), filename)
+
+    def save_batch(self, batch: JobBatch, filename: str) -> None:
+        """
+        Save a column-oriented batch to CSV file (or buffer it, see buffer_size)
+
+        Args:
+            batch: Records to write
+            filename: Name of the output CSV file
+        """
+        if not batch:
             self.logger.warning("No data received to save. Skipping write.")
             return
-        
-        # Convert to DataFrame
-        try:
-            df = pd.DataFrame(clean_dataset)
-            self.logger.debug(f"Converted dataset with {len(df)} rows into DataFrame.")
-        except Exception as e:
-            self.logger.error(f"Error converting data to DataFrame: {e}")
-            return  # ✅ CRITICAL: Return here to stop execution
-        
+
+        if not self.buffer_size:
+            self._write(filename, [batch])
+            return
+
+        with self._lock:
+            # Copies the columns: the caller may reuse the batch object
+            pending = self._pending.setdefault(filename, JobBatch())
+            pending.extend_batch(batch)
+            if len(pending) < self.buffer_size:
+                return
+            del self._pending[filename]
+        self._write(filename, [pending])
+
+    def has_buffered_records(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def flush(self) -> None:
+        """Write every buffered batch."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for filename, batch in pending.items():
+            self._write(filename, [batch])
+
+    def close(self) -> None:
+        self.flush()
+
+    def _write(self, filename: str, batches: List[JobBatch]) -> None:
+        """Write batches in the file's column order, under the file lock."""
+        rows = sum(len(batch) for batch in batches)
+
         # Ensure directory exists
         try:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         except Exception as e:
             self.logger.error(f"Error creating directory for {filename}: {e}")
             return
-        
+
         # Save to CSV
         try:
-            # Check if file exists to determine if we need headers
-            file_exists = os.path.isfile(filename)
-            
-            df.to_csv(
-                filename, 
-                mode="a" if file_exists else "w",  # Append if exists, write if new
-                index=False, 
-                header=not file_exists,  # No header if appending
-                encoding='utf-8'
-            )
-            self.logger.info(f"Saved {len(df)} rows to {filename}")
-            
+            extra_columns = []
+            for batch in batches:
+                extra_columns += [name for name in batch.column_names
+                                  if name not in self.columns and name not in extra_columns]
+
+            with FileLock(filename, timeout=self.lock_timeout):
+                header = self._read_header(filename)
+                if header is None:
+                    self._replace(filename, self.columns + extra_columns, batches)
+                else:
+                    new_columns = [name for name in self.columns + extra_columns if name not in header]
+                    if new_columns:
+                        self.logger.info(f"Adding columns {new_columns} to {filename}")
+                        self._replace(filename, header + new_columns, batches, existing_header=header)
+                    else:
+                        self._append(filename, header, batches)
+            self.logger.info(f"Saved {rows} rows to {filename}")
+
         except Exception as e:
             self.logger.error(f"Error saving data to CSV file {filename}: {e}")
             raise  # Re-raise to let caller know it failed
 
+    @staticmethod
+    def _read_header(filename: str) -> Optional[List[str]]:
+        """Header of an existing, non-empty CSV file, else None."""
+        if not os.path.isfile(filename) or os.path.getsize(filename) == 0:
+            return None
+        with open(filename, "r", newline="", encoding="utf-8") as f:
+            return next(csv.reader(f), None)
+
+    def _render(self, writer, columns: List[str], batches: List[JobBatch]) -> None:
+        for batch in batches:
+            writer.writerows([self._cell(value) for value in row] for row in batch.rows(columns))
+
+    def _append(self, filename: str, header: List[str], batches: List[JobBatch]) -> None:
+        """Append rows with a single write, after repairing a torn last line."""
+        buffer = io.StringIO()
+        self._render(csv.writer(buffer, lineterminator="\n"), header, batches)
+        data = buffer.getvalue().encode("utf-8")
+
+        with open(filename, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                # An earlier writer died mid-row; start ours on a fresh line
+                data = b"\n" + data
+            f.seek(0, os.SEEK_END)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replace(self, filename: str, columns: List[str], batches: List[JobBatch],
+                 existing_header: Optional[List[str]] = None) -> None:
+        """Write header, existing rows (padded to the new columns) and the batches to a temp file, then rename it over filename."""
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(columns)
+                if existing_header is not None:
+                    padding = [""] * (len(columns) - len(existing_header))
+                    with open(filename, "r", newline="", encoding="utf-8") as old:
+                        reader = csv.reader(old)
+                        next(reader, None)
+                        writer.writerows(row + padding for row in reader)
+                self._render(writer, columns, batches)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filename)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
     @staticmethod
     def file_exists(path: str) -> bool:
         """Check if file exists"""
         return os.path.isfile(path)
-    
+
 
 # Example usage:
 if __name__ == "__main__":
@@ -91,4 +218,4 @@ if __name__ == "__main__":
         {"job_title": "Data Scientist", "company": "TechCorp", "location": "New York"},
         {"job_title": "ML Engineer", "company": "InnovateX", "location": "San Francisco"}
     ]
-    handler.save(sample_data, "data/raw/job.csv")
\ No newline at end of file
+    handler.save(sample_data, "data/raw/job.csv")
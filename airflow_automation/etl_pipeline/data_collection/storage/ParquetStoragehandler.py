@@ -0,0 +1,131 @@
+from ..base import StorageHandler
+from ..records import JobBatch
+from typing import List, Dict
+import uuid
+import os
+import logging
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+# Column types of a scraped job record. Partition columns (scrape_date,
+# Job_Type) are encoded in the directory layout and not stored in the files.
+JOB_SCHEMA = pa.schema([
+    ("Title", pa.string()),
+    ("Company", pa.string()),
+    ("Experience", pa.string()),
+    ("Salary", pa.string()),
+    ("Location", pa.string()),
+    ("Education", pa.string()),
+    ("Star_Skills", pa.list_(pa.string())),
+    ("Normal_Skills", pa.list_(pa.string())),
+    ("Posted_Date", pa.string()),
+    ("Last_Apply_Date", pa.string()),
+    ("Role", pa.string()),
+    ("Industry Type", pa.string()),
+    ("Department", pa.string()),
+    ("Employment Type", pa.string()),
+    ("Role Category", pa.string()),
+    ("Description", pa.string()),
+    ("Job_URL", pa.string()),
+    ("Scraped_At", pa.timestamp("us")),
+    ("Job_Type", pa.string()),
+    ("scrape_date", pa.string()),
+])
+
+PARTITION_COLUMNS = ["scrape_date", "Job_Type"]
+
+# Columns taken from the batch (scrape_date is derived from Scraped_At)
+RECORD_SCHEMA = pa.schema([field for field in JOB_SCHEMA if field.name != "scrape_date"])
+
+
+class ParquetStorageHandler(StorageHandler):
+    """
+    Writes records as a Hive-partitioned Parquet dataset:
+
+        <filename>/scrape_date=2025-01-31/Job_Type=Data Scientist/part-<uuid>-0.parquet
+
+    Every save() adds new files, so appends never rewrite history, and
+    readers can prune partitions and read only the columns they need:
+
+        pd.read_parquet(path, columns=["Title", "Star_Skills"],
+                        filters=[("Job_Type", "=", "Data Scientist")])
+    """
+
+    def __init__(self, compression: str = "zstd", row_group_size: int = 50_000, logger=None):
+        """
+        Initialize Parquet Storage Handler
+
+        Args:
+            compression: Parquet compression codec ('zstd', 'snappy', 'gzip', ...)
+            row_group_size: Max rows per row group
+            logger: Logger instance (if None, creates a default logger)
+        """
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def get_name(self) -> str:
+        return "ParquetStorageHandler"
+
+    @staticmethod
+    def _to_table(batch: JobBatch) -> pa.Table:
+        """Typed Arrow table of the batch, with the partition columns derived from it."""
+        table = batch.to_arrow(RECORD_SCHEMA)
+        # Jobs without a (parsable) timestamp or role go to the "unknown" partitions
+        scrape_date = pc.fill_null(pc.strftime(table["Scraped_At"], format="%Y-%m-%d"), "unknown")
+        job_type = table["Job_Type"]
+        job_type = pc.fill_null(pc.if_else(pc.equal(job_type, ""), pa.scalar(None, pa.string()), job_type),
+                                "unknown")
+        table = table.set_column(table.schema.get_field_index("Job_Type"), "Job_Type", job_type)
+        return table.append_column(JOB_SCHEMA.field("scrape_date"), scrape_date)
+
+    def save(self, clean_dataset: List[Dict], filename: str) -> None:
+        """
+        Append records to the Parquet dataset rooted at filename
+
+        Args:
+            clean_dataset: List of dictionaries containing job data
+            filename: Root directory of the dataset
+        """
+        self.save_batch(JobBatch(clean_dataset), filename)
+
+    def save_batch(self, batch: JobBatch, filename: str) -> None:
+        """
+        Append a column-oriented batch to the Parquet dataset rooted at filename
+
+        Args:
+            batch: Records to write
+            filename: Root directory of the dataset
+        """
+        if not batch:
+            self.logger.warning("No data received to save. Skipping write.")
+            return
+
+        extra_keys = set(batch.column_names) - set(JOB_SCHEMA.names)
+        if extra_keys:
+            self.logger.debug(f"Dropping columns not in the Parquet schema: {sorted(extra_keys)}")
+
+        try:
+            table = self._to_table(batch)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            self.logger.error(f"Error converting data to Arrow table: {e}")
+            raise  # Re-raise to let caller know it failed
+
+        try:
+            os.makedirs(filename, exist_ok=True)
+            pq.write_to_dataset(
+                table,
+                root_path=filename,
+                partition_cols=PARTITION_COLUMNS,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                compression=self.compression,
+                row_group_size=self.row_group_size,
+            )
+            self.logger.info(f"Saved {table.num_rows} rows to {filename}")
+        except Exception as e:
+            self.logger.error(f"Error saving data to Parquet dataset {filename}: {e}")
+            raise  # Re-raise to let caller know it failed
@@ -0,0 +1,132 @@
+from ..base import StorageHandler
+from ..records import JOB_COLUMNS, JobBatch
+from typing import List, Dict
+import threading
+import sqlite3
+import json
+import os
+import logging
+
+
+# Every column of JOB_COLUMNS is stored as TEXT; skill lists as JSON arrays
+INDEXED_COLUMNS = ["Job_Type", "Location", "Scraped_At"]
+
+
+def _quote(column: str) -> str:
+    return '"' + column.replace('"', '""') + '"'
+
+
+class SQLiteStorageHandler(StorageHandler):
+    """
+    Stores jobs in a SQLite table keyed by Job_URL. Re-scraping a job
+    updates its row instead of adding a duplicate, so re-running a role is
+    idempotent. The database runs in WAL mode so dashboards can read while
+    the scraper writes.
+    """
+
+    def __init__(self, table: str = "jobs", logger=None):
+        """
+        Initialize SQLite Storage Handler
+
+        Args:
+            table: Table name
+            logger: Logger instance (if None, creates a default logger)
+        """
+        self.table = table
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._connections: Dict[str, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+
+        columns = ", ".join(_quote(column) for column in JOB_COLUMNS)
+        placeholders = ", ".join("?" for _ in JOB_COLUMNS)
+        updates = ", ".join(
+            f"{_quote(column)} = excluded.{_quote(column)}" for column in JOB_COLUMNS if column != "Job_URL"
+        )
+        self._upsert_sql = (
+            f"INSERT INTO {_quote(table)} ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT(Job_URL) DO UPDATE SET {updates}"
+        )
+
+    def get_name(self) -> str:
+        return "SQLiteStorageHandler"
+
+    def _connect(self, filename: str) -> sqlite3.Connection:
+        """Open (once per database file) and prepare the schema."""
+        conn = self._connections.get(filename)
+        if conn is not None:
+            return conn
+
+        os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        conn = sqlite3.connect(filename, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        column_defs = ", ".join(f"{_quote(column)} TEXT" for column in JOB_COLUMNS)
+        with conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} ({column_defs})")
+            conn.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(f'ux_{self.table}_job_url')} "
+                f"ON {_quote(self.table)} (Job_URL)")
+            for column in INDEXED_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'ix_{self.table}_{column.lower()}')} "
+                    f"ON {_quote(self.table)} ({_quote(column)})")
+
+        self._connections[filename] = conn
+        return conn
+
+    @staticmethod
+    def _to_row(values: tuple) -> tuple:
+        row = []
+        for value in values:
+            if isinstance(value, (list, tuple)):
+                value = json.dumps(list(value), ensure_ascii=False)
+            elif value is not None:
+                value = str(value)
+            row.append(value)
+        return tuple(row)
+
+    def save(self, clean_dataset: List[Dict], filename: str) -> None:
+        """
+        Upsert records into the SQLite database in a single transaction
+
+        Args:
+            clean_dataset: List of dictionaries containing job data
+            filename: Path of the SQLite database file
+        """
+        self.save_batch(JobBatch(clean_dataset), filename)
+
+    def save_batch(self, batch: JobBatch, filename: str) -> None:
+        """
+        Upsert a column-oriented batch into the SQLite database in a single transaction
+
+        Args:
+            batch: Records to write
+            filename: Path of the SQLite database file
+        """
+        if not batch:
+            self.logger.warning("No data received to save. Skipping write.")
+            return
+
+        url_index = JOB_COLUMNS.index("Job_URL")
+        rows = [self._to_row(values) for values in batch.rows(JOB_COLUMNS) if values[url_index]]
+        skipped = len(batch) - len(rows)
+        if skipped:
+            self.logger.warning(f"Skipping {skipped} records without Job_URL")
+
+        try:
+            with self._lock:
+                conn = self._connect(filename)
+                with conn:
+                    conn.executemany(self._upsert_sql, rows)
+            self.logger.info(f"Upserted {len(rows)} rows into {filename}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Error saving data to SQLite database {filename}: {e}")
+            raise  # Re-raise to let caller know it failed
+
+    def close(self) -> None:
+        """Close all open database connections."""
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
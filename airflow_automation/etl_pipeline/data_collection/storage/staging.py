@@ -0,0 +1,59 @@
+"""
+Merge of the per-task staged CSV files into the main CSV dataset
+(see merge_staged_outputs in dags/job_scraper.py).
+"""
+
+from typing import Optional
+import csv
+import glob
+import logging
+import os
+
+from ..records import JobBatch
+from .CSVStoragehandler import CSVStorageHandler
+
+
+def merge_staging_dirs(staging_dir: str, target: str, current_dir: Optional[str] = None,
+                       handler: Optional[CSVStorageHandler] = None, logger=None) -> int:
+    """
+    Append the CSVs of every run dir under `staging_dir` to `target`, then
+    remove the merged files and dirs. Leftovers of earlier runs are merged
+    first, `current_dir` last. A failed append raises and keeps the files
+    of that run dir for the next merge.
+
+    Staged rows are read with the csv module, so cells are appended exactly
+    as written ("NA", skill list reprs, numbers with leading zeros); a
+    pandas round trip would turn placeholders into NaN and re-infer dtypes.
+
+    Returns:
+        Number of merged records
+    """
+    logger = logger or logging.getLogger("data_collection")
+    handler = handler or CSVStorageHandler(logger=logger)
+    run_dirs = sorted((path for path in glob.glob(os.path.join(staging_dir, "*")) if os.path.isdir(path)),
+                      key=lambda path: (path == current_dir, path))
+    if not run_dirs:
+        logger.warning(f"No staged outputs found in {staging_dir}")
+        return 0
+
+    total = 0
+    for run_dir in run_dirs:
+        staged_files = sorted(glob.glob(os.path.join(run_dir, "*.csv")))
+        if staged_files:
+            if run_dir != current_dir:
+                logger.warning(f"Merging {len(staged_files)} staged file(s) left behind in {run_dir}")
+            merged = JobBatch()
+            for path in staged_files:
+                with open(path, newline="", encoding="utf-8") as f:
+                    merged.extend(csv.DictReader(f))
+            handler.save_batch(merged, target)
+            total += len(merged)
+            for path in staged_files:
+                os.remove(path)
+        # Sidecar lock files of the staged CSVs (see utils.file_lock)
+        for path in glob.glob(os.path.join(run_dir, "*.csv.lock")):
+            os.remove(path)
+        os.rmdir(run_dir)
+
+    logger.info(f"Merged {total} records from {len(run_dirs)} staging dir(s) into {target}")
+    return total
@@ -1,10 +1,21 @@
 # utils/backoff.py
+import asyncio
 import random
+import threading
 import time
 import logging
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlparse
+
+from .metrics import inc
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 def exponential_backoff(retry_fn, max_retries=5, base_delay=2, max_delay=60):
     """
     Retry a function with exponential backoff and jitter.
@@ -23,3 +34,279 @@ def exponential_backoff(retry_fn, max_retries=5, base_delay=2, max_delay=60):
             attempt += 1
     logger.error(f"Max retries ({max_retries}) reached. Giving up.")
     raise RuntimeError("Exponential backoff failed after max retries.")
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc or url
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class HTTPStatusError(Exception):
+    """A response whose status code is worth retrying (429, 5xx)."""
+
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}, next trial in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker over a rolling window of call outcomes.
+
+    closed    -> calls pass; once at least `min_calls` of the last `window`
+                 calls were made and the failure rate reaches
+                 `failure_threshold`, the circuit opens
+    open      -> calls fail fast with CircuitOpenError for `reset_timeout` seconds
+    half-open -> a single trial call is let through; success closes the
+                 circuit, failure opens it again, and a trial that ends
+                 without an outcome (cancelled) is abandoned: the circuit
+                 reopens for another `reset_timeout`
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: float = 0.5, window: int = 20, min_calls: int = 5,
+                 reset_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._outcomes: Dict[str, deque] = {}
+        self._state: Dict[str, str] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_running: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._current_state_locked(host, time.monotonic())
+
+    def _current_state_locked(self, host: str, now: float) -> str:
+        state = self._state.get(host, self.CLOSED)
+        if state == self.OPEN and now - self._opened_at[host] >= self.reset_timeout:
+            state = self._state[host] = self.HALF_OPEN
+            self._trial_running[host] = False
+        return state
+
+    def before_call(self, host: str) -> bool:
+        """
+        Raise CircuitOpenError if calls to the host must not be made right now.
+
+        Returns:
+            True if the call is the half-open trial (see abandon_trial)
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state_locked(host, now)
+            if state == self.OPEN:
+                raise CircuitOpenError(host, self.reset_timeout - (now - self._opened_at[host]))
+            if state == self.HALF_OPEN:
+                if self._trial_running.get(host):
+                    raise CircuitOpenError(host, 0)
+                self._trial_running[host] = True
+                return True
+        return False
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            if self._state.get(host) == self.HALF_OPEN:
+                logger.info(f"Circuit for {host} closed again")
+                self._state[host] = self.CLOSED
+                self._outcomes.pop(host, None)
+            self._outcomes.setdefault(host, deque(maxlen=self.window)).append(True)
+
+    def abandon_trial(self, host: str) -> None:
+        """Release a half-open trial that was cancelled before it had an outcome."""
+        with self._lock:
+            if self._state.get(host) == self.HALF_OPEN and self._trial_running.get(host):
+                logger.info(f"Trial call to {host} was abandoned, circuit stays open")
+                self._state[host] = self.OPEN
+                self._opened_at[host] = time.monotonic()
+                self._trial_running[host] = False
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._state.get(host) == self.HALF_OPEN:
+                self._open_locked(host, now)
+                return
+            outcomes = self._outcomes.setdefault(host, deque(maxlen=self.window))
+            outcomes.append(False)
+            failures = outcomes.count(False)
+            if len(outcomes) >= self.min_calls and failures / len(outcomes) >= self.failure_threshold:
+                self._open_locked(host, now)
+
+    def _open_locked(self, host: str, now: float) -> None:
+        logger.warning(f"Circuit for {host} opened, failing fast for {self.reset_timeout:.0f}s")
+        inc("circuit_opened_total", host=host)
+        self._state[host] = self.OPEN
+        self._opened_at[host] = now
+        self._outcomes.pop(host, None)
+
+
+class RetryPolicy:
+    """
+    Retries calls to a host with exponential backoff and jitter, but only for
+    errors worth retrying: connection problems, timeouts and HTTP 429/5xx
+    (HTTPStatusError). Anything else is raised immediately.
+
+    State is shared per host by every caller of the policy: a Retry-After
+    from one response holds back all requests to that host, and the optional
+    CircuitBreaker makes calls fail fast while the host is down.
+
+    Usage:
+        policy = RetryPolicy(breaker=CircuitBreaker())
+        html = policy.call(lambda: fetcher.fetch(url), url)
+        html = await policy.call_async(lambda: fetch_async(url), url)
+    """
+
+    DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError, OSError)
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 2, max_delay: float = 60,
+                 max_retry_after: float = 300, retry_exceptions: Tuple[Type[BaseException], ...] = (),
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff of the first retry (doubled each attempt)
+            max_delay: Cap of the exponential backoff
+            max_retry_after: Cap of a server supplied Retry-After
+            retry_exceptions: Extra exception types to treat as transient (e.g. WebDriverException)
+            breaker: Per-host circuit breaker (None to disable)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.retry_exceptions = self.DEFAULT_RETRY_EXCEPTIONS + tuple(retry_exceptions)
+        self.breaker = breaker
+        self._hold_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, HTTPStatusError):
+            return error.status == 429 or error.status >= 500
+        return isinstance(error, self.retry_exceptions)
+
+    def _delay(self, attempt: int, error: BaseException) -> float:
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return min(self.max_delay, self.base_delay * (2 ** attempt)) + random.uniform(0, 1)
+
+    def _hold_host(self, host: str, delay: float) -> None:
+        """Make every caller wait out a Retry-After for this host."""
+        with self._lock:
+            self._hold_until[host] = max(self._hold_until.get(host, 0), time.monotonic() + delay)
+
+    def _host_wait(self, host: str) -> float:
+        with self._lock:
+            return max(0.0, self._hold_until.get(host, 0) - time.monotonic())
+
+    def _before_attempt(self, host: str) -> bool:
+        """Check the circuit; True if this attempt is the breaker's half-open trial."""
+        if self.breaker:
+            return self.breaker.before_call(host)
+        return False
+
+    def _on_abandoned(self, host: str, trial: bool) -> None:
+        """An attempt was cancelled (or interrupted): it has no outcome to record."""
+        if trial:
+            self.breaker.abandon_trial(host)
+
+    def _on_success(self, host: str) -> None:
+        if self.breaker:
+            self.breaker.record_success(host)
+
+    def _on_error(self, host: str, attempt: int, error: BaseException) -> float:
+        """Record a failed attempt; return the delay before retrying, or re-raise."""
+        retryable = self.is_retryable(error)
+        if self.breaker:
+            # Non-transient errors (e.g. 404) still mean the host answered
+            if retryable:
+                self.breaker.record_failure(host)
+            else:
+                self.breaker.record_success(host)
+        if not retryable or attempt >= self.max_retries:
+            if retryable:
+                logger.error(f"Giving up on {host} after {attempt + 1} attempts: {error}")
+                inc("retry_giveups_total", host=host)
+            raise error
+
+        delay = self._delay(attempt, error)
+        if getattr(error, "retry_after", None) is not None:
+            self._hold_host(host, delay)
+        logger.warning(f"Attempt {attempt + 1} failed for {host}: {error}. Retrying in {delay:.2f}s")
+        inc("retries_total", host=host, reason=getattr(error, "status", None) or type(error).__name__)
+        return delay
+
+    def call(self, fn: Callable[[], T], url: str) -> T:
+        """Call fn (a request to url) with retries, blocking between attempts."""
+        host = _host_of(url)
+        attempt = 0
+        while True:
+            wait_time = self._host_wait(host)
+            if wait_time > 0:
+                time.sleep(wait_time)
+            trial = self._before_attempt(host)
+            try:
+                result = fn()
+            except Exception as e:
+                time.sleep(self._on_error(host, attempt, e))
+                attempt += 1
+                continue
+            except BaseException:
+                self._on_abandoned(host, trial)
+                raise
+            self._on_success(host)
+            return result
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]], url: str) -> T:
+        """Await fn() (a request to url) with retries, without blocking the event loop."""
+        host = _host_of(url)
+        attempt = 0
+        while True:
+            wait_time = self._host_wait(host)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            trial = self._before_attempt(host)
+            try:
+                result = await fn()
+            except Exception as e:
+                await asyncio.sleep(self._on_error(host, attempt, e))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled (e.g. by a job timeout) before the host answered
+                self._on_abandoned(host, trial)
+                raise
+            self._on_success(host)
+            return result
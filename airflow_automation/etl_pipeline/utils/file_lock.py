@@ -0,0 +1,81 @@
+# utils/file_lock.py
+"""
+Exclusive inter-process lock on a sidecar "<path>.lock" file, so several
+processes (e.g. mapped Airflow tasks) can append to the same output file.
+Uses flock on POSIX and msvcrt.locking on Windows.
+
+Usage:
+    with FileLock("etl_pipeline/data/raw/scraped_data.csv"):
+        ...
+"""
+
+from typing import Optional
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LockTimeout(TimeoutError):
+    """The lock could not be acquired within the timeout."""
+
+
+class FileLock:
+    """Blocking exclusive lock; also excludes other threads of the same process."""
+
+    def __init__(self, path: str, timeout: Optional[float] = None, poll_interval: float = 0.05):
+        """
+        Args:
+            path: File to protect; the lock itself is taken on path + ".lock"
+            timeout: Seconds to wait before raising LockTimeout (None = wait forever)
+            poll_interval: Seconds between attempts while waiting
+        """
+        self.lock_path = path + ".lock"
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while not self._try_lock(fd):
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                raise LockTimeout(f"Timed out waiting for {self.lock_path}")
+            time.sleep(self.poll_interval)
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
@@ -1,17 +1,135 @@
+import atexit
+import copy
+import json
 import logging
 import logging.config
+import logging.handlers
+import queue
 import yaml
 import os
 
-def setup_logging(config_path=None):
+# Extra fields copied into JSON log lines when a record carries them, e.g.
+# logger.info("Found 20 jobs", extra={"role": role, "page": 3, "latency_ms": 812})
+STRUCTURED_FIELDS = ("role", "location", "page", "latency_ms", "url", "extractor", "records")
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as JSON lines, one object per record, for later aggregation."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        # Queued records carry the traceback as text only (see _QueueHandler)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps the message and the traceback apart.
+    The stock prepare() merges the formatted traceback into the message
+    and drops exc_info, so JSON lines lost their exc_info field; here it
+    travels as exc_text, which text formatters append as usual.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            # Tracebacks hold frames, which must not outlive the logging call
+            record.exc_info = None
+        return record
+
+
+class _LoggerRoutes(logging.Handler):
+    """
+    Hands each queued record to the handlers of the logger it was logged
+    on and of its ancestors, as Logger.callHandlers would, stopping at a
+    logger with propagate off. Runs on the listener thread only.
+    """
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        while True:
+            handlers, propagate = self.routes.get(name, ((), True))
+            for handler in handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            if not propagate or name == "root":
+                return True
+            name = name.rpartition(".")[0] or "root"
+
+
+def _queue_handlers(logger_names) -> None:
+    """
+    Move the handlers of the given loggers and the root logger behind one
+    QueueHandler on the root logger. Records are put on an in-memory queue
+    by the logging thread and written to disk/console by a single
+    QueueListener thread, so callers never block on I/O and handlers shared
+    by several loggers are only ever written from that thread.
+    """
+    global _listener
+    routes = {}
+    root = logging.getLogger()
+    for logger in [logging.getLogger(name) for name in logger_names] + [root]:
+        routes[logger.name] = (list(logger.handlers), logger.propagate)
+        for handler in routes[logger.name][0]:
+            logger.removeHandler(handler)
+        # Every record reaches the root QueueHandler; _LoggerRoutes applies propagate
+        logger.propagate = True
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(_QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, _LoggerRoutes(routes))
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(config_path=None, use_queue=True, json_logs=False):
     """
     Setup logging from a YAML config file.
     Ensures the log directory exists before configuring handlers.
-    """ 
+
+    Args:
+        config_path: logging.yml to load (defaults to configuration/logging.yml)
+        use_queue: Write records from one background listener thread (QueueHandler/QueueListener)
+        json_logs: Write the log files as JSON lines instead of the configured text format
+    """
     # Default path to logging.yml in the same folder as this file
     if config_path is None:
-        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "configuration\logging.yml")
-   
+        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "configuration", "logging.yml")
+
 
     print("Loading logging config from:", config_path)
 
@@ -26,17 +144,21 @@ def setup_logging(config_path=None):
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             handler["filename"] = os.path.join(project_root, handler["filename"])
             os.makedirs(os.path.dirname(handler["filename"]), exist_ok=True)
+            if json_logs:
+                handler["formatter"] = "json"
+    if json_logs:
+        config.setdefault("formatters", {})["json"] = {"()": JsonFormatter}
 
-            # print("-"*50)
-            # print("Handler : ", handler)
-            # print("Log file : ", handler["filename"])
-            # print("file root ", project_root)
-            # print("-"*50)
-            # print()
+    # Reconfiguring replaces the handlers, so stop the old listener first
+    stop_logging()
 
     # Configure logging
     logging.config.dictConfig(config)
+
+    if use_queue:
+        _queue_handlers(config.get("loggers", {}))
+
     logging.info("Logging is configured successfully.")
 
 if __name__ == "__main__":
-    setup_logging()
\ No newline at end of file
+    setup_logging()
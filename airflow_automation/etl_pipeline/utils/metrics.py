@@ -0,0 +1,204 @@
+# utils/metrics.py
+"""
+In-process metrics for the scraping pipeline.
+
+Counters and histograms live in a process-wide registry and are labelled
+by extractor, role and location. Those labels come from a context
+variable set by the pipeline (extractor, role) and the extractors
+(location), so deep call sites such as fetchers or the retry policy are
+labelled without passing them around. Asyncio tasks and
+asyncio.to_thread copy the context automatically; thread pools must
+submit through contextvars.copy_context().run.
+
+Usage:
+    with metric_labels(role="data-scientist", location="pune"):
+        with timer("detail_fetch_seconds", fetcher="http"):
+            html = fetch(url)
+        inc("bytes_fetched_total", len(html), kind="detail")
+
+    REGISTRY.summary()               # JSON-friendly dict
+    REGISTRY.write_prometheus(path)  # Prometheus text exposition format
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+import os
+import tempfile
+import threading
+import time
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_labels: ContextVar[Dict[str, str]] = ContextVar("metric_labels", default={})
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+@contextmanager
+def metric_labels(**labels) -> Iterator[None]:
+    """Add labels to every metric recorded in this context (None values are ignored)."""
+    current = _labels.get()
+    token = _labels.set({**current, **{k: str(v) for k, v in labels.items() if v is not None}})
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "count", "sum", "max")
+
+    def __init__(self, buckets: int):
+        self.bucket_counts = [0] * (buckets + 1)  # last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class MetricsRegistry:
+    """Thread-safe counters and fixed-bucket histograms."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> LabelKey:
+        merged = {**_labels.get(), **{k: str(v) for k, v in labels.items() if v is not None}}
+        return tuple(sorted(merged.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(self.buckets))
+            histogram.bucket_counts[index] += 1
+            histogram.count += 1
+            histogram.sum += value
+            histogram.max = max(histogram.max, value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Observe the duration of the block in seconds (also when it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _quantile(self, histogram: _Histogram, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        rank = q * histogram.count
+        cumulative, lower = 0, 0.0
+        for upper, bucket_count in zip(self.buckets + (histogram.max,), histogram.bucket_counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                upper = min(upper, histogram.max)
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+            lower = upper
+        return histogram.max
+
+    def summary(self) -> Dict[str, Dict[str, List[Dict]]]:
+        """JSON-friendly snapshot: totals per counter series, count/sum/mean/p50/p95/max per histogram series."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {}
+            for name, series in self._histograms.items():
+                histograms[name] = [{
+                    "labels": dict(key),
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "mean": round(h.sum / h.count, 6) if h.count else 0.0,
+                    "p50": round(self._quantile(h, 0.5), 6),
+                    "p95": round(self._quantile(h, 0.95), 6),
+                    "max": round(h.max, 6),
+                } for key, h in series.items()]
+        return {"counters": counters, "histograms": histograms}
+
+    def totals(self) -> Dict[str, Tuple[int, float]]:
+        """(count, sum) of every histogram across all label values."""
+        with self._lock:
+            return {
+                name: (sum(h.count for h in series.values()), sum(h.sum for h in series.values()))
+                for name, series in self._histograms.items()
+            }
+
+    @staticmethod
+    def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(key) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        escaped = (k + '="' + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+                   for k, v in pairs)
+        return "{" + ",".join(escaped) + "}"
+
+    def to_prometheus(self, prefix: str = "scraper_") -> str:
+        """Render all series in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {prefix}{name} counter")
+                for key, value in series.items():
+                    lines.append(f"{prefix}{name}{self._format_labels(key)} {float(value):.17g}")
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {prefix}{name} histogram")
+                for key, h in series.items():
+                    cumulative = 0
+                    for upper, bucket_count in zip(self.buckets + (float("inf"),), h.bucket_counts):
+                        cumulative += bucket_count
+                        le = "+Inf" if upper == float("inf") else f"{upper:g}"
+                        lines.append(f"{prefix}{name}_bucket{self._format_labels(key, ('le', le))} {cumulative}")
+                    lines.append(f"{prefix}{name}_sum{self._format_labels(key)} {h.sum:.6f}")
+                    lines.append(f"{prefix}{name}_count{self._format_labels(key)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "scraper_") -> None:
+        """Atomically write the metrics file (e.g. for node_exporter's textfile collector)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.to_prometheus(prefix))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# Process-wide registry used by the pipeline, extractors, fetchers and retry policy
+REGISTRY = MetricsRegistry()
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    REGISTRY.inc(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    REGISTRY.observe(name, value, **labels)
+
+
+def timer(name: str, **labels):
+    return REGISTRY.timer(name, **labels)
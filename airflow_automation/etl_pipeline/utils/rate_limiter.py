@@ -0,0 +1,120 @@
+# utils/rate_limiter.py
+import asyncio
+import threading
+import time
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class _Bucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Per-host token bucket shared by all workers of one or more extractors.
+
+    Every host refills at `requests_per_second` tokens per second up to
+    `burst` tokens, so short bursts go out immediately while the long-run
+    rate stays capped. Taking a token never fails: when the bucket is empty
+    the caller reserves a future token (the bucket goes into debt) and waits
+    for it, so waiters are served in arrival order. Threads block in
+    acquire() and coroutines await acquire_async(); both share the same
+    buckets.
+    """
+
+    def __init__(self, requests_per_second: float = 0.5, burst: float = 1):
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._host_rates: Dict[str, float] = {}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the rate limiting key (network location) for a URL."""
+        return urlparse(url).netloc or url
+
+    def set_host_rate(self, host: str, requests_per_second: float) -> None:
+        """Override the rate of one host (e.g. from a robots.txt Crawl-delay)."""
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        with self._lock:
+            self._host_rates[host] = requests_per_second
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket.rate = requests_per_second
+
+    def rate_for(self, host: str) -> float:
+        return self._host_rates.get(host, self.requests_per_second)
+
+    def _bucket_locked(self, host: str, now: float) -> _Bucket:
+        """Return the host's bucket refilled up to now (caller holds the lock)."""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _Bucket(self.rate_for(host), self.burst, now)
+        else:
+            bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+        return bucket
+
+    def _reserve(self, url: str, tokens: float = 1) -> float:
+        """Take tokens from the URL's host bucket and return how long to wait for them."""
+        with self._lock:
+            bucket = self._bucket_locked(self.host_of(url), time.monotonic())
+            bucket.tokens -= tokens
+            return 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+
+    def try_acquire(self, url: str) -> bool:
+        """Take a token only if one is available right now (never waits)."""
+        with self._lock:
+            bucket = self._bucket_locked(self.host_of(url), time.monotonic())
+            if bucket.tokens < 1:
+                return False
+            bucket.tokens -= 1
+            return True
+
+    def acquire(self, url: str) -> float:
+        """
+        Block until a request to the URL's host is allowed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {self.host_of(url)}")
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self, url: str) -> float:
+        """
+        Wait without blocking the event loop until a request to the URL's host is allowed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait_time = self._reserve(url)
+        if wait_time > 0:
+            logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {self.host_of(url)}")
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+
+def rate_from_delays(min_delay: float, max_delay: float) -> Optional[float]:
+    """Requests per second equivalent to a uniform random sleep between the two delays."""
+    mean_delay = (min_delay + max_delay) / 2
+    return 1.0 / mean_delay if mean_delay > 0 else None
@@ -1,26 +1,232 @@
 # utils/robots.py
 import urllib.robotparser
 from urllib.parse import urlparse
+from typing import Dict, Optional, Tuple
+import asyncio
 import logging
+import os
+import sqlite3
+import threading
+import time
+
+import requests
 
 logger = logging.getLogger(__name__)
 
-def is_allowed(url: str, user_agent: str = "*") -> bool:
+
+class _HostPolicy:
+    __slots__ = ("parser", "expires_at")
+
+    def __init__(self, parser: urllib.robotparser.RobotFileParser, expires_at: float):
+        self.parser = parser
+        self.expires_at = expires_at
+
+
+class RobotsCache:
     """
-    Check robots.txt to see if scraping is allowed for the given URL.
+    robots.txt policies fetched once per host and kept in memory, and
+    optionally in SQLite so later runs reuse them until the TTL expires.
+
+    A check is a dict lookup plus RobotFileParser.can_fetch, cheap enough
+    for every listing and detail URL; only the first check of a host (or
+    the first after expiry) downloads robots.txt, and concurrent workers
+    wait for that single download.
+
+    Status handling follows RobotFileParser.read(): 401/403 disallow
+    everything, other 4xx allow everything. If robots.txt cannot be fetched
+    (network error, 5xx) a stale stored copy is used when there is one,
+    otherwise the host is disallowed for `error_ttl` seconds.
+
+    Usage:
+        robots = RobotsCache("etl_pipeline/data/state/robots.sqlite", rate_limiter=limiter)
+        if robots.is_allowed(url):
+            ...
     """
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
-
-    rp = urllib.robotparser.RobotFileParser()
-    try:
-        rp.set_url(robots_url)
-        rp.read()
-        allowed = rp.can_fetch(user_agent, url)
+
+    def __init__(self, path: Optional[str] = None, ttl_hours: float = 24, error_ttl: float = 300,
+                 user_agent: str = "*", fetch_user_agent: Optional[str] = None, timeout: float = 10,
+                 rate_limiter=None, logger=None):
+        """
+        Initialize the robots.txt cache.
+
+        Args:
+            path: SQLite database file for the disk cache (None = memory only)
+            ttl_hours: How long a fetched robots.txt is trusted
+            error_ttl: Seconds before retrying a robots.txt that could not be fetched
+            user_agent: Agent name matched against the robots.txt groups
+            fetch_user_agent: User-Agent header of the robots.txt request
+            timeout: HTTP timeout in seconds
+            rate_limiter: RateLimiter slowed down to a host's Crawl-delay / Request-rate
+            logger: Logger instance
+        """
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.error_ttl = error_ttl
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._http = requests.Session()
+        if fetch_user_agent:
+            self._http.headers["User-Agent"] = fetch_user_agent
+
+        self._policies: Dict[str, _HostPolicy] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS robots (
+                        origin TEXT PRIMARY KEY,
+                        status INTEGER NOT NULL,
+                        body TEXT NOT NULL,
+                        fetched_at REAL NOT NULL
+                    )""")
+
+    @staticmethod
+    def origin_of(url: str) -> str:
+        """scheme://host of a URL; robots.txt applies per origin."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme or 'https'}://{parsed.netloc}"
+
+    def is_allowed(self, url: str) -> bool:
+        """Check whether robots.txt allows fetching the URL."""
+        allowed = self._policy(self.origin_of(url)).can_fetch(self.user_agent, url)
         if not allowed:
-            logger.warning(f"Scraping disallowed by robots.txt for: {url}")
+            self.logger.warning(f"Scraping disallowed by robots.txt for: {url}")
         return allowed
-    except Exception as e:
-        logger.error(f"Error fetching robots.txt from {robots_url}: {e}")
-        # If robots.txt fails to load, default to safe side (disallow)
-        return False
+
+    async def is_allowed_async(self, url: str) -> bool:
+        """is_allowed() that only leaves the event loop when robots.txt must be (re)loaded."""
+        if self._cached_policy(self.origin_of(url)) is None:
+            return await asyncio.to_thread(self.is_allowed, url)
+        return self.is_allowed(url)
+
+    def crawl_delay(self, url: str) -> Optional[float]:
+        """Seconds between requests asked for by the host's robots.txt (Crawl-delay or Request-rate)."""
+        return self._crawl_delay(self._policy(self.origin_of(url)))
+
+    def _crawl_delay(self, parser: urllib.robotparser.RobotFileParser) -> Optional[float]:
+        delay = parser.crawl_delay(self.user_agent)
+        if delay is not None:
+            return float(delay)
+        rate = parser.request_rate(self.user_agent)
+        if rate is not None and rate.requests:
+            return rate.seconds / rate.requests
+        return None
+
+    def _cached_policy(self, origin: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        with self._lock:
+            policy = self._policies.get(origin)
+        if policy is not None and policy.expires_at > time.time():
+            return policy.parser
+        return None
+
+    def _policy(self, origin: str) -> urllib.robotparser.RobotFileParser:
+        parser = self._cached_policy(origin)
+        if parser is not None:
+            return parser
+
+        with self._lock:
+            host_lock = self._host_locks.setdefault(origin, threading.Lock())
+        with host_lock:
+            # Another worker may have loaded it while we waited
+            parser = self._cached_policy(origin)
+            if parser is None:
+                parser, expires_at = self._load(origin)
+                with self._lock:
+                    self._policies[origin] = _HostPolicy(parser, expires_at)
+                self._apply_crawl_delay(origin, parser)
+            return parser
+
+    def _load(self, origin: str) -> Tuple[urllib.robotparser.RobotFileParser, float]:
+        """Return a parser and its expiry time, from disk if fresh, else from the network."""
+        now = time.time()
+        stored = self._read_stored(origin)
+        if stored is not None and stored[2] + self.ttl_seconds > now:
+            return self._build(stored[0], stored[1]), stored[2] + self.ttl_seconds
+
+        robots_url = f"{origin}/robots.txt"
+        try:
+            response = self._http.get(robots_url, timeout=self.timeout)
+            if response.status_code >= 500:
+                raise requests.HTTPError(f"HTTP {response.status_code}")
+            status, body = response.status_code, response.text if response.status_code == 200 else ""
+        except requests.RequestException as e:
+            if stored is not None:
+                self.logger.warning(f"Error fetching {robots_url}: {e}. Using the stored copy")
+                return self._build(stored[0], stored[1]), now + self.error_ttl
+            self.logger.error(f"Error fetching robots.txt from {robots_url}: {e}")
+            # If robots.txt fails to load, default to safe side (disallow)
+            parser = urllib.robotparser.RobotFileParser(robots_url)
+            parser.disallow_all = True
+            return parser, now + self.error_ttl
+
+        self.logger.debug(f"Fetched {robots_url} (HTTP {status})")
+        self._store(origin, status, body, now)
+        return self._build(status, body), now + self.ttl_seconds
+
+    @staticmethod
+    def _build(status: int, body: str) -> urllib.robotparser.RobotFileParser:
+        parser = urllib.robotparser.RobotFileParser()
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(body.splitlines())
+        return parser
+
+    def _apply_crawl_delay(self, origin: str, parser: urllib.robotparser.RobotFileParser) -> None:
+        """Slow the rate limiter down to the host's Crawl-delay (never speed it up)."""
+        if self.rate_limiter is None:
+            return
+        delay = self._crawl_delay(parser)
+        if not delay:
+            return
+        host = self.rate_limiter.host_of(origin)
+        requests_per_second = 1.0 / delay
+        if requests_per_second < self.rate_limiter.rate_for(host):
+            self.logger.info(f"robots.txt Crawl-delay {delay:g}s for {host}, lowering its request rate")
+            self.rate_limiter.set_host_rate(host, requests_per_second)
+
+    def _read_stored(self, origin: str) -> Optional[Tuple[int, str, float]]:
+        if self._conn is None:
+            return None
+        with self._lock:
+            return self._conn.execute(
+                "SELECT status, body, fetched_at FROM robots WHERE origin = ?", (origin,)).fetchone()
+
+    def _store(self, origin: str, status: int, body: str, fetched_at: float) -> None:
+        if self._conn is None:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO robots VALUES (?, ?, ?, ?)",
+                               (origin, status, body, fetched_at))
+
+    def close(self) -> None:
+        self._http.close()
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+
+
+_default_caches: Dict[str, RobotsCache] = {}
+_default_lock = threading.Lock()
+
+
+def is_allowed(url: str, user_agent: str = "*") -> bool:
+    """
+    Check robots.txt to see if scraping is allowed for the given URL.
+    robots.txt is fetched once per host and kept in memory.
+    """
+    with _default_lock:
+        cache = _default_caches.get(user_agent)
+        if cache is None:
+            cache = _default_caches[user_agent] = RobotsCache(user_agent=user_agent)
+    return cache.is_allowed(url)
@@ -0,0 +1,82 @@
+"""Tests of the async pipeline's per-job timeout and cancellation."""
+
+import asyncio
+import threading
+
+from etl_pipeline.data_collection.async_pipeline import AsyncPipeline
+from etl_pipeline.data_collection.base import AsyncJobExtractor, StorageHandler
+
+
+class SlowExtractor(AsyncJobExtractor):
+    """Yields `ready` records, then stalls until cancelled."""
+
+    def __init__(self, ready=2):
+        self.ready = ready
+        self.stalled = threading.Event()
+        self.closed = False
+
+    async def extract(self, job_name):
+        return [record async for record in self.iter_extract(job_name)]
+
+    async def iter_extract(self, job_name, progress=None):
+        for i in range(self.ready):
+            yield {"Title": job_name, "Job_URL": f"https://x/{job_name}/{i}"}
+        self.stalled.set()
+        await asyncio.sleep(3600)
+
+    def get_name(self):
+        return "SlowExtractor"
+
+    async def aclose(self):
+        self.closed = True
+
+
+class MemoryHandler(StorageHandler):
+    def __init__(self):
+        self.records = []
+
+    def save(self, clean_dataset, filename):
+        self.records.extend(clean_dataset)
+
+    def get_name(self):
+        return "MemoryHandler"
+
+
+def pipeline(extractor, handler, jobs, **kwargs):
+    return AsyncPipeline([extractor], [handler], jobs, {"MemoryHandler": "unused"}, batch_size=100, **kwargs)
+
+
+def test_job_timeout_fails_the_job_but_keeps_scraped_records():
+    extractor, handler = SlowExtractor(), MemoryHandler()
+    stats = pipeline(extractor, handler, ["Data Scientist"], job_timeout=0.2).run()
+
+    details = stats["job_details"]["Data Scientist"]
+    assert not details["success"]
+    assert "TimeoutError" in details["errors"][0]
+    assert stats["failed_jobs"] == 1 and not stats["cancelled"]
+    # Records scraped before the timeout are flushed, not lost
+    assert [record["Job_URL"] for record in handler.records] == ["https://x/Data Scientist/0",
+                                                                 "https://x/Data Scientist/1"]
+    assert extractor.closed
+
+
+def test_cancel_from_another_thread_stops_the_run():
+    extractor, handler = SlowExtractor(ready=1), MemoryHandler()
+    runner = pipeline(extractor, handler, ["Data Scientist", "ML Engineer"], max_concurrency=1)
+
+    def cancel_when_stalled():
+        extractor.stalled.wait(5)
+        runner.cancel()
+
+    canceller = threading.Thread(target=cancel_when_stalled)
+    canceller.start()
+    stats = runner.run()
+    canceller.join()
+
+    assert stats["cancelled"]
+    assert stats["successful_jobs"] == 0
+    assert stats["job_details"]["Data Scientist"]["errors"] == ["cancelled"]
+    # The queued job never started
+    assert stats["job_details"]["ML Engineer"]["errors"] == ["cancelled"]
+    assert [record["Job_URL"] for record in handler.records] == ["https://x/Data Scientist/0"]
+    assert extractor.closed
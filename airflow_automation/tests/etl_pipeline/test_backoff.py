@@ -0,0 +1,117 @@
+"""Tests of the retry policy and the per-host circuit breaker."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from etl_pipeline.utils import backoff
+from etl_pipeline.utils.backoff import CircuitBreaker, CircuitOpenError, HTTPStatusError, RetryPolicy
+
+
+URL = "https://www.naukri.com/job-listings-1"
+HOST = "www.naukri.com"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Only the backoff module sees the fake clock; the event loop keeps real time
+    clock = Clock()
+    monkeypatch.setattr(backoff, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+@pytest.fixture
+def breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=0.5, window=4, min_calls=2, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure(HOST)
+    return breaker
+
+
+def fail(error):
+    def call():
+        raise error
+    return call
+
+
+def test_retries_only_transient_errors(clock):
+    policy = RetryPolicy(max_retries=2)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise HTTPStatusError(URL, 503)
+        return "<html>"
+
+    assert policy.call(flaky, URL) == "<html>"
+    assert len(attempts) == 3
+    with pytest.raises(HTTPStatusError):
+        policy.call(fail(HTTPStatusError(URL, 404)), URL)
+
+
+def test_half_open_trial_closes_or_reopens(breaker, clock):
+    assert breaker.state(HOST) == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(HOST)
+
+    clock.now += 60
+    assert breaker.before_call(HOST)
+    # Only one trial at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(HOST)
+    breaker.record_failure(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.OPEN
+
+    clock.now += 60
+    assert breaker.before_call(HOST)
+    breaker.record_success(HOST)
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
+    assert not breaker.before_call(HOST)
+
+
+def test_interrupted_trial_is_released(breaker, clock):
+    policy = RetryPolicy(breaker=breaker)
+    clock.now += 60
+
+    with pytest.raises(KeyboardInterrupt):
+        policy.call(fail(KeyboardInterrupt()), URL)
+
+    assert breaker.state(HOST) == CircuitBreaker.OPEN
+    clock.now += 60
+    assert policy.call(lambda: "<html>", URL) == "<html>"
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
+
+
+def test_cancelled_async_trial_is_released(breaker, clock):
+    policy = RetryPolicy(breaker=breaker)
+    clock.now += 60
+
+    async def hang():
+        await asyncio.sleep(3600)
+
+    async def ok():
+        return "<html>"
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(policy.call_async(hang, URL), timeout=0.05)
+        assert breaker.state(HOST) == CircuitBreaker.OPEN
+        # Not wedged: the next trial is let through once the circuit is half-open again
+        clock.now += 60
+        return await policy.call_async(ok, URL)
+
+    assert asyncio.run(scenario()) == "<html>"
+    assert breaker.state(HOST) == CircuitBreaker.CLOSED
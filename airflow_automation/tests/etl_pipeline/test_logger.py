@@ -0,0 +1,93 @@
+"""Tests of the queue-based logging setup."""
+
+import json
+import logging
+import threading
+
+import pytest
+import yaml
+
+from etl_pipeline.utils.logger import setup_logging, stop_logging
+
+
+@pytest.fixture
+def log_config(tmp_path):
+    """Two loggers sharing an error file, like configuration/logging.yml."""
+    def file_handler(name, level):
+        return {"class": "logging.FileHandler", "level": level, "formatter": "plain",
+                "filename": str(tmp_path / f"{name}.log")}
+
+    config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {"plain": {"format": "%(name)s | %(levelname)s | %(message)s"}},
+        "handlers": {
+            "file_scraper": file_handler("scraper", "DEBUG"),
+            "file_error": file_handler("error", "ERROR"),
+        },
+        "loggers": {
+            "test_scraper": {"level": "DEBUG", "handlers": ["file_scraper", "file_error"], "propagate": False},
+            "test_storage": {"level": "INFO", "handlers": ["file_error"], "propagate": False},
+        },
+        "root": {"level": "WARNING", "handlers": ["file_error"]},
+    }
+    path = tmp_path / "logging.yml"
+    path.write_text(yaml.safe_dump(config))
+    yield str(path)
+
+    stop_logging()
+    logging.config.dictConfig({"version": 1, "disable_existing_loggers": False,
+                               "loggers": {"test_scraper": {}, "test_storage": {}}, "root": {}})
+
+
+def lines(tmp_path, name):
+    return (tmp_path / f"{name}.log").read_text(encoding="utf-8").splitlines()
+
+
+
+def test_records_reach_the_handlers_of_their_logger(tmp_path, log_config):
+    setup_logging(log_config)
+    logging.getLogger("test_scraper.pages").debug("page 1")
+    logging.getLogger("test_storage").error("disk full")
+    logging.getLogger("other").error("root only")
+    stop_logging()
+
+    assert lines(tmp_path, "scraper") == ["test_scraper.pages | DEBUG | page 1"]
+    # Shared by both loggers and the root, written once per record
+    assert lines(tmp_path, "error") == ["test_storage | ERROR | disk full", "other | ERROR | root only"]
+
+
+def test_one_listener_for_all_loggers(log_config):
+    before = threading.active_count()
+    setup_logging(log_config)
+    assert threading.active_count() == before + 1
+    # Reconfiguring replaces the listener instead of adding one
+    setup_logging(log_config)
+    assert threading.active_count() == before + 1
+
+
+def test_json_lines_keep_the_traceback(tmp_path, log_config):
+    setup_logging(log_config, json_logs=True)
+    try:
+        raise ValueError("bad page")
+    except ValueError:
+        logging.getLogger("test_scraper").exception("Parsing failed", extra={"page": 3})
+    stop_logging()
+
+    entry = json.loads(lines(tmp_path, "scraper")[0])
+    assert entry["message"] == "Parsing failed"
+    assert entry["page"] == 3
+    assert "ValueError: bad page" in entry["exc_info"]
+
+
+def test_text_lines_show_the_traceback_once(tmp_path, log_config):
+    setup_logging(log_config)
+    try:
+        raise ValueError("bad page")
+    except ValueError:
+        logging.getLogger("test_scraper").exception("Parsing failed")
+    stop_logging()
+
+    text = "\n".join(lines(tmp_path, "scraper"))
+    assert text.startswith("test_scraper | ERROR | Parsing failed\nTraceback")
+    assert text.count("ValueError: bad page") == 1
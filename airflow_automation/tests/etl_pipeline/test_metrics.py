@@ -0,0 +1,93 @@
+"""Tests of the stage metrics and their export."""
+
+import asyncio
+import logging
+
+from etl_pipeline.data_collection.base import JobExtractor, StorageHandler
+from etl_pipeline.data_collection.pipeline import Pipeline
+from etl_pipeline.utils.metrics import REGISTRY, MetricsRegistry, metric_labels
+
+
+class OneJobExtractor(JobExtractor):
+    def extract(self, job_name, max_pages=None, max_limit=None):
+        return [{"Title": job_name, "Job_URL": "https://x/1"}]
+
+    def get_name(self):
+        return "OneJobExtractor"
+
+
+class MemoryHandler(StorageHandler):
+    def save(self, clean_dataset, filename):
+        pass
+
+    def get_name(self):
+        return "MemoryHandler"
+
+
+def test_context_labels_apply_to_nested_calls():
+    registry = MetricsRegistry()
+    with metric_labels(role="Data Scientist", location=None):
+        with metric_labels(location="pune"):
+            registry.inc("pages_total", kind="listing")
+        registry.inc("pages_total", kind="listing")
+
+    async def task():
+        registry.inc("pages_total", kind="detail")
+
+    with metric_labels(role="ML Engineer"):
+        asyncio.run(task())
+
+    values = {tuple(sorted(entry["labels"].items())): entry["value"]
+              for entry in registry.summary()["counters"]["pages_total"]}
+    assert values == {
+        (("kind", "listing"), ("location", "pune"), ("role", "Data Scientist")): 1,
+        (("kind", "listing"), ("role", "Data Scientist")): 1,
+        (("kind", "detail"), ("role", "ML Engineer")): 1,
+    }
+
+
+def test_histogram_summary():
+    registry = MetricsRegistry(buckets=(0.1, 1, 10))
+    for value in (0.05, 0.5, 0.5, 5):
+        registry.observe("detail_fetch_seconds", value, fetcher="http")
+
+    (series,) = registry.summary()["histograms"]["detail_fetch_seconds"]
+    assert series["labels"] == {"fetcher": "http"}
+    assert series["count"] == 4 and series["sum"] == 6.05 and series["max"] == 5
+    assert 0.1 <= series["p50"] <= 1
+    assert 1 <= series["p95"] <= 5
+    assert registry.totals() == {"detail_fetch_seconds": (4, 6.05)}
+
+
+def test_prometheus_text_format():
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    registry.inc("records_saved_total", 3, handler="CSVStorageHandler")
+    registry.observe("handler_save_seconds", 0.5, role='Data "Sci"')
+
+    assert registry.to_prometheus().splitlines() == [
+        "# TYPE scraper_records_saved_total counter",
+        'scraper_records_saved_total{handler="CSVStorageHandler"} 3',
+        "# TYPE scraper_handler_save_seconds histogram",
+        'scraper_handler_save_seconds_bucket{role="Data \\"Sci\\"",le="0.1"} 0',
+        'scraper_handler_save_seconds_bucket{role="Data \\"Sci\\"",le="1"} 1',
+        'scraper_handler_save_seconds_bucket{role="Data \\"Sci\\"",le="+Inf"} 1',
+        'scraper_handler_save_seconds_sum{role="Data \\"Sci\\""} 0.500000',
+        'scraper_handler_save_seconds_count{role="Data \\"Sci\\""} 1',
+    ]
+
+
+def test_pipeline_exports_metrics(tmp_path):
+    REGISTRY.reset()
+    path = tmp_path / "metrics" / "scraper.prom"
+    pipeline = Pipeline([OneJobExtractor()], [MemoryHandler()], ["Data Scientist"], {"MemoryHandler": "unused"},
+                        metrics_path=str(path), logger=logging.getLogger("pipeline"))
+    stats = pipeline.run()
+
+    (saved,) = stats["metrics"]["counters"]["records_saved_total"]
+    assert saved["value"] == 1
+    assert saved["labels"] == {"handler": "MemoryHandler", "extractor": "OneJobExtractor", "role": "Data Scientist"}
+    text = path.read_text()
+    assert 'scraper_records_saved_total{extractor="OneJobExtractor",handler="MemoryHandler",role="Data Scientist"} 1' in text
+    assert "scraper_handler_save_seconds_count" in text
+    # Written atomically: no temp files left next to it
+    assert [p.name for p in path.parent.iterdir()] == ["scraper.prom"]
@@ -0,0 +1,59 @@
+"""Tests of NaukriJobExtractor's incremental bookkeeping, served from the page cache."""
+
+import pytest
+
+from benchmarks.stand_in_server import StandInServer
+from etl_pipeline.data_collection.extractors.NaukriExtractor import NaukriJobExtractor
+from etl_pipeline.data_collection.state.page_cache import PageCache
+from etl_pipeline.data_collection.state.seen_index import SeenIndex
+
+
+ROLE = "data-scientist"
+
+
+@pytest.fixture
+def stand_in():
+    # Renders the pages only; the server is never started
+    server = StandInServer(pages=1, jobs_per_page=3, detail_padding_kb=0)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def cache(tmp_path, stand_in):
+    """Listing and detail pages of one search, so the extractor never touches the network."""
+    cache = PageCache(str(tmp_path / "pages.sqlite"))
+    cache.put(next(stand_in.listing_urls(ROLE)), stand_in.render_listing(ROLE, 1), kind="listing")
+    for index, job_url in enumerate(stand_in.job_urls(ROLE, 1), 1):
+        cache.put(job_url, stand_in.render_detail(ROLE, 1, index), kind="detail")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def seen(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"))
+    yield index
+    index.close()
+
+
+def extractor(stand_in, cache, seen, mode):
+    return NaukriJobExtractor(max_pages=1, fetch_mode="http", base_url=stand_in.base_url, page_cache=cache,
+                              seen_index=seen, extraction_mode=mode)
+
+
+def test_listing_run_leaves_detail_pages_to_a_later_detail_run(stand_in, cache, seen):
+    job_urls = list(stand_in.job_urls(ROLE, 1))
+
+    cards = extractor(stand_in, cache, seen, "listing").extract(ROLE)
+    assert [record.job_url for record in cards] == job_urls
+    assert all(record.partial for record in cards)
+    assert seen.known(job_urls) == [False] * 3
+
+    jobs = extractor(stand_in, cache, seen, "detail").extract(ROLE)
+    assert [record.job_url for record in jobs] == job_urls
+    assert not any(record.partial for record in jobs)
+    assert seen.known(job_urls) == [True] * 3
+
+    # Now they are known, a further run skips them
+    assert extractor(stand_in, cache, seen, "detail").extract(ROLE) == []
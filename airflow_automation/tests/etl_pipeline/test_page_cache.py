@@ -0,0 +1,90 @@
+"""Tests of the on-disk page cache: TTL, replay and the LRU size cap."""
+
+import os
+
+import pytest
+
+from etl_pipeline.data_collection.state import page_cache
+from etl_pipeline.data_collection.state.page_cache import PageCache
+
+
+def page(n):
+    # Random content: pages do not share bodies and compress to about half their size
+    return os.urandom(2048).hex() + f"<p>{n}</p>"
+
+
+def stored_size(cache):
+    return cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = PageCache(str(tmp_path / "pages.sqlite"), ttl_hours=1, max_size_mb=0.05)
+    yield store
+    store.close()
+
+
+def test_get_respects_kind_and_ttl(tmp_path, monkeypatch):
+    cache = PageCache(str(tmp_path / "pages.sqlite"), ttl_hours=1)
+    cache.put("https://x/1", "<html>1</html>", kind="listing")
+    assert cache.get("https://x/1") == "<html>1</html>"
+    assert cache.get("https://x/1", kind="detail") is None
+
+    later = page_cache.time.time() + 7200
+    monkeypatch.setattr(page_cache.time, "time", lambda: later)
+    assert cache.get("https://x/1") is None
+    cache.close()
+
+    replay = PageCache(str(tmp_path / "pages.sqlite"), ttl_hours=1, replay=True)
+    assert replay.get("https://x/1") == "<html>1</html>"
+    replay.close()
+
+
+def test_running_size_tracks_inserts_replacements_and_shared_bodies(cache):
+    cache.put("https://x/1", page(1))
+    shared = page(2)
+    cache.put("https://x/2", shared)
+    cache.put("https://x/3", shared)
+    # A refetched page with new content frees its old body
+    cache.put("https://x/1", page(4))
+    assert cache.stats()["size_bytes"] == stored_size(cache)
+
+    cache.put("https://x/2", page(5))
+    # Still referenced by https://x/3
+    assert cache.get("https://x/3") == shared
+    assert cache.stats()["size_bytes"] == stored_size(cache)
+
+
+def test_eviction_drops_least_recently_used_pages(cache):
+    for n in range(30):
+        cache.put(f"https://x/{n}", page(n))
+        cache.get("https://x/0")
+
+    stats = cache.stats()
+    assert stats["size_bytes"] == stored_size(cache)
+    assert stats["size_bytes"] <= cache.max_size_bytes
+    assert stats["pages"] < 30
+    # Kept alive by the reads
+    assert cache.get("https://x/0") is not None
+    assert cache.get("https://x/1") is None
+
+
+def test_size_is_reloaded_on_open(tmp_path, cache):
+    cache.put("https://x/1", page(1))
+    size = cache.stats()["size_bytes"]
+    cache.close()
+
+    reopened = PageCache(cache.path, max_size_mb=0.05)
+    assert reopened.stats()["size_bytes"] == size
+    reopened.close()
+
+
+def test_purge_expired_frees_bodies(cache, monkeypatch):
+    cache.put("https://x/1", page(1))
+    later = page_cache.time.time() + 7200
+    monkeypatch.setattr(page_cache.time, "time", lambda: later)
+    cache.put("https://x/2", page(2))
+
+    assert cache.purge_expired() == 1
+    assert cache.stats()["pages"] == 1
+    assert cache.stats()["size_bytes"] == stored_size(cache)
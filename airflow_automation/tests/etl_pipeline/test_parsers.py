@@ -0,0 +1,48 @@
+"""Tests of the detail page parser backends."""
+
+from pathlib import Path
+
+import pytest
+
+from etl_pipeline.data_collection.extractors.parsers import PARSER_BACKENDS, get_parser
+
+
+FIXTURES_DIR = Path(__file__).parents[2] / "benchmarks" / "fixtures"
+
+PAGE = """
+<html><head><script>var build = "01 January 2020";</script></head><body>
+  <h1 class="styles_jd-header-title__rZwM1">Data Scientist</h1>
+  <div class="styles_jhc__jd-stats__KrId0">
+    <span class="styles_jhc__stat__PgY67"><label>Posted: </label><span>3 days ago</span></span>
+  </div>
+  <div class="styles_JDC__dang-inner-html__h0K4t"><p>Build models.</p><p>Apply by 14 March 2025.</p></div>
+  <footer>Copyright 31 December 2024</footer>
+</body></html>
+"""
+
+
+@pytest.fixture(params=list(PARSER_BACKENDS))
+def parser(request):
+    return get_parser(request.param)
+
+
+@pytest.mark.parametrize("fixture", sorted(path.name for path in FIXTURES_DIR.glob("detail_page_*.html")))
+def test_backends_match_bs4(fixture, parser):
+    html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+    assert parser.parse(html) == get_parser("bs4").parse(html)
+
+
+def test_apply_by_date_comes_from_the_description(parser):
+    """Dates in scripts or outside the job header and description are ignored"""
+    fields = parser.parse(PAGE)
+    assert fields["Posted_Date"] == "3 days ago"
+    assert fields["Last_Apply_Date"] == "14 March 2025"
+
+
+def test_missing_fields_use_placeholders(parser):
+    fields = parser.parse("<html><body><h1 class='styles_jd-header-title__rZwM1'>QA</h1></body></html>")
+    assert fields["Title"] == "QA"
+    assert fields["Company"] == "NA"
+    assert fields["Education"] == "Not Available"
+    assert fields["Last_Apply_Date"] == "NA"
+    assert fields["Star_Skills"] == [] and fields["Normal_Skills"] == []
@@ -0,0 +1,75 @@
+"""Tests of the pipeline's checkpoint commits at stored batch boundaries."""
+
+import logging
+
+import pytest
+
+from etl_pipeline.data_collection.base import JobExtractor, StorageHandler
+from etl_pipeline.data_collection.pipeline import Pipeline
+from etl_pipeline.data_collection.state.checkpoint import CheckpointStore
+
+
+class PagedExtractor(JobExtractor):
+    """Two listing pages of two jobs each; fails before finishing the second page."""
+
+    def extract(self, job_name, max_pages=None, max_limit=None):
+        return list(self.iter_extract(job_name))
+
+    def iter_extract(self, job_name, progress=None):
+        for page_no in (1, 2):
+            for i in range(2):
+                yield {"Title": job_name, "Job_URL": f"https://x/{page_no}/{i}"}
+                if page_no == 2:
+                    raise ConnectionError("listing page 2 went away")
+            progress.page_done("mumbai", page_no, f"https://x/p{page_no}", f"https://x/p{page_no + 1}")
+
+    def get_name(self):
+        return "PagedExtractor"
+
+
+class MemoryHandler(StorageHandler):
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.records = []
+
+    def save(self, clean_dataset, filename):
+        if self.fail:
+            raise OSError("disk full")
+        self.records.extend(clean_dataset)
+
+    def get_name(self):
+        return "MemoryHandler"
+
+
+@pytest.fixture
+def store(tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    yield checkpoint
+    checkpoint.close()
+
+
+def run(handler, store):
+    pipeline = Pipeline([PagedExtractor()], [handler], ["Data Scientist"], {"MemoryHandler": "unused"},
+                        batch_size=2, checkpoint=store, resume=True,
+                        logger=logging.getLogger("pipeline"))
+    return pipeline.run()
+
+
+def test_failed_extractor_resumes_after_the_last_stored_page(store):
+    handler = MemoryHandler()
+    stats = run(handler, store)
+
+    assert stats["failed_jobs"] == 1
+    # The record scraped before the failure is kept ...
+    assert len(handler.records) == 3
+    # ... but only the finished page is checkpointed, and the location stays open
+    assert store.resume_point("PagedExtractor", "Data Scientist", "mumbai") == (2, "https://x/p2")
+    assert not store.is_location_done("PagedExtractor", "Data Scientist", "mumbai")
+    assert not store.is_role_done("Data Scientist")
+
+
+def test_unsaved_pages_are_not_checkpointed(store):
+    stats = run(MemoryHandler(fail=True), store)
+
+    assert stats["failed_jobs"] == 1
+    assert store.resume_point("PagedExtractor", "Data Scientist", "mumbai") is None
@@ -0,0 +1,98 @@
+"""Tests of the robots.txt cache."""
+
+import pytest
+import requests
+
+from etl_pipeline.utils.rate_limiter import RateLimiter
+from etl_pipeline.utils.robots import RobotsCache
+
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /jobapi/
+Crawl-delay: 10
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    """Stands in for requests.Session; counts robots.txt downloads."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        pass
+
+
+def robots_cache(path, *responses, **kwargs):
+    cache = RobotsCache(path, **kwargs)
+    cache._http = FakeSession(*responses)
+    return cache
+
+
+def test_rules_are_fetched_once_per_host(tmp_path):
+    cache = robots_cache(str(tmp_path / "robots.sqlite"), FakeResponse(200, ROBOTS_TXT))
+
+    assert cache.is_allowed("https://www.naukri.com/data-scientist-jobs")
+    assert not cache.is_allowed("https://www.naukri.com/jobapi/v3/search")
+    assert cache.is_allowed("https://www.naukri.com/job-listings-1")
+    assert cache._http.requested == ["https://www.naukri.com/robots.txt"]
+    cache.close()
+
+
+def test_stored_rules_are_reused_until_the_ttl(tmp_path):
+    path = str(tmp_path / "robots.sqlite")
+    robots_cache(path, FakeResponse(200, ROBOTS_TXT)).is_allowed("https://www.naukri.com/")
+
+    later = robots_cache(path)
+    assert not later.is_allowed("https://www.naukri.com/jobapi/v3/search")
+    assert later._http.requested == []
+
+    expired = robots_cache(path, FakeResponse(200, ""), ttl_hours=0)
+    assert expired.is_allowed("https://www.naukri.com/jobapi/v3/search")
+    assert expired._http.requested == ["https://www.naukri.com/robots.txt"]
+
+
+@pytest.mark.parametrize("status, allowed", [(403, False), (401, False), (404, True)])
+def test_error_statuses(status, allowed):
+    cache = robots_cache(None, FakeResponse(status))
+    assert cache.is_allowed("https://www.naukri.com/job-listings-1") is allowed
+
+
+def test_unreachable_robots_txt(tmp_path):
+    path = str(tmp_path / "robots.sqlite")
+    # Nothing stored: disallow for now
+    cache = robots_cache(path, requests.ConnectionError("down"))
+    assert not cache.is_allowed("https://www.naukri.com/job-listings-1")
+
+    # A stale stored copy beats disallowing everything
+    robots_cache(path, FakeResponse(200, ROBOTS_TXT)).is_allowed("https://www.naukri.com/")
+    stale = robots_cache(path, requests.ConnectionError("down"), ttl_hours=0)
+    assert stale.is_allowed("https://www.naukri.com/job-listings-1")
+    assert not stale.is_allowed("https://www.naukri.com/jobapi/v3/search")
+
+
+def test_crawl_delay_lowers_the_host_rate():
+    limiter = RateLimiter(requests_per_second=1)
+    cache = robots_cache(None, FakeResponse(200, ROBOTS_TXT), FakeResponse(200, "Crawl-delay: 0.1"),
+                         rate_limiter=limiter)
+
+    assert cache.crawl_delay("https://www.naukri.com/") == 10
+    assert limiter.rate_for("www.naukri.com") == pytest.approx(0.1)
+    # A Crawl-delay never speeds a host up
+    cache.is_allowed("https://example.com/")
+    assert limiter.rate_for("example.com") == 1
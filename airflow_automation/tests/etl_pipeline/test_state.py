@@ -0,0 +1,175 @@
+"""Tests of the persistent scraper state: seen index, dedup index and checkpoints."""
+
+import pytest
+
+from etl_pipeline.data_collection.records import JobRecord
+from etl_pipeline.data_collection.state.checkpoint import CheckpointStore, JobProgress
+from etl_pipeline.data_collection.state.dedup_index import DedupIndex, simhash
+from etl_pipeline.data_collection.state.seen_index import SeenIndex
+
+
+DESCRIPTION = (
+    "We are looking for a data scientist to build forecasting models for our supply chain team. "
+    "You will work with large datasets in Python and SQL, design experiments, present findings to "
+    "business stakeholders and deploy models to production together with the platform engineers. "
+    "Experience with pandas, scikit-learn and cloud data warehouses is expected. The role offers "
+    "flexible working hours, a yearly learning budget, health insurance for your family and the chance "
+    "to shape how a fast growing company uses data. Our team of twelve analysts and engineers works from "
+    "Mumbai and Bengaluru and meets in person once a month to plan the next quarter together."
+)
+
+
+def job(url, description=DESCRIPTION, company="Acme Analytics", partial=False):
+    return JobRecord.from_fields({"Job_URL": url, "Company": company, "Description": description},
+                                 partial=partial)
+
+
+@pytest.fixture
+def seen(tmp_path):
+    index = SeenIndex(str(tmp_path / "seen.sqlite"))
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def dedup(tmp_path):
+    index = DedupIndex(str(tmp_path / "dedup.sqlite"))
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    yield checkpoint
+    checkpoint.close()
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.naukri.com/job-listings-data-scientist-123",
+    "https://www.naukri.com/job-listings-data-scientist-123/",
+    "https://www.naukri.com/job-listings-data-scientist-123?src=jobsearchDesk&sid=42",
+    "https://www.naukri.com/job-listings-data-scientist-123#apply",
+])
+def test_seen_index_normalize(url):
+    """Tracking parameters, fragments and trailing slashes don't make a job new"""
+    assert SeenIndex.normalize(url) == "https://www.naukri.com/job-listings-data-scientist-123"
+
+
+def test_seen_index_known(seen):
+    seen.add_many(["https://www.naukri.com/job-1?src=a"])
+    assert seen.known(["https://www.naukri.com/job-1?src=b", "https://www.naukri.com/job-2"]) == [True, False]
+    assert "https://www.naukri.com/job-1" in seen
+
+
+def test_simhash_skips_short_texts():
+    assert simhash("Python developer, 3 years") is None
+    assert simhash(DESCRIPTION) is not None
+
+
+def test_simhash_near_duplicates_are_close():
+    edited = DESCRIPTION.replace("supply chain team", "logistics team")
+    assert (simhash(DESCRIPTION) ^ simhash(edited)).bit_count() <= 6
+    other = ("Join our mobile team as an Android engineer. You will write Kotlin, review pull requests, "
+             "profile app startup, ship features to millions of users every week and mentor junior "
+             "developers while working closely with designers and product managers on new releases.")
+    assert (simhash(DESCRIPTION) ^ simhash(other)).bit_count() > 6
+
+
+def test_dedup_drops_stored_urls(dedup):
+    session = dedup.session()
+    assert session.admit(job("https://www.naukri.com/job-1"))
+    session.commit()
+
+    session = dedup.session()
+    assert not session.admit(job("https://www.naukri.com/job-1?src=other", description="x"))
+
+
+def test_dedup_drops_near_duplicates_of_the_same_company(dedup):
+    session = dedup.session()
+    assert session.admit(job("https://www.naukri.com/job-1"))
+    # Repost under a new URL, caught while the first is still in flight
+    assert not session.admit(job("https://www.naukri.com/job-2", DESCRIPTION.replace("SQL", "Spark")))
+    assert session.admit(job("https://www.naukri.com/job-3", company="Other Corp"))
+    session.commit()
+
+    # Found through the bands of the stored fingerprint
+    assert not dedup.session().admit(job("https://www.naukri.com/job-4", DESCRIPTION + " Apply now."))
+
+
+def test_dedup_discard_forgets_keys(dedup):
+    session = dedup.session()
+    assert session.admit(job("https://www.naukri.com/job-1"))
+    session.discard()
+
+    assert dedup.session().admit(job("https://www.naukri.com/job-1"))
+    assert len(dedup) == 0
+
+
+def test_dedup_full_record_completes_listing_only_row(dedup):
+    session = dedup.session()
+    assert session.admit(job("https://www.naukri.com/job-1", partial=True))
+    session.commit()
+
+    session = dedup.session()
+    assert not session.admit(job("https://www.naukri.com/job-1", partial=True))
+    assert session.admit(job("https://www.naukri.com/job-1"))
+    session.commit()
+    assert not dedup.session().admit(job("https://www.naukri.com/job-1"))
+
+
+def test_checkpoint_resume_point(store):
+    store.mark_page("naukri", "Data Scientist", "mumbai", 1, "https://x/p1", "https://x/p2")
+    store.mark_page("naukri", "Data Scientist", "mumbai", 2, "https://x/p2", "https://x/p3")
+    assert store.resume_point("naukri", "Data Scientist", "mumbai") == (3, "https://x/p3")
+    assert store.resume_point("naukri", "Data Scientist", "delhi") is None
+
+    store.mark_location_done("naukri", "Data Scientist", "mumbai")
+    assert store.is_location_done("naukri", "Data Scientist", "mumbai")
+    assert store.resume_point("naukri", "Data Scientist", "mumbai") is None
+
+
+def test_checkpoint_last_page_has_no_resume_point(store):
+    store.mark_page("naukri", "Data Scientist", "mumbai", 4, "https://x/p4", None)
+    assert store.resume_point("naukri", "Data Scientist", "mumbai") is None
+
+
+def test_checkpoint_survives_reopen(tmp_path):
+    path = str(tmp_path / "checkpoint.sqlite")
+    store = CheckpointStore(path)
+    store.mark_page("naukri", "Data Scientist", "", 1, "https://x/p1", "https://x/p2")
+    store.mark_role_done("ML Engineer")
+    store.close()
+
+    store = CheckpointStore(path)
+    assert store.resume_point("naukri", "Data Scientist", "") == (2, "https://x/p2")
+    assert store.is_role_done("ML Engineer")
+    store.clear()
+    assert not store.is_role_done("ML Engineer")
+    store.close()
+
+
+def test_job_progress_commits_only_what_was_reported(store):
+    progress = JobProgress("Data Scientist", "naukri", store)
+    stored = []
+    progress.page_done("mumbai", 1, "https://x/p1", "https://x/p2")
+    progress.on_stored(lambda: stored.append(1))
+    reported = progress.reported()
+    progress.page_done("mumbai", 2, "https://x/p2", "https://x/p3")
+
+    # Nothing takes effect before the pipeline commits
+    assert progress.resume_point("mumbai") is None
+    progress.commit(reported)
+    assert progress.resume_point("mumbai") == (2, "https://x/p2")
+    assert stored == [1]
+
+
+def test_job_progress_discard(store):
+    progress = JobProgress("Data Scientist", "naukri", store)
+    progress.page_done("mumbai", 1, "https://x/p1", "https://x/p2")
+    progress.discard()
+    progress.location_done("mumbai")
+    progress.commit()
+
+    assert progress.resume_point("mumbai") is None
+    assert not progress.is_location_done("mumbai")
@@ -0,0 +1,188 @@
+"""Tests of the column-oriented job batches and the storage handlers."""
+
+import csv
+import json
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from etl_pipeline.data_collection.records import JOB_COLUMNS, JobBatch, JobRecord
+from etl_pipeline.data_collection.storage.CSVStoragehandler import CSVStorageHandler
+from etl_pipeline.data_collection.storage.ParquetStoragehandler import ParquetStorageHandler
+from etl_pipeline.data_collection.storage.SQLiteStoragehandler import SQLiteStorageHandler
+from etl_pipeline.data_collection.storage.staging import merge_staging_dirs
+
+
+def job(url, **details):
+    return JobRecord.from_fields({"Title": "Data Scientist", "Job_URL": url, "Star_Skills": ["Python"],
+                                  "Scraped_At": "2025-09-15T10:00:00", "Job_Type": "Data Scientist",
+                                  **details})
+
+
+def test_job_batch_pads_extra_labels():
+    """A label first seen mid-batch gets None for earlier rows and later rows that lack it"""
+    batch = JobBatch([job("https://x/1"), job("https://x/2", Shift="Night"), job("https://x/3")])
+
+    assert batch.column_names == JOB_COLUMNS + ["Shift"]
+    assert batch.column("Shift") == [None, "Night", None]
+    assert batch.column("Role") == [None, None, None]
+    assert all(len(row) == len(JOB_COLUMNS) + 1 for row in batch.rows())
+
+
+def test_job_batch_accepts_dict_records():
+    batch = JobBatch([{"Title": "ML Engineer", "Job_URL": "https://x/1", "Role": "Engineer"}])
+    assert batch.to_records()[0]["Role"] == "Engineer"
+    assert batch.column("Title") == ["ML Engineer"]
+
+
+def test_job_batch_extend_batch_copies_columns():
+    buffered = JobBatch([job("https://x/1")])
+    batch = JobBatch([job("https://x/2", Shift="Night")])
+    buffered.extend_batch(batch)
+    batch.clear()
+
+    assert len(buffered) == 2
+    assert buffered.column("Job_URL") == ["https://x/1", "https://x/2"]
+    assert buffered.column("Shift") == [None, "Night"]
+    buffered.extend_batch(JobBatch([job("https://x/3")]))
+    assert buffered.column("Shift") == [None, "Night", None]
+
+
+def test_job_batch_to_arrow_converts_to_the_schema():
+    schema = pa.schema([("Job_URL", pa.string()), ("Star_Skills", pa.list_(pa.string())),
+                        ("Scraped_At", pa.timestamp("us")), ("Shift", pa.string())])
+    # The second row as re-read from a CSV file
+    batch = JobBatch([job("https://x/1"),
+                      {"Job_URL": "https://x/2", "Star_Skills": "['Python', 'SQL']", "Scraped_At": "NA"}])
+
+    table = batch.to_arrow(schema)
+    assert table.schema == schema
+    assert table.column("Star_Skills").to_pylist() == [["Python"], ["Python", "SQL"]]
+    assert [str(ts) for ts in table.column("Scraped_At").to_pylist()] == ["2025-09-15 10:00:00", "None"]
+    assert table.column("Shift").to_pylist() == [None, None]
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_csv_rewrites_header_for_new_labels(tmp_path):
+    path = str(tmp_path / "jobs.csv")
+    handler = CSVStorageHandler()
+    handler.save_batch(JobBatch([job("https://x/1")]), path)
+    handler.save_batch(JobBatch([job("https://x/2", Shift="Night")]), path)
+
+    rows = read_rows(path)
+    assert rows[0] == JOB_COLUMNS + ["Shift"]
+    # The older row is padded, so no column shifts
+    assert [len(row) for row in rows] == [len(JOB_COLUMNS) + 1] * 3
+    frame = pd.read_csv(path)
+    assert frame["Job_URL"].tolist() == ["https://x/1", "https://x/2"]
+    assert frame["Shift"].fillna("").tolist() == ["", "Night"]
+
+
+def test_csv_appends_in_header_order(tmp_path):
+    path = str(tmp_path / "jobs.csv")
+    handler = CSVStorageHandler()
+    handler.save_batch(JobBatch([job("https://x/1", Shift="Day")]), path)
+    # Record without the extra label: written in the file's layout
+    handler.save_batch(JobBatch([job("https://x/2")]), path)
+
+    frame = pd.read_csv(path)
+    assert frame["Job_URL"].tolist() == ["https://x/1", "https://x/2"]
+    assert frame["Shift"].fillna("").tolist() == ["Day", ""]
+
+
+def test_csv_repairs_torn_last_line(tmp_path):
+    path = str(tmp_path / "jobs.csv")
+    handler = CSVStorageHandler()
+    handler.save_batch(JobBatch([job("https://x/1")]), path)
+    with open(path, "a", encoding="utf-8") as f:
+        # A writer killed mid-row
+        f.write("Data Scien")
+
+    handler.save_batch(JobBatch([job("https://x/2")]), path)
+
+    rows = read_rows(path)
+    assert rows[-2] == ["Data Scien"]
+    assert rows[-1][JOB_COLUMNS.index("Job_URL")] == "https://x/2"
+
+
+def test_csv_buffer_writes_on_size_and_flush(tmp_path):
+    path = str(tmp_path / "jobs.csv")
+    handler = CSVStorageHandler(buffer_size=3)
+    handler.save_batch(JobBatch([job("https://x/1"), job("https://x/2")]), path)
+    assert handler.has_buffered_records()
+    assert not (tmp_path / "jobs.csv").exists()
+
+    handler.save_batch(JobBatch([job("https://x/3")]), path)
+    assert not handler.has_buffered_records()
+    assert len(pd.read_csv(path)) == 3
+
+    handler.save_batch(JobBatch([job("https://x/4")]), path)
+    handler.flush()
+    assert len(pd.read_csv(path)) == 4
+
+
+def test_parquet_round_trip(tmp_path):
+    root = str(tmp_path / "parquet")
+    ParquetStorageHandler().save_batch(JobBatch([job("https://x/1"), job("https://x/2"),
+                                                 job("https://x/3", Job_Type="", Scraped_At="NA")]), root)
+
+    frame = pd.read_parquet(root, filters=[("Job_Type", "=", "Data Scientist")])
+    assert sorted(frame["Job_URL"]) == ["https://x/1", "https://x/2"]
+    assert list(frame["Star_Skills"].iloc[0]) == ["Python"]
+    assert str(frame["scrape_date"].iloc[0]) == "2025-09-15"
+    unknown = pd.read_parquet(root, filters=[("Job_Type", "=", "unknown")])
+    assert unknown["Job_URL"].tolist() == ["https://x/3"]
+    assert str(unknown["scrape_date"].iloc[0]) == "unknown"
+
+
+def test_parquet_conversion_errors_are_raised(tmp_path, monkeypatch):
+    handler = ParquetStorageHandler()
+
+    def broken_table(batch):
+        raise pa.ArrowInvalid("bad value")
+
+    monkeypatch.setattr(handler, "_to_table", broken_table)
+    with pytest.raises(pa.ArrowInvalid):
+        handler.save_batch(JobBatch([job("https://x/1")]), str(tmp_path / "parquet"))
+
+
+def test_sqlite_upserts_on_job_url(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    handler = SQLiteStorageHandler()
+    handler.save_batch(JobBatch([job("https://x/1"), job("https://x/2")]), path)
+    # A re-scraped job updates its row; records without a URL are skipped
+    handler.save_batch(JobBatch([job("https://x/1", Title="Senior Data Scientist"), job("")]), path)
+    handler.close()
+
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute("SELECT Job_URL, Title, Star_Skills FROM jobs ORDER BY Job_URL").fetchall()
+    assert rows == [("https://x/1", "Senior Data Scientist", json.dumps(["Python"])),
+                    ("https://x/2", "Data Scientist", json.dumps(["Python"]))]
+
+
+def test_merge_staging_dirs_keeps_cells_as_written(tmp_path):
+    staging = tmp_path / "staging"
+    target = str(tmp_path / "scraped_data.csv")
+    handler = CSVStorageHandler()
+    # A leftover of an earlier run whose merge failed, and this run's output
+    handler.save_batch(JobBatch([job("https://x/1", Company="NA", Salary="007")]),
+                       str(staging / "run_1" / "group1.csv"))
+    handler.save_batch(JobBatch([job("https://x/2", Shift="Night")]), str(staging / "run_2" / "group1.csv"))
+    handler.save_batch(JobBatch([job("https://x/3")]), str(staging / "run_2" / "group2.csv"))
+
+    assert merge_staging_dirs(str(staging), target, current_dir=str(staging / "run_2")) == 3
+
+    rows = read_rows(target)
+    header = rows[0]
+    merged = [dict(zip(header, row)) for row in rows[1:]]
+    assert [row["Job_URL"] for row in merged] == ["https://x/1", "https://x/2", "https://x/3"]
+    assert merged[0]["Company"] == "NA" and merged[0]["Salary"] == "007"
+    assert merged[0]["Star_Skills"] == "['Python']"
+    assert [row["Shift"] for row in merged] == ["", "Night", ""]
+    assert not list(staging.iterdir())
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple
 from datetime import datetime
@@ -29,6 +30,19 @@ class DataValidator(ABC):
 class FeatureBasedDataValidator(DataValidator):
     """Validator for specific features: timestamp, URL, description"""
     
+    # Formats pd.to_datetime tries column-wise before the per-value fallback
+    # (is_timestamp); the first two are what datetime.isoformat() produces
+    TIMESTAMP_FORMATS = [
+        "%Y-%m-%dT%H:%M:%S.%f",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d %H:%M:%S.%f",
+        "%d-%m-%Y %H:%M:%S",
+        "%Y/%m/%d %H:%M:%S",
+    ]
+    JOB_URL_PATTERN = r'^https?://(www\.)?naukri\.com/.+$'
+    EMPTY_DESCRIPTIONS = ['NA', 'N/A', 'NOT AVAILABLE', '']
+    
     def __init__(self, 
                  validated_path: str = "data/processed/validated",
                  rejected_path: str = "data/processed/rejected"):
@@ -117,9 +131,7 @@ class FeatureBasedDataValidator(DataValidator):
         job_url = job_url.strip()
         
         # Check basic URL structure
-        url_pattern = r'^https?://(www\.)?naukri\.com/.+$'
-        
-        if not re.match(url_pattern, job_url, re.IGNORECASE):
+        if not re.match(FeatureBasedDataValidator.JOB_URL_PATTERN, job_url, re.IGNORECASE):
             return False
         
         # Additional checks
@@ -149,7 +161,7 @@ class FeatureBasedDataValidator(DataValidator):
             return False
         
         # Check if "NA" or empty
-        if description.strip().upper() in ['NA', 'N/A', 'NOT AVAILABLE', '']:
+        if description.strip().upper() in FeatureBasedDataValidator.EMPTY_DESCRIPTIONS:
             return False
         
         # Should NOT be a URL (catch misalignment)
@@ -163,6 +175,151 @@ class FeatureBasedDataValidator(DataValidator):
         return True
     
     
+    @staticmethod
+    def _text(series: pd.Series) -> pd.Series:
+        """Stripped string values of a column; NaN where a value is not a string"""
+        try:
+            return series.str.strip()
+        except AttributeError:
+            # Numeric or datetime column: no value is a string
+            return pd.Series(None, index=series.index, dtype=object)
+    
+    
+    def timestamp_mask(self, series: pd.Series) -> pd.Series:
+        """
+        Column-wise is_timestamp
+        
+        Values are parsed with pd.to_datetime, one explicit format at a time,
+        and only values none of them matches are checked by is_timestamp
+        (other ISO 8601 forms, years outside the Timestamp range).
+        
+        Args:
+            series: Column to validate
+            
+        Returns:
+            Boolean Series, True where the value is a valid timestamp
+        """
+        text = self._text(series)
+        values = text.to_numpy(dtype=object)
+        valid = np.zeros(len(values), dtype=bool)
+        pending = np.flatnonzero(text.notna().to_numpy())
+        
+        for fmt in self.TIMESTAMP_FORMATS:
+            if len(pending) == 0:
+                break
+            parsed = pd.to_datetime(values[pending], format=fmt, errors="coerce")
+            matched = np.asarray(parsed.notna())
+            valid[pending[matched]] = True
+            pending = pending[~matched]
+        
+        if len(pending):
+            # Leftovers are mostly malformed and repetitive: check each distinct
+            # value once, and only if it starts with a digit as every accepted form does
+            leftovers = values[pending]
+            accepted = [value for value in pd.unique(leftovers)
+                        if value[:1].isdigit() and self.is_timestamp(value)]
+            if accepted:
+                valid[pending] = pd.Series(leftovers).isin(accepted).to_numpy()
+
+        return pd.Series(valid, index=series.index)
+    
+    
+    def job_url_mask(self, series: pd.Series) -> pd.Series:
+        """
+        Column-wise is_job_url
+        
+        Args:
+            series: Column to validate
+            
+        Returns:
+            Boolean Series, True where the value is a valid job URL
+        """
+        text = self._text(series)
+        present = text.notna()
+        if not present.any():
+            return present
+        
+        return (text.str.match(self.JOB_URL_PATTERN, flags=re.IGNORECASE, na=False)
+                & (text.str.len() >= 30)
+                & ~text.str.contains(' ', regex=False, na=False))
+    
+    
+    def description_mask(self, series: pd.Series) -> pd.Series:
+        """
+        Column-wise is_description
+        
+        Args:
+            series: Column to validate
+            
+        Returns:
+            Boolean Series, True where the value is a valid description
+        """
+        text = self._text(series)
+        present = text.notna()
+        if not present.any():
+            return present
+        
+        # The URL and timestamp checks look at the unstripped value
+        return (present
+                & ~text.str.upper().isin(self.EMPTY_DESCRIPTIONS)
+                & ~series.str.startswith('http', na=False)
+                & ~series.str.match(r'\d{4}-\d{2}-\d{2}', na=False))
+    
+    
+    def _validate_frame(self, df: pd.DataFrame, feature_cols: Dict[str, str]) -> Dict[str, int]:
+        """
+        Validate all rows of df at once and add the is_valid_data and
+        validation_issues columns (in place). Issue texts are the ones
+        validate_row produces.
+        
+        Args:
+            df: DataFrame to validate
+            feature_cols: Dict mapping feature type to column name
+        
+        Returns:
+            Dict mapping issue type to number of rows with that issue
+        """
+        # (issue type, column, validity mask, issue text from the values as str)
+        checks = []
+        
+        timestamp_col = feature_cols.get('timestamp', 'Scraped_At')
+        if timestamp_col in df.columns:
+            checks.append(('Invalid timestamp', timestamp_col, self.timestamp_mask(df[timestamp_col]),
+                           lambda values: 'Invalid timestamp: ' + values))
+        
+        url_col = feature_cols.get('url', 'Job_URL')
+        if url_col in df.columns:
+            checks.append(('Invalid URL', url_col, self.job_url_mask(df[url_col]),
+                           lambda values: 'Invalid URL: ' + values.str[:50] + '...'))
+        
+        desc_col = feature_cols.get('description', 'Description')
+        if desc_col in df.columns:
+            # Issue type is the text before the first ':', as in the row-wise reports
+            checks.append(('Invalid description (length', desc_col, self.description_mask(df[desc_col]),
+                           lambda values: 'Invalid description (length: ' + values.str.len().astype(str) + ')'))
+        
+        invalid = np.zeros(len(df), dtype=bool)
+        issues = np.full(len(df), '', dtype=object)
+        issue_summary = {}
+        
+        for issue_type, column, mask, describe in checks:
+            bad = ~mask.to_numpy(dtype=bool)
+            positions = np.flatnonzero(bad)
+            if len(positions) == 0:
+                continue
+            
+            values = pd.Series(df[column].to_numpy(dtype=object)[positions], dtype=object).map(str)
+            messages = describe(values).to_numpy(dtype=object)
+            previous = issues[positions]
+            issues[positions] = np.where(previous == '', messages, previous + ' | ' + messages)
+            invalid |= bad
+            issue_summary[issue_type] = len(positions)
+        
+        df['is_valid_data'] = ~invalid
+        df['validation_issues'] = issues
+        return issue_summary
+    
+    
     def validate_row(self, row: pd.Series, feature_cols: Dict[str, str]) -> Dict:
         """
         Validate a single row
@@ -237,26 +394,8 @@ class FeatureBasedDataValidator(DataValidator):
         # Create copy to avoid modifying original
         df = data.copy()
         
-        # Initialize validation columns
-        df['is_valid_data'] = True
-        df['validation_issues'] = ''
-        
-        # Validate each row
-        invalid_count = 0
-        issue_summary = {}
-        
-        for idx, row in df.iterrows():
-            validation_result = self.validate_row(row, feature_cols)
-            
-            if not validation_result['is_valid']:
-                invalid_count += 1
-                df.at[idx, 'is_valid_data'] = False
-                df.at[idx, 'validation_issues'] = ' | '.join(validation_result['issues'])
-                
-                # Track issue types
-                for issue in validation_result['issues']:
-                    issue_type = issue.split(':')[0]
-                    issue_summary[issue_type] = issue_summary.get(issue_type, 0) + 1
+        # Validate all rows (adds is_valid_data / validation_issues)
+        issue_summary = self._validate_frame(df, feature_cols)
         
         # Split into valid and invalid
         df_valid = df[df['is_valid_data']].copy()
@@ -275,16 +414,7 @@ class FeatureBasedDataValidator(DataValidator):
         }
         
         # Log summary
-        logger.info("\n" + "="*80)
-        logger.info("VALIDATION SUMMARY")
-        logger.info("="*80)
-        logger.info(f"✅ Valid rows:   {validation_report['valid_rows']:,} ({100-validation_report['invalid_percentage']:.2f}%)")
-        logger.info(f"❌ Invalid rows: {validation_report['invalid_rows']:,} ({validation_report['invalid_percentage']:.2f}%)")
-        
-        if issue_summary:
-            logger.info("\nIssue Breakdown:")
-            for issue_type, count in sorted(issue_summary.items(), key=lambda x: x[1], reverse=True):
-                logger.info(f"  {issue_type}: {count} rows")
+        self._log_report(validation_report)
         
         # Save files
         self._save_results(df_valid, df_invalid, validation_report)
@@ -294,6 +424,139 @@ class FeatureBasedDataValidator(DataValidator):
         return df_valid, df_invalid, validation_report
     
     
+    def validate_csv(self, 
+                     path: str, 
+                     features: List[str] = None, 
+                     chunksize: int = 100_000) -> Dict:
+        """
+        Streaming counterpart of validate_data for files larger than memory
+        
+        The CSV is read in chunks of `chunksize` rows; every chunk is validated
+        and its rows appended to the validated and rejected CSVs right away.
+        Only counters (and the first 100 invalid row indices) are kept across
+        chunks. Outputs are written to .part files and renamed when the whole
+        file has been validated.
+        
+        Args:
+            path: CSV file to validate (e.g. scraped_data.csv)
+            features: List of column names [url_col, timestamp_col, description_col]
+                     Default: ['Job_URL', 'Scraped_At', 'Description']
+            chunksize: Rows per chunk
+        
+        Returns:
+            Validation report (same keys as validate_data's, plus 'chunks')
+        """
+        if features is None:
+            features = ['Job_URL', 'Scraped_At', 'Description']
+        
+        logger.info("="*80)
+        logger.info(f"Starting streaming data validation: {path} (chunks of {chunksize:,} rows)")
+        logger.info("="*80)
+        logger.info(f"Features to validate: {features}")
+        
+        feature_cols = {
+            'url': features[0],
+            'timestamp': features[1],
+            'description': features[2]
+        }
+        
+        valid_file, invalid_file, report_file = self._output_files()
+        valid_part = valid_file.with_name(valid_file.name + '.part')
+        invalid_part = invalid_file.with_name(invalid_file.name + '.part')
+        
+        total_rows = valid_rows = invalid_rows = chunks = 0
+        issue_summary = {}
+        invalid_row_indices = []
+        
+        try:
+            # Chunks keep the file's row numbers as their index
+            for chunk in pd.read_csv(path, chunksize=chunksize):
+                chunk_issues = self._validate_frame(chunk, feature_cols)
+                valid_mask = chunk['is_valid_data'].to_numpy(dtype=bool)
+                df_valid = chunk[valid_mask].drop(columns=['is_valid_data', 'validation_issues'])
+                df_invalid = chunk[~valid_mask]
+                
+                # The valid file is written even if empty, as by validate_data
+                df_valid.to_csv(valid_part, mode='a' if chunks else 'w', header=not chunks, index=False)
+                if len(df_invalid) > 0:
+                    df_invalid.to_csv(invalid_part, mode='a' if invalid_rows else 'w',
+                                      header=not invalid_rows, index=False)
+                
+                chunks += 1
+                total_rows += len(chunk)
+                valid_rows += len(df_valid)
+                invalid_rows += len(df_invalid)
+                for issue_type, count in chunk_issues.items():
+                    issue_summary[issue_type] = issue_summary.get(issue_type, 0) + count
+                if len(invalid_row_indices) < 100:
+                    invalid_row_indices += df_invalid.index[:100 - len(invalid_row_indices)].tolist()
+                
+                logger.info(f"  Chunk {chunks}: {len(chunk):,} rows, {len(df_invalid):,} invalid")
+            
+            if chunks == 0:
+                raise ValueError(f"No rows found in {path}")
+            valid_part.replace(valid_file)
+            if invalid_rows > 0:
+                invalid_part.replace(invalid_file)
+        except BaseException:
+            valid_part.unlink(missing_ok=True)
+            invalid_part.unlink(missing_ok=True)
+            raise
+        
+        validation_report = {
+            'validation_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_rows': total_rows,
+            'valid_rows': valid_rows,
+            'invalid_rows': invalid_rows,
+            'invalid_percentage': (invalid_rows / total_rows * 100) if total_rows > 0 else 0,
+            'features_validated': features,
+            'issue_summary': issue_summary,
+            'invalid_row_indices': invalid_row_indices,  # First 100 for brevity
+            'chunks': chunks
+        }
+        
+        self._log_report(validation_report)
+        logger.info(f"\n✅ Valid data saved: {valid_file}")
+        if invalid_rows > 0:
+            logger.info(f"❌ Invalid data saved: {invalid_file}")
+        self._save_report(validation_report, report_file)
+        
+        logger.info("="*80)
+        
+        return validation_report
+    
+    
+    @staticmethod
+    def _log_report(report: Dict):
+        """Log the summary of a validation report"""
+        logger.info("\n" + "="*80)
+        logger.info("VALIDATION SUMMARY")
+        logger.info("="*80)
+        logger.info(f"✅ Valid rows:   {report['valid_rows']:,} ({100-report['invalid_percentage']:.2f}%)")
+        logger.info(f"❌ Invalid rows: {report['invalid_rows']:,} ({report['invalid_percentage']:.2f}%)")
+        
+        if report['issue_summary']:
+            logger.info("\nIssue Breakdown:")
+            for issue_type, count in sorted(report['issue_summary'].items(), key=lambda x: x[1], reverse=True):
+                logger.info(f"  {issue_type}: {count} rows")
+    
+    
+    def _output_files(self) -> Tuple[Path, Path, Path]:
+        """Paths of the (validated, rejected, report) files of a validation run"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return (self.validated_path / f"jobs_validated_{timestamp}.csv",
+                self.rejected_path / f"validation_rejected_{timestamp}.csv",
+                self.rejected_path / f"validation_report_{timestamp}.json")
+    
+    
+    @staticmethod
+    def _save_report(report: Dict, report_file: Path):
+        """Save validation report as JSON"""
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"📊 Validation report saved: {report_file}")
+    
+    
     def _save_results(self, 
                      df_valid: pd.DataFrame, 
                      df_invalid: pd.DataFrame, 
@@ -306,25 +569,20 @@ class FeatureBasedDataValidator(DataValidator):
             df_invalid: Invalid rows
             report: Validation report dictionary
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        valid_file, invalid_file, report_file = self._output_files()
         
         # Save valid data (remove validation columns)
-        valid_file = self.validated_path / f"jobs_validated_{timestamp}.csv"
         df_valid_clean = df_valid.drop(columns=['is_valid_data', 'validation_issues'], errors='ignore')
         df_valid_clean.to_csv(valid_file, index=False)
         logger.info(f"\n✅ Valid data saved: {valid_file}")
         
         # Save invalid data (keep validation columns for debugging)
         if len(df_invalid) > 0:
-            invalid_file = self.rejected_path / f"validation_rejected_{timestamp}.csv"
             df_invalid.to_csv(invalid_file, index=False)
             logger.info(f"❌ Invalid data saved: {invalid_file}")
         
         # Save validation report
-        report_file = self.rejected_path / f"validation_report_{timestamp}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
-        logger.info(f"📊 Validation report saved: {report_file}")
+        self._save_report(report, report_file)
 
 
 # Usage example
@@ -351,4 +609,10 @@ if __name__ == "__main__":
     # Show sample invalid rows
     if len(df_invalid) > 0:
         print("\nSample invalid rows:")
-        print(df_invalid[['Job_URL', 'Scraped_At', 'Description', 'validation_issues']].head())
\ No newline at end of file
+        print(df_invalid[['Job_URL', 'Scraped_At', 'Description', 'validation_issues']].head())    
+    # Files larger than memory: validate in chunks, straight from disk
+    # report = validator.validate_csv(
+    #     r"D:\DATA SCIENCE AND ML\Project\job_trend_predictor\etl_pipeline\data\raw\scraped_data.csv",
+    #     features=['Job_URL', 'Scraped_At', 'Description'],
+    #     chunksize=100_000
+    # )
@@ -0,0 +1,76 @@
+"""Tests of FeatureBasedDataValidator: the vectorized and streaming paths agree with the row-wise checks."""
+
+import pandas as pd
+import pytest
+
+from src.models.validators.data_validator import FeatureBasedDataValidator
+
+
+FEATURES = ['Job_URL', 'Scraped_At', 'Description']
+GOOD_DESCRIPTION = "Build and deploy forecasting models with Python, SQL and Spark for the supply chain team."
+
+
+@pytest.fixture
+def jobs_csv(tmp_path):
+    rows = [
+        ("https://www.naukri.com/job-listings-1", "2025-09-15T10:00:00.123456", GOOD_DESCRIPTION),
+        ("https://www.naukri.com/job-listings-2", "2025-09-15 10:00:00", GOOD_DESCRIPTION),
+        ("https://example.com/job-3", "2025-09-15T10:00:00", GOOD_DESCRIPTION),
+        ("https://www.naukri.com/job-listings-4", "yesterday", GOOD_DESCRIPTION),
+        ("https://www.naukri.com/job-listings-5", "2025-09-15T10:00:00", "NA"),
+        ("not a url", "15-09-2025 10:00:00", "short"),
+        ("https://www.naukri.com/job-listings-7", "2025-09-15T10:00:00", None),
+        ("https://www.naukri.com/job-listings-8", "2025-09-15T10:00:00", GOOD_DESCRIPTION),
+    ]
+    path = tmp_path / "scraped_data.csv"
+    pd.DataFrame(rows, columns=FEATURES).assign(Title="Data Scientist").to_csv(path, index=False)
+    return path
+
+
+def validator(tmp_path, name):
+    return FeatureBasedDataValidator(validated_path=str(tmp_path / name / "validated"),
+                                     rejected_path=str(tmp_path / name / "rejected"))
+
+
+def test_validate_data_matches_validate_row(tmp_path, jobs_csv):
+    """The vectorized checks flag the same rows, with the same issue texts, as validate_row"""
+    data = pd.read_csv(jobs_csv)
+    frame_validator = validator(tmp_path, "frame")
+    _, df_invalid, report = frame_validator.validate_data(data, FEATURES)
+
+    feature_cols = {'url': FEATURES[0], 'timestamp': FEATURES[1], 'description': FEATURES[2]}
+    row_results = [frame_validator.validate_row(row, feature_cols) for _, row in data.iterrows()]
+    expected_invalid = [index for index, result in enumerate(row_results) if not result['is_valid']]
+
+    expected_summary = {}
+    for result in row_results:
+        for issue in result['issues']:
+            issue_type = issue.split(':')[0]
+            expected_summary[issue_type] = expected_summary.get(issue_type, 0) + 1
+
+    assert df_invalid.index.tolist() == expected_invalid
+    assert len(expected_invalid) == 5
+    assert df_invalid['validation_issues'].tolist() == [
+        ' | '.join(row_results[index]['issues']) for index in expected_invalid]
+    assert report['issue_summary'] == expected_summary
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_validate_csv_matches_validate_data(tmp_path, jobs_csv, chunksize):
+    df_valid, df_invalid, report = validator(tmp_path, "frame").validate_data(pd.read_csv(jobs_csv), FEATURES)
+
+    streaming = validator(tmp_path, "stream")
+    stream_report = streaming.validate_csv(str(jobs_csv), FEATURES, chunksize=chunksize)
+
+    for key in ('total_rows', 'valid_rows', 'invalid_rows', 'invalid_percentage', 'issue_summary',
+                'invalid_row_indices'):
+        assert stream_report[key] == report[key]
+
+    (valid_file,) = streaming.validated_path.glob("jobs_validated_*.csv")
+    (invalid_file,) = streaming.rejected_path.glob("validation_rejected_*.csv")
+    pd.testing.assert_frame_equal(
+        pd.read_csv(valid_file),
+        df_valid.drop(columns=['is_valid_data', 'validation_issues']).reset_index(drop=True))
+    pd.testing.assert_frame_equal(pd.read_csv(invalid_file), df_invalid.reset_index(drop=True))
+    assert not list(streaming.validated_path.glob("*.part"))
+